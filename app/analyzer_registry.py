@@ -0,0 +1,161 @@
+# app/analyzer_registry.py
+
+import os
+import threading
+from typing import Callable, Dict, Optional
+
+from domain.services.analyzer_protocol import SentimentAnalyzer
+
+
+# Choix du backend d'analyse (voir ANALYZER_BACKENDS)
+BACKEND_ENV = "MARKET_SENTIMENT_BACKEND"
+DEFAULT_BACKEND = "finbert"
+
+# URL du serveur d'inférence local (app/inference_server.py), backend "remote".
+# Défini seul, il sélectionne aussi ce backend.
+SERVER_URL_ENV = "MARKET_SENTIMENT_SERVER_URL"
+
+# Si défini (ex : 0.8), un lexique rapide tranche d'abord et FinBERT ne voit
+# que les textes dont la confiance est sous ce seuil
+CASCADE_THRESHOLD_ENV = "MARKET_SENTIMENT_CASCADE_THRESHOLD"
+
+
+# Fabriques des backends : les imports sont locaux pour que le backend
+# "deterministic" ne charge ni torch ni transformers. use_cache=False sert
+# aux workers du pool, dont le cache est tenu par le processus parent.
+def _inference_cache(use_cache: bool):
+    if not use_cache:
+        return None
+    from infrastructure.database.inference_cache import InferenceCache
+    return InferenceCache()
+
+
+def _create_finbert(use_cache: bool = True) -> SentimentAnalyzer:
+    from domain.services.sentiment_analyzer import FinBERTSentimentAnalyzer
+    return FinBERTSentimentAnalyzer(cache=_inference_cache(use_cache))
+
+
+def _create_finbert_onnx(use_cache: bool = True) -> SentimentAnalyzer:
+    from domain.services.sentiment_analyzer import FinBERTSentimentAnalyzer
+    return FinBERTSentimentAnalyzer(cache=_inference_cache(use_cache), backend="onnx")
+
+
+def _create_finbert_headline(use_cache: bool = True) -> SentimentAnalyzer:
+    from domain.services.sentiment_analyzer import FinBERTSentimentAnalyzer
+    # Rafraîchissement intraday : 128 premiers tokens (titre d'abord)
+    return FinBERTSentimentAnalyzer(cache=_inference_cache(use_cache), max_length=128)
+
+
+def _create_remote(use_cache: bool = True) -> SentimentAnalyzer:
+    from app.inference_client import RemoteSentimentAnalyzer
+    server_url = os.environ.get(SERVER_URL_ENV, "http://127.0.0.1:8765")
+    print(f"[FinBERT] Analyse déléguée au serveur {server_url}")
+    return RemoteSentimentAnalyzer(server_url)
+
+
+def _create_deterministic(use_cache: bool = True) -> SentimentAnalyzer:
+    from domain.services.deterministic_analyzer import DeterministicSentimentAnalyzer
+    return DeterministicSentimentAnalyzer()
+
+
+ANALYZER_BACKENDS: Dict[str, Callable[[bool], SentimentAnalyzer]] = {
+    "finbert": _create_finbert,
+    "onnx": _create_finbert_onnx,
+    "headline": _create_finbert_headline,
+    "remote": _create_remote,
+    "deterministic": _create_deterministic,
+}
+
+
+def register_backend(name: str, factory: Callable[[bool], SentimentAnalyzer]):
+    """Ajoute (ou remplace) un backend d'analyse (fabrique : factory(use_cache))."""
+    ANALYZER_BACKENDS[name] = factory
+
+
+def selected_backend() -> str:
+    """Backend choisi par l'environnement (MARKET_SENTIMENT_BACKEND)."""
+    backend = os.environ.get(BACKEND_ENV)
+    if backend:
+        return backend
+    if os.environ.get(SERVER_URL_ENV):
+        return "remote"
+    return DEFAULT_BACKEND
+
+
+def create_analyzer(backend: Optional[str] = None, use_cache: bool = True) -> SentimentAnalyzer:
+    """
+    Crée un nouvel analyseur.
+    
+    Args:
+        backend: Nom du backend (défaut : selected_backend())
+        use_cache: Branche le cache d'inférence SQLite (backends FinBERT)
+    
+    Raises:
+        ValueError: Backend inconnu
+    """
+    backend = backend or selected_backend()
+    if backend not in ANALYZER_BACKENDS:
+        raise ValueError(
+            f"Backend d'analyse inconnu : {backend} "
+            f"(disponibles : {', '.join(sorted(ANALYZER_BACKENDS))})"
+        )
+    
+    analyzer = ANALYZER_BACKENDS[backend](use_cache)
+    
+    threshold = os.environ.get(CASCADE_THRESHOLD_ENV)
+    if threshold:
+        from domain.services.sentiment_analyzer import CascadeSentimentAnalyzer
+        print(f"[FinBERT] Mode cascade (seuil de confiance lexique : {threshold})")
+        analyzer = CascadeSentimentAnalyzer(analyzer, threshold=float(threshold))
+    
+    return analyzer
+
+
+# Analyseur partagé par tout le processus (runner, orchestrateur, GUI)
+_shared_analyzer: Optional[SentimentAnalyzer] = None
+_lock = threading.Lock()
+
+
+def get_shared_analyzer() -> SentimentAnalyzer:
+    """
+    Retourne l'analyseur partagé, créé au premier appel.
+    
+    Le modèle n'est chargé qu'une fois par processus. Si un préchargement
+    est en cours, l'appel attend sa fin au lieu de charger une seconde copie.
+    Le backend est choisi par MARKET_SENTIMENT_BACKEND (défaut : finbert).
+    """
+    global _shared_analyzer
+    
+    with _lock:
+        if _shared_analyzer is None:
+            _shared_analyzer = create_analyzer()
+        return _shared_analyzer
+
+
+def warmup_in_background() -> threading.Thread:
+    """
+    Précharge l'analyseur partagé dans un thread d'arrière-plan.
+    
+    Appelé au démarrage de l'application : le premier 'Rafraîchir' trouve
+    le modèle déjà en mémoire.
+    """
+    def _warmup():
+        try:
+            analyzer = get_shared_analyzer()
+            if hasattr(analyzer, "warmup"):
+                analyzer.warmup()
+            print("[FinBERT] Préchargement terminé")
+        except Exception as e:
+            print(f"[FinBERT] Échec du préchargement : {e}")
+    
+    thread = threading.Thread(target=_warmup, name="finbert-warmup", daemon=True)
+    thread.start()
+    return thread
+
+
+def reset_shared_analyzer():
+    """Oublie l'analyseur partagé (le prochain appel le recrée)."""
+    global _shared_analyzer
+    
+    with _lock:
+        _shared_analyzer = None
@@ -0,0 +1,125 @@
+# app/cycle_scheduler.py
+
+import random
+import threading
+import time
+from typing import Callable, Optional
+
+
+class CycleScheduler:
+    """
+    Planificateur de cycles périodiques (pipeline continu).
+    
+    - Les cycles s'exécutent l'un après l'autre dans le thread appelant :
+      jamais deux cycles en même temps.
+    - Départs sur une grille fixe (toutes les `interval` secondes) + un
+      décalage aléatoire (`jitter`) ; un cycle qui déborde sur les créneaux
+      suivants les fait sauter, sans rattrapage en rafale.
+    - Après un échec : nouvel essai avec attente exponentielle
+      (backoff_base, ×2 par échec consécutif, plafonnée à max_backoff).
+    - Budget de durée : si le cycle précédent a dépassé `cycle_budget`, le
+      suivant reçoit ce budget pour s'écourter (voir `cycle`).
+    - stop() (ex : sur SIGTERM) interrompt l'attente ; le cycle en cours se termine.
+    """
+    
+    def __init__(
+        self,
+        cycle: Callable[[int, Optional[float]], object],
+        interval: float,
+        jitter: float = 0.0,
+        cycle_budget: Optional[float] = None,
+        backoff_base: float = 30.0,
+        max_backoff: float = 1800.0,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ):
+        """
+        Args:
+            cycle: Fonction cycle(numéro, budget) ; budget = durée maximale (s)
+                accordée au cycle, ou None s'il n'a pas à s'écourter
+            interval: Période entre deux départs de cycle (s)
+            jitter: Décalage aléatoire maximal ajouté à chaque départ (s)
+            cycle_budget: Durée de cycle au-delà de laquelle le suivant est écourté
+            backoff_base: Attente après un premier échec (s)
+            max_backoff: Attente maximale après des échecs répétés (s)
+            clock: Horloge monotone (remplaçable dans les tests)
+            rng: Générateur aléatoire du jitter
+        """
+        if interval <= 0:
+            raise ValueError(f"interval doit être > 0 (reçu : {interval})")
+        if jitter < 0:
+            raise ValueError(f"jitter doit être >= 0 (reçu : {jitter})")
+        self.cycle = cycle
+        self.interval = interval
+        self.jitter = jitter
+        self.cycle_budget = cycle_budget
+        self.backoff_base = backoff_base
+        self.max_backoff = max_backoff
+        self.clock = clock
+        self.rng = rng or random.Random()
+        
+        self.cycle_count = 0
+        self.consecutive_failures = 0
+        self.skipped_slots = 0
+        self._stop_event = threading.Event()
+    
+    def stop(self):
+        """Demande l'arrêt (sûr depuis un gestionnaire de signal ou un autre thread)."""
+        self._stop_event.set()
+    
+    @property
+    def stopped(self) -> bool:
+        return self._stop_event.is_set()
+    
+    def backoff_delay(self) -> float:
+        """Attente avant le prochain essai après `consecutive_failures` échecs."""
+        return min(self.backoff_base * 2 ** (self.consecutive_failures - 1), self.max_backoff)
+    
+    def run(self, max_cycles: Optional[int] = None):
+        """
+        Enchaîne les cycles jusqu'à stop() (ou `max_cycles` cycles).
+        """
+        # Créneau de la grille (sans jitter) : le jitter décale chaque départ
+        # sans jamais déplacer la grille
+        slot = self.clock()
+        next_start = slot
+        last_duration = 0.0
+        
+        while not self.stopped and (max_cycles is None or self.cycle_count < max_cycles):
+            wait = next_start - self.clock()
+            if wait > 0 and self._stop_event.wait(wait):
+                break
+            
+            self.cycle_count += 1
+            overran = self.cycle_budget is not None and last_duration > self.cycle_budget
+            if overran:
+                print(
+                    f"[SCHEDULER] Cycle précédent trop long ({last_duration:.0f}s > "
+                    f"{self.cycle_budget:.0f}s) : cycle {self.cycle_count} écourté"
+                )
+            
+            started = self.clock()
+            try:
+                self.cycle(self.cycle_count, self.cycle_budget if overran else None)
+                self.consecutive_failures = 0
+            except Exception as e:
+                self.consecutive_failures += 1
+                print(f"[SCHEDULER] Échec du cycle {self.cycle_count} "
+                      f"({self.consecutive_failures} d'affilée) : {e}")
+            now = self.clock()
+            last_duration = now - started
+            
+            if self.consecutive_failures:
+                next_start = now + self.backoff_delay() + self.rng.uniform(0, self.jitter)
+                print(f"[SCHEDULER] Nouvel essai dans {next_start - now:.0f}s")
+            else:
+                # Grille fixe : les créneaux déjà dépassés sont sautés
+                slot += self.interval
+                if slot <= now:
+                    missed = int((now - slot) // self.interval) + 1
+                    slot += missed * self.interval
+                    self.skipped_slots += missed
+                    print(f"[SCHEDULER] {missed} créneau(x) sauté(s) (cycle de {last_duration:.0f}s)")
+                next_start = slot + self.rng.uniform(0, self.jitter)
+        
+        print(f"[SCHEDULER] Arrêt après {self.cycle_count} cycle(s)")
@@ -0,0 +1,45 @@
+# app/inference_client.py
+
+import json
+import urllib.request
+from typing import List
+
+from domain.entities.sentiment import SentimentResult
+from domain.services.analyzer_protocol import TextBatchAnalyzer
+
+
+class RemoteSentimentAnalyzer(TextBatchAnalyzer):
+    """
+    Client du serveur d'inférence local (app/inference_server.py).
+    
+    Même interface que FinBERTSentimentAnalyzer (analyze_text, analyze_texts,
+    analyze_article, analyze_batch) sans charger le modèle dans ce processus.
+    """
+    
+    def __init__(self, base_url: str = "http://127.0.0.1:8765", timeout: float = 300.0):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+    
+    def is_available(self) -> bool:
+        """Vérifie que le serveur répond."""
+        try:
+            with urllib.request.urlopen(f"{self.base_url}/health", timeout=2) as response:
+                return response.status == 200
+        except OSError:
+            return False
+    
+    def analyze_texts(self, texts: List[str], verbose: bool = False) -> List[SentimentResult]:
+        """Envoie les textes au serveur et retourne un SentimentResult par texte."""
+        if not texts:
+            return []
+        
+        request = urllib.request.Request(
+            f"{self.base_url}/analyze",
+            data=json.dumps({"texts": texts}).encode("utf-8"),
+            headers={"Content-Type": "application/json"},
+            method="POST"
+        )
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            payload = json.loads(response.read())
+        
+        return [SentimentResult(**result) for result in payload["results"]]
@@ -0,0 +1,200 @@
+# app/inference_pool.py
+
+import os
+import multiprocessing
+from collections import deque
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from domain.entities.article import Article
+from domain.entities.sentiment import SentimentResult
+from domain.services.inference_config import ENV_PREFIX
+
+
+# Analyseur propre à chaque processus worker (chargé une seule fois par worker)
+_worker_analyzer = None
+
+
+def _init_worker(analyzer_factory: Optional[Callable], analyzer_kwargs: Dict, threads: int):
+    """Initialise un worker : threads torch puis chargement unique du modèle."""
+    global _worker_analyzer
+    
+    try:
+        import torch
+        torch.set_num_threads(threads)
+        torch.set_num_interop_threads(1)
+    except (ImportError, RuntimeError):
+        pass  # Backend sans torch, ou threads inter-op déjà fixés
+    # Répartition propre au worker, prioritaire sur la configuration héritée
+    os.environ[ENV_PREFIX + "INTRA_OP_THREADS"] = str(threads)
+    os.environ[ENV_PREFIX + "INTER_OP_THREADS"] = "1"
+    
+    if analyzer_factory is None:
+        # Même backend que le processus parent (variables d'environnement héritées),
+        # sans cache SQLite : seul le parent le consulte et l'alimente
+        from app.analyzer_registry import create_analyzer
+        _worker_analyzer = create_analyzer(use_cache=False, **analyzer_kwargs)
+    else:
+        _worker_analyzer = analyzer_factory(**analyzer_kwargs)
+
+
+def _worker_model_id() -> Optional[str]:
+    """Identifiant de cache du modèle des workers (None : résultats à ne pas mettre en cache)."""
+    if getattr(_worker_analyzer, "return_embeddings", False):
+        return None  # Le cache ne conserve pas les embeddings
+    return getattr(_worker_analyzer, "model_id", None)
+
+
+def _analyze_shard(shard: List[Article]) -> List[SentimentResult]:
+    """Analyse un paquet d'articles dans le worker courant (un résultat par article)."""
+    return [
+        SentimentResult(
+            label=article.sentiment_label,
+            score=article.sentiment_score,
+            probabilities=dict(article.sentiment_probas),
+            tier=article.sentiment_tier,
+            embedding=article.embedding,
+        )
+        for article in _worker_analyzer.analyze_batch(shard)
+    ]
+
+
+class InferenceWorkerPool:
+    """
+    Pool de processus d'inférence pour les gros volumes d'articles.
+    
+    Chaque worker charge le modèle une seule fois et utilise une part des
+    cœurs (`threads_per_worker` threads torch). Les articles sont découpés
+    en paquets, analysés en parallèle, annotés et renvoyés dans l'ordre
+    d'entrée.
+    
+    Le cache d'inférence éventuel n'est consulté et alimenté que par le
+    processus parent : les workers ne reçoivent que les textes absents du
+    cache et n'ouvrent pas la base SQLite.
+    """
+    
+    def __init__(
+        self,
+        n_workers: int,
+        threads_per_worker: Optional[int] = None,
+        shard_size: int = 64,
+        analyzer_factory: Optional[Callable] = None,
+        analyzer_kwargs: Optional[Dict] = None,
+        cache=None,
+    ):
+        """
+        Args:
+            n_workers: Nombre de processus
+            threads_per_worker: Threads torch par worker (défaut : cœurs / workers)
+            shard_size: Nombre d'articles envoyés à un worker à la fois
+            analyzer_factory: Classe (ou fonction) créant l'analyseur dans chaque
+                worker (défaut : create_analyzer du registre, backend de l'environnement)
+            analyzer_kwargs: Arguments passés à la fabrique
+            cache: Cache d'inférence du parent (ex : InferenceCache) ; ignoré si
+                l'analyseur des workers n'expose pas de model_id
+        """
+        if n_workers < 1:
+            raise ValueError(f"n_workers doit être >= 1 (reçu : {n_workers})")
+        
+        self.n_workers = n_workers
+        self.threads_per_worker = threads_per_worker or max(1, (os.cpu_count() or 1) // n_workers)
+        self.shard_size = shard_size
+        
+        print(f"[POOL] Démarrage de {n_workers} workers "
+              f"({self.threads_per_worker} threads chacun)...")
+        # "spawn" : chaque worker repart d'un interpréteur propre (pas de fork de torch)
+        context = multiprocessing.get_context("spawn")
+        self._pool = context.Pool(
+            n_workers,
+            initializer=_init_worker,
+            initargs=(analyzer_factory, analyzer_kwargs or {}, self.threads_per_worker)
+        )
+        
+        self.cache = None
+        self.model_id = None
+        if cache is not None:
+            self.model_id = self._pool.apply(_worker_model_id)
+            self.cache = cache if self.model_id else None
+    
+    def analyze_stream(self, articles: Iterable[Article]) -> Iterator[Article]:
+        """
+        Analyse des articles en parallèle et les renvoie au fil de l'eau.
+        
+        Les paquets sont produits paresseusement ; les articles reçus sont
+        annotés (mutation) et restitués dans l'ordre d'entrée dès que le
+        paquet correspondant est prêt.
+        """
+        # Paquets envoyés, dans l'ordre : imap rend les résultats dans le même ordre
+        pending = deque()
+        
+        def tasks():
+            for shard in self._shards(articles):
+                keys, cached = self._lookup(shard)
+                pending.append((shard, keys, cached))
+                yield [article for i, article in enumerate(shard) if i not in cached]
+        
+        for computed in self._pool.imap(_analyze_shard, tasks()):
+            shard, keys, cached = pending.popleft()
+            computed = iter(computed)
+            new_entries = {}
+            for i, article in enumerate(shard):
+                sentiment = cached.get(i)
+                if sentiment is None:
+                    sentiment = next(computed)
+                    if keys[i] is not None:
+                        new_entries[keys[i]] = sentiment.to_dict()
+                article.apply_sentiment(sentiment)
+            if new_entries:
+                self.cache.put_many(new_entries)
+            yield from shard
+    
+    def analyze_batch(self, articles: List[Article]) -> List[Article]:
+        """Analyse une liste d'articles (mutation, ordre conservé)."""
+        return list(self.analyze_stream(articles))
+    
+    def _lookup(self, shard: List[Article]):
+        """
+        Consulte le cache pour un paquet.
+        
+        Returns:
+            (clés, {index: SentimentResult}) ; clé None pour un article hors cache
+        """
+        if self.cache is None:
+            return [None] * len(shard), {}
+        
+        keys = []
+        for article in shard:
+            text = article.get_text_for_analysis()
+            keys.append(self.cache.make_key(text, self.model_id) if text else None)
+        found = self.cache.get_many(key for key in keys if key is not None)
+        cached = {
+            i: SentimentResult(
+                label=found[key]["label"],
+                score=found[key]["score"],
+                probabilities=found[key]["probabilities"],
+            )
+            for i, key in enumerate(keys)
+            if key in found
+        }
+        return keys, cached
+    
+    def _shards(self, articles: Iterable[Article]) -> Iterator[List[Article]]:
+        iterator = iter(articles)
+        while True:
+            shard = list(islice(iterator, self.shard_size))
+            if not shard:
+                return
+            yield shard
+    
+    def close(self):
+        """Arrête les workers."""
+        self._pool.close()
+        self._pool.join()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self._pool.terminate()
+        self.close()
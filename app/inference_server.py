@@ -0,0 +1,225 @@
+# app/inference_server.py
+
+import argparse
+import json
+import threading
+import time
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List
+
+from domain.entities.sentiment import SentimentResult
+
+
+class _PendingRequest:
+    """Requête en attente dans le micro-batcher (textes + résultat à remplir)."""
+    
+    def __init__(self, texts: List[str]):
+        self.texts = texts
+        self.results = None
+        self.error = None
+        self.done = threading.Event()
+
+
+class MicroBatcher:
+    """
+    Regroupe les requêtes concurrentes en micro-lots.
+    
+    Le premier texte en attente ouvre une fenêtre de `max_wait` secondes :
+    toutes les requêtes arrivées entre-temps (jusqu'à `max_batch_size`
+    textes) partent ensemble dans un seul appel à analyze_texts.
+    """
+    
+    def __init__(self, analyzer, max_batch_size: int = 64, max_wait: float = 0.02):
+        self.analyzer = analyzer
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        
+        self._queue = deque()
+        self._condition = threading.Condition()
+        self._running = True
+        self._thread = threading.Thread(target=self._loop, name="micro-batcher", daemon=True)
+        self._thread.start()
+    
+    def submit(self, texts: List[str]) -> List[SentimentResult]:
+        """Analyse des textes (bloquant jusqu'au traitement du micro-lot)."""
+        if not texts:
+            return []
+        
+        request = _PendingRequest(texts)
+        with self._condition:
+            self._queue.append(request)
+            self._condition.notify()
+        
+        request.done.wait()
+        if request.error is not None:
+            raise request.error
+        return request.results
+    
+    def _collect(self) -> List[_PendingRequest]:
+        """Attend une requête puis complète le lot jusqu'à l'échéance ou la taille max."""
+        with self._condition:
+            while self._running and not self._queue:
+                self._condition.wait()
+            if not self._running:
+                return []
+            
+            batch = [self._queue.popleft()]
+            size = len(batch[0].texts)
+            deadline = time.monotonic() + self.max_wait
+            
+            while size < self.max_batch_size:
+                if not self._queue:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                    continue
+                if size + len(self._queue[0].texts) > self.max_batch_size:
+                    break
+                request = self._queue.popleft()
+                batch.append(request)
+                size += len(request.texts)
+            
+            return batch
+    
+    def _loop(self):
+        while self._running:
+            batch = self._collect()
+            if not batch:
+                continue
+            
+            texts = [text for request in batch for text in request.texts]
+            try:
+                results = self.analyzer.analyze_texts(texts)
+            except Exception as e:
+                for request in batch:
+                    request.error = e
+                    request.done.set()
+                continue
+            
+            # Redistribution des résultats à chaque requête
+            offset = 0
+            for request in batch:
+                request.results = results[offset:offset + len(request.texts)]
+                offset += len(request.texts)
+                request.done.set()
+    
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+        self._thread.join(timeout=5)
+
+
+class _InferenceRequestHandler(BaseHTTPRequestHandler):
+    """
+    API HTTP locale :
+    - GET  /health  → {"status": "ok"}
+    - POST /analyze {"texts": [...]} → {"results": [{label, score, probabilities}, ...]}
+    """
+    
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        else:
+            self._send_json(404, {"error": "route inconnue"})
+    
+    def do_POST(self):
+        if self.path != "/analyze":
+            self._send_json(404, {"error": "route inconnue"})
+            return
+        
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            texts = payload["texts"]
+            if not isinstance(texts, list) or not all(isinstance(t, str) for t in texts):
+                raise ValueError("'texts' doit être une liste de chaînes")
+        except (KeyError, ValueError) as e:
+            self._send_json(400, {"error": f"requête invalide : {e}"})
+            return
+        
+        try:
+            results = self.server.batcher.submit(texts)
+        except Exception as e:
+            self._send_json(500, {"error": str(e)})
+            return
+        
+        self._send_json(200, {"results": [result.to_dict() for result in results]})
+    
+    def _send_json(self, status: int, body: dict):
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+    
+    def log_message(self, format, *args):
+        pass  # Pas de log par requête
+
+
+class SentimentInferenceServer:
+    """
+    Serveur d'inférence local : un seul modèle chaud pour tous les processus.
+    
+    ContinuousPipelineRunner, MarketSentimentOrchestrator et les scripts s'y
+    connectent via RemoteSentimentAnalyzer (app/inference_client.py).
+    """
+    
+    def __init__(self, analyzer, host: str = "127.0.0.1", port: int = 8765,
+                 max_batch_size: int = 64, max_wait: float = 0.02):
+        self.batcher = MicroBatcher(analyzer, max_batch_size, max_wait)
+        self.httpd = ThreadingHTTPServer((host, port), _InferenceRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.batcher = self.batcher
+    
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def serve_forever(self):
+        print(f"[SERVEUR] Inférence disponible sur {self.url}")
+        self.httpd.serve_forever()
+    
+    def start_in_background(self) -> threading.Thread:
+        thread = threading.Thread(target=self.httpd.serve_forever, name="inference-server", daemon=True)
+        thread.start()
+        return thread
+    
+    def shutdown(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.batcher.stop()
+
+
+def main():
+    """Point d'entrée : python -m app.inference_server"""
+    parser = argparse.ArgumentParser(description="Serveur local d'inférence FinBERT")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-batch-size", type=int, default=64)
+    parser.add_argument("--max-wait-ms", type=float, default=20.0)
+    args = parser.parse_args()
+    
+    from domain.services.sentiment_analyzer import FinBERTSentimentAnalyzer
+    from infrastructure.database.inference_cache import InferenceCache
+    
+    analyzer = FinBERTSentimentAnalyzer(cache=InferenceCache())
+    analyzer.warmup()
+    
+    server = SentimentInferenceServer(
+        analyzer, args.host, args.port, args.max_batch_size, args.max_wait_ms / 1000
+    )
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n[SERVEUR] Arrêt demandé")
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,13 @@
 # app/orchestrator.py
 
 import json
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict
 from pathlib import Path
 
 from domain.entities.article import Article
-from domain.services.sentiment_analyzer import FinBERTSentimentAnalyzer
 from domain.services.aggregator import SentimentAggregator
+from app.inference_pool import InferenceWorkerPool
+from app.analyzer_registry import get_shared_analyzer
 
 
 class MarketSentimentOrchestrator:
@@ -19,9 +20,30 @@ class MarketSentimentOrchestrator:
     Cette classe coordonne les différents services sans contenir de logique métier.
     """
     
-    def __init__(self):
-        """Initialise les services métier."""
-        self.sentiment_analyzer = FinBERTSentimentAnalyzer()
+    def __init__(
+        self,
+        n_workers: int = 1,
+        threads_per_worker: int = None,
+        sentiment_analyzer=None,
+        analyzer_factory=None,
+    ):
+        """
+        Initialise les services métier.
+        
+        Args:
+            n_workers: Nombre de processus d'inférence (1 = analyse dans ce processus)
+            threads_per_worker: Threads torch par worker (défaut : cœurs / workers)
+            sentiment_analyzer: Analyseur à utiliser (défaut : analyseur partagé du processus)
+            analyzer_factory: Fabrique de l'analyseur de chaque worker en mode
+                multi-processus (défaut : registre, backend de l'environnement)
+        """
+        self.n_workers = n_workers
+        self.threads_per_worker = threads_per_worker
+        self.analyzer_factory = analyzer_factory
+        # En mode multi-processus, le modèle est chargé par les workers uniquement
+        self.sentiment_analyzer = None
+        if n_workers <= 1:
+            self.sentiment_analyzer = sentiment_analyzer or get_shared_analyzer()
         self.aggregator = SentimentAggregator()
     
     def run_analysis_pipeline(
@@ -54,7 +76,7 @@ class MarketSentimentOrchestrator:
         
         # ÉTAPE 2 : Analyse de sentiment
         print("[2/4] Analyse de sentiment (FinBERT)...")
-        analyzed_articles = self.sentiment_analyzer.analyze_batch(articles)
+        analyzed_articles = self._analyze(articles)
         print()
         
         # ÉTAPE 3 : Agrégation par entreprise
@@ -67,11 +89,104 @@ class MarketSentimentOrchestrator:
             print("[4/4] Sauvegarde des résultats...")
             self._save_results(analyzed_articles, output_json_path)
             print(f" Résultats sauvegardés : {output_json_path}\n")
-
+        
         print("Pipeline terminé avec succès")
         
         return company_scores
     
+    def run_streaming_pipeline(
+        self,
+        input_path: str,
+        output_json_path: str = None
+    ) -> Dict[str, float]:
+        """
+        Variante en flux du pipeline, à mémoire constante.
+        
+        Les articles sont lus paresseusement (fichier .jsonl : un article par
+        ligne), analysés par paquets, écrits dans la sortie dès qu'ils sont
+        prêts et agrégés à la volée : aucun stade ne garde la liste complète.
+        
+        Args:
+            input_path: Fichier .jsonl (lecture ligne à ligne) ou .json (liste)
+            output_json_path: Chemin de sortie (optionnel)
+        
+        Returns:
+            Dictionnaire {company: score_moyen}
+        """
+        print("Démarrage du pipeline d'analyse de sentiment (flux)")
+        
+        articles = self._iter_articles(input_path)
+        analyzed = self._analyze_stream(articles)
+        
+        if output_json_path:
+            analyzed = self._write_results_stream(analyzed, output_json_path)
+        
+        company_scores = self.aggregator.aggregate_stream(analyzed)
+        print(f" {len(company_scores)} entreprises analysées")
+        if output_json_path:
+            print(f" Résultats sauvegardés : {output_json_path}")
+        
+        print("Pipeline terminé avec succès")
+        return company_scores
+    
+    def _analyze_stream(self, articles: Iterable[Article]) -> Iterator[Article]:
+        """Analyse en flux dans ce processus ou via un pool de workers (ordre conservé)."""
+        if self.n_workers <= 1:
+            yield from self.sentiment_analyzer.analyze_stream(articles)
+            return
+        
+        with self._create_pool() as pool:
+            yield from pool.analyze_stream(articles)
+    
+    def _iter_articles(self, path: str) -> Iterator[Article]:
+        """Lit les articles un par un (.jsonl) ou depuis une liste JSON."""
+        if Path(path).suffix == ".jsonl":
+            with open(path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        yield Article.from_dict(json.loads(line))
+        else:
+            yield from self._load_articles_from_json(path)
+    
+    def _write_results_stream(self, articles: Iterable[Article], output_path: str) -> Iterator[Article]:
+        """Écrit chaque article analysé dans une liste JSON au fil de l'eau, puis le transmet."""
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        with open(output_path, "w", encoding="utf-8") as f:
+            f.write("[")
+            for i, article in enumerate(articles):
+                f.write(",\n" if i else "\n")
+                f.write(json.dumps(article.to_dict(), ensure_ascii=False))
+                yield article
+            f.write("\n]\n")
+    
+    def _analyze(self, articles: List[Article]) -> List[Article]:
+        """Analyse dans ce processus ou via un pool de workers (ordre conservé)."""
+        if self.n_workers <= 1:
+            return self.sentiment_analyzer.analyze_batch(articles)
+        
+        with self._create_pool() as pool:
+            return pool.analyze_batch(articles)
+    
+    def _create_pool(self) -> InferenceWorkerPool:
+        """
+        Pool de workers du mode multi-processus.
+        
+        Avec les backends du registre, le cache d'inférence est tenu par ce
+        processus (les workers n'y accèdent pas) ; une fabrique explicite
+        décide seule de son cache.
+        """
+        cache = None
+        if self.analyzer_factory is None:
+            from infrastructure.database.inference_cache import InferenceCache
+            cache = InferenceCache()
+        return InferenceWorkerPool(
+            self.n_workers,
+            self.threads_per_worker,
+            analyzer_factory=self.analyzer_factory,
+            cache=cache,
+        )
+    
     def _load_articles_from_json(self, json_path: str) -> List[Article]:
         """
         Charge les articles depuis un fichier JSON.
@@ -1,14 +1,26 @@
 # app/pipeline_runner.py
 
+import argparse
 import json
+import os
+import signal
 import subprocess
+import threading
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator, Optional
 
-from domain.services.sentiment_analyzer import FinBERTSentimentAnalyzer
 from domain.services.aggregator import SentimentAggregator
+from domain.services.deduplication import SimHashDeduplicator
 from domain.entities.article import Article
+from domain.entities.sentiment import SentimentResult
+from infrastructure.database.article_archive import SegmentedArchive
+from infrastructure.database.embedding_store import EmbeddingStore
 from infrastructure.database.repository import DatabaseRepository
+from infrastructure.database.trend_history import TrendHistoryRepository
+from infrastructure.datasources.in_process_crawler import InProcessCrawler
+from app.analyzer_registry import get_shared_analyzer
+from app.cycle_scheduler import CycleScheduler
 
 class ContinuousPipelineRunner:
     """
@@ -23,12 +35,25 @@ class ContinuousPipelineRunner:
     Architecture Pipeline.
     """
     
+    SCRAPY_STOP_TIMEOUT = 60  # Délai d'arrêt propre de Scrapy avant kill (s)
+    
     def __init__(
         self,
         scrapy_project_path: str = "infrastructure/datasources/cnbc_scraper",
         spider_name: str = "cnbc",
         output_dir: str = "data",
+        sentiment_analyzer=None,
+        in_process: bool = False,
+        stream_batch_size: int = 32,
+        stream_max_wait: float = 2.0,
     ):
+        """
+        Args:
+            in_process: Lance Scrapy dans ce processus (CrawlerRunner) et analyse
+                les articles au fil du crawl, sans sous-processus ni fichier temporaire
+            stream_batch_size: Articles par paquet analysé en mode in_process
+            stream_max_wait: Attente maximale (s) avant d'analyser un paquet incomplet
+        """
         # Résolution des chemins absolus depuis la racine du projet
         self.project_root = Path(__file__).parent.parent.resolve()
         self.scrapy_project_path = (self.project_root / scrapy_project_path).resolve()
@@ -49,34 +74,61 @@ class ContinuousPipelineRunner:
             )
         
         # Services métier
-        self.sentiment_analyzer = FinBERTSentimentAnalyzer()
+        # Analyseur partagé par le processus (modèle chargé une seule fois)
+        self.sentiment_analyzer = sentiment_analyzer or get_shared_analyzer()
         self.aggregator = SentimentAggregator()
+        self.deduplicator = SimHashDeduplicator()
         self.db_repository = DatabaseRepository()
         
+        # Crawl en processus : les articles arrivent par paquets pendant le scraping
+        self.in_process = in_process
+        self.stream_batch_size = stream_batch_size
+        self.stream_max_wait = stream_max_wait
+        self.crawler = InProcessCrawler(self.scrapy_project_path, spider_name) if in_process else None
+        
+        # Un seul cycle à la fois (boucle continue et bouton 'Rafraîchir')
+        self._cycle_lock = threading.Lock()
+        self._scheduler = None
+        
         # Création du dossier data
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
-        self.trend_history_path = self.output_dir / "trend_history.json"
-        self._ensure_trend_history_exists()
+        # Embeddings des articles (si l'analyseur en produit) : articles similaires dans l'UI
+        self.embedding_store = EmbeddingStore(data_dir=str(self.output_dir))
+        
+        # Archive des articles bruts (segments gzip en ajout seul) ; l'ancienne
+        # archive JSON unique est importée au premier lancement
+        self.archive = SegmentedArchive(
+            archive_dir=str(self.output_dir / "archive"),
+            legacy_path=str(self.output_dir / "scraped_articles_archive.json"),
+        )
+        
+        # Historique des tendances (SQLite, une ligne par entreprise et par cycle) ;
+        # l'ancien trend_history.json est importé au premier lancement
+        self.trend_history = TrendHistoryRepository(
+            db_name=str(self.output_dir / "trend_history.db"),
+            legacy_json=str(self.output_dir / "trend_history.json"),
+        )
         
         print(f"[INIT] Dossier Scrapy : {self.scrapy_project_path}")
         print(f"[INIT] Dossier output : {self.output_dir}")
     
-    def _ensure_trend_history_exists(self):
-        """Crée le fichier d'historique s'il n'existe pas."""
-        if not self.trend_history_path.exists():
-            with open(self.trend_history_path, 'w', encoding='utf-8') as f:
-                json.dump([], f, indent=4)
-    
-    def _run_single_cycle(self, cycle_number: int, timestamp: str) -> dict:
-        """Exécute un seul cycle du pipeline."""
+    def _run_single_cycle(self, cycle_number: int, timestamp: str, time_budget: Optional[float] = None) -> dict:
+        """
+        Exécute un seul cycle du pipeline.
+        
+        Args:
+            time_budget: Durée maximale du scraping (s) pour écourter le cycle
+        """
+        if self.in_process:
+            return self._run_streaming_cycle(timestamp, time_budget)
+        
         # Fichiers pour ce cycle
         temp_raw_file = self.output_dir / f"temp_scraping_{cycle_number}.json"
-        scraped_archive = self.output_dir / "scraped_articles_archive.json"
         
         # ÉTAPE 1 : SCRAPING
         print("[1/4] Scraping des nouveaux articles...")
-        new_articles_raw = self._run_scraping(temp_raw_file)
+        new_articles_raw = self._run_scraping(temp_raw_file, time_budget)
         
         if not new_articles_raw:
             print("Aucun nouvel article trouvé")
@@ -86,22 +138,22 @@ class ContinuousPipelineRunner:
         
         print(f" {len(new_articles_raw)} articles récupérés")
         
-        # Sauvegarde des articles bruts dans l'archive JSON
-        self._save_scraped_articles_to_archive(new_articles_raw, scraped_archive, timestamp)
+        # Sauvegarde des articles bruts dans l'archive
+        self._save_scraped_articles_to_archive(new_articles_raw, timestamp)
         
-        # ÉTAPE 2 : ANALYSE SENTIMENT
+        # ÉTAPES 2 + 3 : ANALYSE SENTIMENT ET SAUVEGARDE AU FIL DE L'EAU
+        # Chaque paquet analysé est enregistré avant l'analyse du suivant
         print("\n[2/4] Analyse de sentiment (FinBERT)...")
-        analyzed_articles = self._analyze_articles(new_articles_raw)
+        print("[3/4] Sauvegarde dans la base de données au fil de l'analyse...")
+        known_articles, analyzed_articles, added_count = self._analyze_and_save(new_articles_raw)
         print(f" {len(analyzed_articles)} articles analysés")
-        
-        # ÉTAPE 3 : SAUVEGARDE EN BASE
-        print("\n[3/4] Sauvegarde dans la base de données...")
-        added_count = self._save_to_database(analyzed_articles)
         print(f" {added_count} nouveaux articles ajoutés")
+        self._store_embeddings(analyzed_articles)
         
         # ÉTAPE 4 : MISE À JOUR HISTORIQUE
+        # L'historique couvre tout le cycle : les articles connus gardent leur sentiment stocké
         print("\n[4/4] Mise à jour de l'historique des tendances...")
-        self._update_trend_history(analyzed_articles, timestamp)
+        self._update_trend_history(analyzed_articles + known_articles, timestamp)
         print(" Historique mis à jour")
         
         # Nettoyage
@@ -110,6 +162,68 @@ class ContinuousPipelineRunner:
         
         # Retourne un bilan pour l'UI
         return {"found": len(new_articles_raw), "added": added_count}
+    
+    def _run_streaming_cycle(self, timestamp: str, time_budget: Optional[float] = None) -> dict:
+        """
+        Cycle en mode in_process : scraping, analyse et sauvegarde se chevauchent.
+        
+        Le spider tourne dans le thread du reactor ; ce thread consomme ses
+        articles par paquets (taille ou délai atteint) et les analyse et
+        enregistre pendant que le crawl continue. Les quasi-doublons ne sont
+        regroupés qu'à l'intérieur d'un paquet.
+        """
+        print("[1-3/4] Scraping en processus, analyse et sauvegarde au fil du crawl...")
+        scraped = []
+        known_articles = []
+        analyzed_articles = []
+        added_count = 0
+        batches = self.crawler.crawl_batches(self.stream_batch_size, self.stream_max_wait, time_budget)
+        try:
+            for raw_batch in batches:
+                scraped.extend(raw_batch)
+                known, analyzed, added = self._analyze_and_save(raw_batch)
+                known_articles.extend(known)
+                analyzed_articles.extend(analyzed)
+                added_count += added
+                print(f" Paquet de {len(raw_batch)} articles : {added} ajoutés ({len(scraped)} récupérés)")
+        finally:
+            # Analyse en échec : arrête le crawl tout de suite (pas au ramasse-miettes)
+            batches.close()
+        
+        if not scraped:
+            print("Aucun nouvel article trouvé")
+            return {"found": 0, "added": 0}
+        
+        print(f" {len(scraped)} articles récupérés, {len(analyzed_articles)} analysés")
+        print(f" {added_count} nouveaux articles ajoutés")
+        self._save_scraped_articles_to_archive(scraped, timestamp)
+        self._store_embeddings(analyzed_articles)
+        
+        print("\n[4/4] Mise à jour de l'historique des tendances...")
+        self._update_trend_history(analyzed_articles + known_articles, timestamp)
+        print(" Historique mis à jour")
+        
+        return {"found": len(scraped), "added": added_count}
+    
+    def _analyze_and_save(self, raw_articles: list) -> tuple:
+        """
+        Analyse les articles inconnus de la base et les enregistre au fil de l'eau.
+        
+        Returns:
+            (articles déjà en base, articles analysés, nombre d'articles ajoutés)
+        """
+        # PRÉ-FILTRE : articles déjà en base (une seule requête)
+        known_articles, unknown_raw = self._split_known_articles(raw_articles)
+        if known_articles:
+            print(f" {len(known_articles)} articles déjà en base (analyse ignorée)")
+        
+        analyzed_articles = []
+        added_count = 0
+        for article in self._analyze_articles(unknown_raw):
+            analyzed_articles.append(article)
+            if self._save_article(article):
+                added_count += 1
+        return known_articles, analyzed_articles, added_count
             
     def run_once(self) -> dict:
         """
@@ -118,6 +232,11 @@ class ContinuousPipelineRunner:
         """
         print("DÉMARRAGE DU SCRAPING MANUEL")
         
+        # Pas de chevauchement avec un cycle de la boucle continue
+        if not self._cycle_lock.acquire(blocking=False):
+            print(" Un cycle est déjà en cours : scraping manuel ignoré.")
+            return {"found": 0, "added": 0}
+        
         start_time = datetime.now()
         timestamp = start_time.strftime("%Y-%m-%d %H:%M:%S")
         
@@ -131,11 +250,92 @@ class ContinuousPipelineRunner:
         except Exception as e:
             print(f"\n Erreur critique durant le scraping manuel : {e}")
             raise e # On remonte l'erreur pour le debugging
+        finally:
+            self._cycle_lock.release()
+    
+    def run_continuous(
+        self,
+        interval: float = 900.0,
+        jitter: float = 60.0,
+        cycle_budget: Optional[float] = None,
+        max_backoff: float = 1800.0,
+        max_cycles: Optional[int] = None,
+    ):
+        """
+        Lance le pipeline en boucle (Mode Continu) jusqu'à SIGTERM / Ctrl+C.
+        
+        Le modèle et le repository restent chargés d'un cycle à l'autre.
+        Planification : voir CycleScheduler (grille fixe + jitter, backoff
+        exponentiel après échec, cycles jamais simultanés).
+        
+        Args:
+            interval: Période entre deux cycles (s)
+            jitter: Décalage aléatoire maximal de chaque départ (s)
+            cycle_budget: Durée de cycle visée (s) ; après un cycle plus long,
+                le scraping du suivant est limité à ce budget
+            max_backoff: Attente maximale après des échecs répétés (s)
+            max_cycles: Nombre de cycles avant arrêt (None = sans fin)
+        """
+        print(f"DÉMARRAGE DU PIPELINE CONTINU (toutes les {interval:.0f}s ± {jitter:.0f}s)")
+        if hasattr(self.sentiment_analyzer, "warmup"):
+            self.sentiment_analyzer.warmup()
+        
+        self._scheduler = CycleScheduler(
+            self._run_scheduled_cycle,
+            interval=interval,
+            jitter=jitter,
+            cycle_budget=cycle_budget,
+            max_backoff=max_backoff,
+        )
+        previous_handlers = self._install_stop_handlers()
+        try:
+            self._scheduler.run(max_cycles)
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            self._scheduler = None
+    
+    def stop(self):
+        """Arrête la boucle continue après le cycle en cours."""
+        if self._scheduler is not None:
+            self._scheduler.stop()
     
-    def _run_scraping(self, output_file: Path) -> list:
+    def _install_stop_handlers(self) -> dict:
+        """SIGTERM / SIGINT → arrêt propre (seulement depuis le thread principal)."""
+        if threading.current_thread() is not threading.main_thread():
+            return {}
+        
+        def handle(signum, frame):
+            print(f"\n Signal {signal.Signals(signum).name} reçu : arrêt après le cycle en cours")
+            self.stop()
+        
+        previous = {}
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            previous[signum] = signal.signal(signum, handle)
+        return previous
+    
+    def _run_scheduled_cycle(self, cycle_number: int, time_budget: Optional[float]) -> Optional[dict]:
+        """Cycle de la boucle continue (ignoré si un scraping manuel est en cours)."""
+        if not self._cycle_lock.acquire(blocking=False):
+            print(f"[CYCLE {cycle_number}] Scraping manuel en cours : cycle ignoré")
+            return None
+        try:
+            timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            print(f"\n[CYCLE {cycle_number}] {timestamp}")
+            result = self._run_single_cycle(cycle_number, timestamp, time_budget)
+            print(f"[CYCLE {cycle_number}] {result['found']} articles trouvés, {result['added']} ajoutés")
+            return result
+        finally:
+            self._cycle_lock.release()
+    
+    def _run_scraping(self, output_file: Path, time_budget: Optional[float] = None) -> list:
         """
         Exécute le spider Scrapy.
         
+        Args:
+            time_budget: Durée maximale (s) ; au-delà, Scrapy reçoit SIGINT et
+                s'arrête proprement (le fichier de sortie reste un JSON valide)
+        
         Returns:
             Liste de dictionnaires (articles bruts)
         """
@@ -152,13 +352,28 @@ class ContinuousPipelineRunner:
             print(f"   Fichier de sortie : {output_file}")
             
             # Exécution depuis le dossier du projet Scrapy
-            result = subprocess.run(
+            process = subprocess.Popen(
                 cmd,
                 cwd=str(self.scrapy_project_path),
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                check=False  # Ne pas lever d'exception, on gère manuellement
             )
+            try:
+                stdout, stderr = process.communicate(timeout=time_budget)
+            except subprocess.TimeoutExpired:
+                print(f"   Budget de {time_budget:.0f}s atteint : arrêt du crawl")
+                # SIGINT : arrêt propre de Scrapy (export terminé) ; pas d'équivalent sous Windows
+                if os.name == 'nt':
+                    process.terminate()
+                else:
+                    process.send_signal(signal.SIGINT)
+                try:
+                    stdout, stderr = process.communicate(timeout=self.SCRAPY_STOP_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    stdout, stderr = process.communicate()
+            result = subprocess.CompletedProcess(cmd, process.returncode, stdout, stderr)
             
             # Affichage des logs Scrapy
             if result.stdout:
@@ -200,45 +415,96 @@ class ContinuousPipelineRunner:
 
         return []
     
-    def _analyze_articles(self, raw_articles: list) -> list:
+    def _split_known_articles(self, raw_articles: list) -> tuple:
+        """
+        Sépare les articles déjà en base (clé UNIQUE link + company) des nouveaux.
+        
+        Returns:
+            (articles connus reconstruits depuis la base, articles bruts inconnus)
+        """
+        def key(raw):
+            return (raw.get("url") or raw.get("link"), raw.get("company", "Unknown"))
+        
+        known_rows = self.db_repository.fetch_known_articles(key(raw) for raw in raw_articles)
+        
+        known_articles = []
+        unknown_raw = []
+        for raw in raw_articles:
+            row = known_rows.get(key(raw))
+            if row is None:
+                unknown_raw.append(raw)
+                continue
+            
+            article = Article.from_dict(row)
+            article.sentiment_label = row["sentiment_label"]
+            article.sentiment_score = row["sentiment_score"]
+            article.sentiment_probas = row["sentiment_probas"]
+            article.sentiment_tier = row["sentiment_tier"]
+            article.cluster_id = row["cluster_id"]
+            known_articles.append(article)
+        
+        return known_articles, unknown_raw
+    
+    def _analyze_articles(self, raw_articles: list) -> Iterator[Article]:
         """
-        Analyse le sentiment des articles.
+        Analyse le sentiment des articles au fil de l'eau.
+        
+        Les quasi-doublons (même dépêche sous plusieurs tickers) sont regroupés :
+        seul le premier article de chaque groupe passe par le modèle, son
+        sentiment est recopié sur les autres membres.
         
         Args:
             raw_articles: Liste de dictionnaires bruts
         
-        Returns:
-            Liste d'objets Article analysés
+        Yields:
+            Objets Article analysés, paquet par paquet
         """
-        # Conversion dict → Article
         articles = [Article.from_dict(raw) for raw in raw_articles]
-        
-        # Analyse de sentiment
-        analyzed_articles = self.sentiment_analyzer.analyze_batch(articles)
-        
-        return analyzed_articles
+        clusters = self.deduplicator.cluster_articles(articles)
+        representatives = [members[0] for members in clusters.values()]
+        if len(representatives) < len(articles):
+            print(f" {len(articles) - len(representatives)} quasi-doublons (analyse partagée)")
+        
+        # Analyse de sentiment des seuls représentants
+        for representative in self.sentiment_analyzer.analyze_stream(representatives):
+            sentiment = SentimentResult(
+                label=representative.sentiment_label,
+                score=representative.sentiment_score,
+                probabilities=representative.sentiment_probas,
+                tier=representative.sentiment_tier,
+                embedding=representative.embedding
+            )
+            yield representative
+            for member in clusters[representative.cluster_id][1:]:
+                yield member.apply_sentiment(sentiment)
     
-    def _save_to_database(self, articles: list) -> int:
-        """Sauvegarde les articles et retourne le nombre de VRAIS ajouts."""
-        print("\nSauvegarde dans la base de données...")
-        
-        added_count = 0
-        for article in articles:
-            try:
-                article_dict = article.to_dict()
-                # On incrémente SEULEMENT si la DB retourne True (Nouveau)
-                is_new = self.db_repository.save_article(article_dict)
-                if is_new:
-                    added_count += 1
-            except Exception as e:
-                print(f"Erreur sauvegarde article : {e}")
-        
-        if added_count > 0:
-            print(f" {added_count} nouveaux articles ajoutés (Doublons ignorés)")
-        else:
-            print(f" Aucune nouveauté (tous les articles existent déjà)")
-            
-        return added_count
+    def _save_article(self, article: Article) -> bool:
+        """Sauvegarde un article et retourne True si c'est un VRAI ajout."""
+        try:
+            # La DB retourne True seulement si l'article est nouveau
+            return self.db_repository.save_article(article.to_dict())
+        except Exception as e:
+            print(f"Erreur sauvegarde article : {e}")
+            return False
+    
+    def _store_embeddings(self, articles: list):
+        """Enregistre les embeddings des articles analysés, indexés par id en base."""
+        with_embedding = [article for article in articles if article.embedding is not None]
+        if not with_embedding:
+            return
+        
+        known = self.db_repository.fetch_known_articles(
+            (article.url, article.company) for article in with_embedding
+        )
+        ids, vectors = [], []
+        for article in with_embedding:
+            stored = known.get((article.url, article.company))
+            if stored is not None:
+                ids.append(stored["id"])
+                vectors.append(article.embedding)
+        if ids:
+            self.embedding_store.add(ids, vectors)
+            print(f" {len(ids)} embeddings enregistrés")
     
     def _update_trend_history(self, articles: list, timestamp: str):
         """
@@ -255,70 +521,45 @@ class ContinuousPipelineRunner:
         for company, score in company_scores.items():
             print(f"      - {company} : {score:+.3f}")
         
-        # Ajout à l'historique
-        trend_entry = {
-            "timestamp": timestamp,
-            "scores": company_scores
-        }
-        
-        # Lecture de l'historique existant
-        try:
-            with open(self.trend_history_path, 'r', encoding='utf-8') as f:
-                history = json.load(f)
-        except:
-            history = []
-        
-        history.append(trend_entry)
-        
-        # Sauvegarde
-        with open(self.trend_history_path, 'w', encoding='utf-8') as f:
-            json.dump(history, f, indent=4, ensure_ascii=False)
+        # Ajout des seules lignes du cycle (rien n'est relu)
+        self.trend_history.append(timestamp, company_scores)
     
-    def _save_scraped_articles_to_archive(self, articles: list, archive_path: Path, timestamp: str):
+    def _save_scraped_articles_to_archive(self, articles: list, timestamp: str):
         """
-        Sauvegarde les articles scrapés dans un fichier JSON d'archive.
+        Ajoute les articles scrapés du cycle à l'archive segmentée.
         
         Args:
             articles: Liste des articles scrapés (bruts)
-            archive_path: Chemin du fichier d'archive JSON
             timestamp: Horodatage du scraping
         """
-        # Structure de l'entrée d'archive
-        archive_entry = {
-            "timestamp": timestamp,
-            "count": len(articles),
-            "articles": articles
-        }
-        
-        # Lecture de l'archive existante
-        if archive_path.exists():
-            try:
-                with open(archive_path, 'r', encoding='utf-8') as f:
-                    archive_data = json.load(f)
-            except:
-                archive_data = []
-        else:
-            archive_data = []
-        
-        # Ajout de la nouvelle entrée
-        archive_data.append(archive_entry)
-        
-        # Sauvegarde de l'archive mise à jour
-        with open(archive_path, 'w', encoding='utf-8') as f:
-            json.dump(archive_data, f, indent=4, ensure_ascii=False)
-        
-        print(f" Articles archivés dans {archive_path.name}")
+        self.archive.append(articles, timestamp)
+        print(f" Articles archivés dans {self.archive.segments[-1]['file']}")
 
 
 def main():
     """Point d'entrée du pipeline continu."""
+    parser = argparse.ArgumentParser(description="Pipeline continu : scraping + analyse de sentiment")
+    parser.add_argument("--interval", type=float, default=900.0, help="Période entre deux cycles (s)")
+    parser.add_argument("--jitter", type=float, default=60.0, help="Décalage aléatoire maximal (s)")
+    parser.add_argument("--budget", type=float, help="Durée de cycle visée (s)")
+    parser.add_argument("--max-backoff", type=float, default=1800.0,
+                        help="Attente maximale après des échecs répétés (s)")
+    parser.add_argument("--in-process", action="store_true", help="Scrapy dans ce processus (analyse au fil du crawl)")
+    args = parser.parse_args()
+    
     runner = ContinuousPipelineRunner(
         scrapy_project_path="infrastructure/datasources/cnbc_scraper",
         spider_name="cnbc",
         output_dir="data",
+        in_process=args.in_process,
     )
     
-    runner.run_continuous()
+    runner.run_continuous(
+        interval=args.interval,
+        jitter=args.jitter,
+        cycle_budget=args.budget,
+        max_backoff=args.max_backoff,
+    )
 
 
 if __name__ == "__main__":
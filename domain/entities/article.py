@@ -1,9 +1,11 @@
 # domain/entities/article.py
 
 from dataclasses import dataclass
-from typing import Optional
+from typing import Mapping, Optional
 from datetime import datetime
 
+import numpy as np
+
 @dataclass
 class Article:
     """
@@ -19,7 +21,10 @@ class Article:
     # Champs ajoutés après analyse
     sentiment_label: Optional[str] = None
     sentiment_score: Optional[float] = None
-    sentiment_probas: Optional[dict] = None
+    sentiment_probas: Optional[Mapping[str, float]] = None  # dict ou ProbabilityView
+    sentiment_tier: Optional[str] = None
+    cluster_id: Optional[str] = None  # Groupe de quasi-doublons (SimHashDeduplicator)
+    embedding: Optional[np.ndarray] = None  # Embedding FinBERT (EmbeddingStore), hors to_dict
     
     @classmethod
     def from_dict(cls, data: dict) -> 'Article':
@@ -59,9 +64,20 @@ class Article:
             "published_date": date_val, 
             "sentiment_label": self.sentiment_label,
             "sentiment_score": self.sentiment_score,
-            "sentiment_probas": self.sentiment_probas
+            "sentiment_probas": dict(self.sentiment_probas) if self.sentiment_probas is not None else None,
+            "sentiment_tier": self.sentiment_tier,
+            "cluster_id": self.cluster_id
         }
     
+    def apply_sentiment(self, sentiment) -> 'Article':
+        """Met à jour les champs de sentiment depuis un SentimentResult (mutation)."""
+        self.sentiment_label = sentiment.label
+        self.sentiment_score = sentiment.score
+        self.sentiment_probas = sentiment.probabilities
+        self.sentiment_tier = sentiment.tier
+        self.embedding = sentiment.embedding
+        return self
+    
     def get_text_for_analysis(self) -> str:
         """Retourne le texte à analyser (titre + contenu)."""
         return f"{self.title}. {self.content}".strip()
\ No newline at end of file
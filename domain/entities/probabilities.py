@@ -0,0 +1,82 @@
+# domain/entities/probabilities.py
+
+from collections.abc import Mapping
+from operator import itemgetter
+from typing import Iterable, Iterator
+
+import numpy as np
+
+
+# Ordre des colonnes des matrices de probabilités (n, 3)
+LABELS = ("négatif", "neutre", "positif")
+
+# Valeur numérique de chaque colonne : négatif=-1, neutre=0, positif=+1
+SENTIMENT_VALUES = np.array([-1.0, 0.0, 1.0], dtype=np.float32)
+
+_get_labels = itemgetter(*LABELS)
+
+
+class ProbabilityView(Mapping):
+    """
+    Vue {label: probabilité} sur une ligne d'une matrice (n, 3) float32.
+    
+    Se lit comme le dictionnaire historique (probas["positif"], .items()...)
+    sans le construire : les analyses par lot gardent une seule matrice pour
+    tous les articles. dict(vue) donne le dictionnaire (JSON, base de données).
+    """
+    
+    __slots__ = ("_matrix", "_index")
+    
+    def __init__(self, matrix: np.ndarray, index: int):
+        self._matrix = matrix
+        self._index = index
+    
+    @property
+    def row(self) -> np.ndarray:
+        """Ligne (3,) de la matrice, colonnes dans l'ordre de LABELS."""
+        return self._matrix[self._index]
+    
+    def __getitem__(self, label: str) -> float:
+        try:
+            column = LABELS.index(label)
+        except ValueError:
+            raise KeyError(label) from None
+        return float(self._matrix[self._index, column])
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(LABELS)
+    
+    def __len__(self) -> int:
+        return len(LABELS)
+    
+    def __repr__(self) -> str:
+        return repr(dict(self))
+
+
+def probability_views(matrix: np.ndarray) -> list:
+    """Une vue par ligne de la matrice (aucune copie des probabilités)."""
+    return [ProbabilityView(matrix, i) for i in range(len(matrix))]
+
+
+def probability_matrix(probabilities: Iterable[Mapping]) -> np.ndarray:
+    """
+    Matrice (n, 3) float32 depuis des vues ou des dictionnaires {label: proba}.
+    
+    Les vues fournissent leur ligne directement ; les dictionnaires (lus en
+    base) sont lus en un appel par article. Probabilités absentes → 0.
+    """
+    rows = []
+    for probas in probabilities:
+        if isinstance(probas, ProbabilityView):
+            rows.append(probas.row)
+        elif not probas:
+            rows.append((0.0, 0.0, 0.0))
+        else:
+            try:
+                rows.append(_get_labels(probas))
+            except KeyError:
+                rows.append(tuple(probas.get(label, 0.0) for label in LABELS))
+    
+    if not rows:
+        return np.zeros((0, len(LABELS)), dtype=np.float32)
+    return np.asarray(rows, dtype=np.float32)
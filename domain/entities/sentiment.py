@@ -1,7 +1,9 @@
 # domain/entities/sentiment.py
 
 from dataclasses import dataclass
-from typing import Dict
+from typing import Mapping, Optional
+
+import numpy as np
 
 @dataclass
 class SentimentResult:
@@ -12,14 +14,26 @@ class SentimentResult:
     """
     label: str  # "négatif", "neutre", "positif"
     score: float  # Probabilité associée (0-1)
-    probabilities: Dict[str, float]  # Toutes les probabilités
+    probabilities: Mapping[str, float]  # Toutes les probabilités (dict ou ProbabilityView)
+    tier: Optional[str] = None  # Étage du mode cascade ayant tranché ("lexique", "finbert")
+    embedding: Optional[np.ndarray] = None  # Embedding du texte (option return_embeddings), hors to_dict
+    
+    @classmethod
+    def neutral(cls) -> 'SentimentResult':
+        """Sentiment neutre par défaut (texte vide)."""
+        return cls(
+            label="neutre",
+            score=1.0,
+            probabilities={"négatif": 0.0, "neutre": 1.0, "positif": 0.0}
+        )
     
     def to_dict(self) -> dict:
         """Convertit en dictionnaire."""
         return {
             "label": self.label,
             "score": self.score,
-            "probabilities": self.probabilities
+            "probabilities": dict(self.probabilities),
+            "tier": self.tier
         }
     
     @property
@@ -1,8 +1,12 @@
 # domain/services/aggregator.py
 
-from typing import List, Dict
-from collections import defaultdict
+from itertools import islice
+from typing import Iterable, List, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+
 from domain.entities.article import Article
+from domain.entities.probabilities import LABELS, SENTIMENT_VALUES
 
 
 class SentimentAggregator:
@@ -25,45 +29,106 @@ class SentimentAggregator:
             Dictionnaire {company: score_moyen}
             Score entre -1 (très négatif) et +1 (très positif)
         """
-        # Grouper par entreprise
-        companies = self._group_by_company(articles)
-        
-        # Calculer le score moyen pour chaque entreprise
-        results = {}
-        for company, company_articles in companies.items():
-            results[company] = self._calculate_average_sentiment(company_articles)
+        companies, codes, label_codes, scores = self._sentiment_arrays(articles)
+        values = self._weighted_values(label_codes, scores)
+        return dict(zip(companies, self._company_means(codes, values, len(companies)).tolist()))
+    
+    def aggregate_probabilities(self, companies: Sequence[str], probabilities: np.ndarray) -> Dict[str, float]:
+        """
+        Même calcul que aggregate_by_company, directement sur une matrice.
         
-        return results
+        Args:
+            companies: Entreprise de chaque ligne
+            probabilities: Matrice (n, 3) float32 (colonnes dans l'ordre de LABELS),
+                ex : FinBERTSentimentAnalyzer.predict_proba
+        """
+        names, codes = self.company_codes(companies)
+        predicted = probabilities.argmax(axis=1)
+        confidence = probabilities[np.arange(len(probabilities)), predicted]
+        values = self._weighted_values(predicted, confidence)
+        return dict(zip(names, self._company_means(codes, values, len(names)).tolist()))
     
-    def _group_by_company(self, articles: List[Article]) -> Dict[str, List[Article]]:
-        """Regroupe les articles par entreprise."""
-        companies = defaultdict(list)
+    def aggregate_stream(self, articles: Iterable[Article], chunk_size: int = 1024) -> Dict[str, float]:
+        """
+        Même calcul que aggregate_by_company, en une passe sur un itérable.
         
-        for article in articles:
-            companies[article.company].append(article)
+        Les articles sont consommés par paquets de `chunk_size` ; seules des
+        sommes par entreprise sont conservées d'un paquet à l'autre.
+        """
+        index = {}
+        totals = np.zeros(0)
+        counts = np.zeros(0, dtype=np.int64)
         
-        return dict(companies)
+        iterator = iter(articles)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            _, codes, label_codes, scores = self._sentiment_arrays(chunk, index)
+            chunk_totals, chunk_counts = self._company_sums(
+                codes, self._weighted_values(label_codes, scores), len(index)
+            )
+            chunk_totals[:len(totals)] += totals
+            chunk_counts[:len(counts)] += counts
+            totals, counts = chunk_totals, chunk_counts
+        
+        means = np.divide(totals, counts, out=np.zeros(len(index)), where=counts > 0)
+        return dict(zip(index, means.tolist()))
     
-    def _calculate_average_sentiment(self, articles: List[Article]) -> float:
+    @staticmethod
+    def company_codes(companies: Iterable[str], index: Optional[Dict[str, int]] = None) -> Tuple[List[str], np.ndarray]:
         """
-        Calcule le sentiment moyen pour une liste d'articles.
+        Code entier de chaque entreprise (ordre de première apparition).
         
-        Conversion : positif=+1, neutre=0, négatif=-1
-        Pondération par la confiance (sentiment_score)
+        Args:
+            companies: Entreprise de chaque article
+            index: Codes déjà attribués {entreprise: code}, complété sur place
+                (agrégation par paquets)
         """
-        if not articles:
-            return 0.0
-        
-        mapping = {"positif": +1, "neutre": 0, "négatif": -1}
-        weighted_scores = []
+        index = {} if index is None else index
+        codes = [index.setdefault(company, len(index)) for company in companies]
+        return list(index), np.array(codes, dtype=np.intp)
+    
+    def _sentiment_arrays(
+        self, articles: List[Article], index: Optional[Dict[str, int]] = None
+    ) -> Tuple[List[str], np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Une passe sur les articles → (entreprises, code entreprise, code label, confiance).
         
-        for article in articles:
-            if article.sentiment_label and article.sentiment_score:
-                numeric_value = mapping[article.sentiment_label]
-                confidence = article.sentiment_score
-                weighted_scores.append(numeric_value * confidence)
+        Code label : colonne de LABELS, -1 pour un article non analysé.
+        """
+        companies, codes = self.company_codes((article.company for article in articles), index)
+        labels = np.array([article.sentiment_label or "" for article in articles], dtype=str)
+        scores = np.array([article.sentiment_score or 0.0 for article in articles], dtype=np.float64)
         
-        return sum(weighted_scores) / len(weighted_scores) if weighted_scores else 0.0
+        matches = labels[:, None] == np.array(LABELS)
+        label_codes = np.where(matches.any(axis=1), matches.argmax(axis=1), -1)
+        return companies, codes, label_codes, scores
+    
+    @staticmethod
+    def _weighted_values(label_codes: np.ndarray, confidence: np.ndarray) -> np.ndarray:
+        """
+        Valeur de chaque article : positif=+1, neutre=0, négatif=-1, pondérée
+        par la confiance ; NaN sans label ou sans confiance (non analysé).
+        """
+        confidence = np.asarray(confidence, dtype=np.float64)
+        values = SENTIMENT_VALUES[label_codes] * confidence
+        values[(label_codes < 0) | (confidence == 0)] = np.nan
+        return values
+    
+    @staticmethod
+    def _company_sums(codes: np.ndarray, values: np.ndarray, n_companies: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Somme et nombre des valeurs (hors NaN) par code d'entreprise."""
+        valid = ~np.isnan(values)
+        totals = np.bincount(codes[valid], weights=values[valid], minlength=n_companies).astype(np.float64)
+        counts = np.bincount(codes[valid], minlength=n_companies)
+        return totals, counts
+    
+    @classmethod
+    def _company_means(cls, codes: np.ndarray, values: np.ndarray, n_companies: int) -> np.ndarray:
+        """Moyenne des valeurs (hors NaN) par code d'entreprise ; 0 sans valeur."""
+        totals, counts = cls._company_sums(codes, values, n_companies)
+        return np.divide(totals, counts, out=np.zeros(n_companies), where=counts > 0)
     
     def get_detailed_stats(self, articles: List[Article]) -> Dict[str, Dict]:
         """
@@ -81,22 +146,22 @@ class SentimentAggregator:
                 ...
             }
         """
-        companies = self._group_by_company(articles)
-        stats = {}
+        companies, codes, label_codes, scores = self._sentiment_arrays(articles)
+        averages = self._company_means(codes, self._weighted_values(label_codes, scores), len(companies))
+        totals = np.bincount(codes, minlength=len(companies))
         
-        for company, company_articles in companies.items():
-            label_counts = {"positif": 0, "neutre": 0, "négatif": 0}
-            
-            for article in company_articles:
-                if article.sentiment_label:
-                    label_counts[article.sentiment_label] += 1
-            
-            stats[company] = {
-                "avg_sentiment": self._calculate_average_sentiment(company_articles),
-                "total_articles": len(company_articles),
-                "positive": label_counts["positif"],
-                "neutral": label_counts["neutre"],
-                "negative": label_counts["négatif"]
-            }
+        # Nombre d'articles par (entreprise, label)
+        labelled = label_codes >= 0
+        counts = np.zeros((len(companies), len(LABELS)), dtype=np.int64)
+        np.add.at(counts, (codes[labelled], label_codes[labelled]), 1)
         
-        return stats
\ No newline at end of file
+        return {
+            company: {
+                "avg_sentiment": float(averages[c]),
+                "total_articles": int(totals[c]),
+                "positive": int(counts[c, LABELS.index("positif")]),
+                "neutral": int(counts[c, LABELS.index("neutre")]),
+                "negative": int(counts[c, LABELS.index("négatif")])
+            }
+            for c, company in enumerate(companies)
+        }
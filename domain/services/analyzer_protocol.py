@@ -0,0 +1,90 @@
+# domain/services/analyzer_protocol.py
+
+import abc
+from itertools import islice
+from typing import Iterable, Iterator, List, Protocol, runtime_checkable
+
+from domain.entities.article import Article
+from domain.entities.sentiment import SentimentResult
+
+
+@runtime_checkable
+class SentimentAnalyzer(Protocol):
+    """
+    Contrat commun des analyseurs de sentiment.
+    
+    Implémenté par FinBERTSentimentAnalyzer, CascadeSentimentAnalyzer,
+    RemoteSentimentAnalyzer et DeterministicSentimentAnalyzer : le pipeline,
+    l'orchestrateur et la GUI ne dépendent que de cette interface.
+    """
+    
+    def analyze_text(self, text: str) -> SentimentResult: ...
+    
+    def analyze_texts(self, texts: List[str], verbose: bool = False) -> List[SentimentResult]: ...
+    
+    def analyze_article(self, article: Article) -> Article: ...
+    
+    def analyze_batch(self, articles: List[Article], verbose: bool = True) -> List[Article]: ...
+    
+    def analyze_stream(self, articles: Iterable[Article], chunk_size: int = 256) -> Iterator[Article]: ...
+
+
+class TextBatchAnalyzer(abc.ABC):
+    """
+    Base des analyseurs : tout est dérivé de analyze_texts.
+    
+    Une sous-classe n'implémente que analyze_texts (un SentimentResult par
+    texte, ordre conservé) ; les méthodes sur les articles (texte vide →
+    neutre, mutation, flux par paquets) sont fournies ici.
+    """
+    
+    @abc.abstractmethod
+    def analyze_texts(self, texts: List[str], verbose: bool = False) -> List[SentimentResult]:
+        """Un SentimentResult par texte, ordre conservé (verbose : détails de progression)."""
+    
+    def analyze_text(self, text: str) -> SentimentResult:
+        return self.analyze_texts([text])[0]
+    
+    def _article_text(self, article: Article) -> str:
+        """Texte soumis à l'analyse pour un article (titre + contenu par défaut)."""
+        return article.get_text_for_analysis()
+    
+    def analyze_article(self, article: Article) -> Article:
+        text = self._article_text(article)
+        sentiment = self.analyze_text(text) if text else SentimentResult.neutral()
+        return article.apply_sentiment(sentiment)
+    
+    def analyze_batch(self, articles: List[Article], verbose: bool = True) -> List[Article]:
+        """
+        Analyse un lot d'articles en un appel à analyze_texts (mutation, ordre conservé).
+        
+        Tous les textes du lot sont soumis ensemble : FinBERT les planifie en
+        une passe (tri par longueur, budget de tokens), pas article par article.
+        """
+        if verbose:
+            print(f"[Analyse] Traitement de {len(articles)} articles...")
+        
+        to_analyze = []
+        for article in articles:
+            text = self._article_text(article)
+            if text:
+                to_analyze.append((article, text))
+            else:
+                article.apply_sentiment(SentimentResult.neutral())
+        
+        sentiments = self.analyze_texts([text for _, text in to_analyze], verbose=verbose)
+        for (article, _), sentiment in zip(to_analyze, sentiments):
+            article.apply_sentiment(sentiment)
+        
+        if verbose:
+            print(f"[Analyse] ✓ {len(articles)} articles traités")
+        return articles
+    
+    def analyze_stream(self, articles: Iterable[Article], chunk_size: int = 256) -> Iterator[Article]:
+        """Analyse des articles au fil de l'eau, par paquets de `chunk_size`."""
+        iterator = iter(articles)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield from self.analyze_batch(chunk)
@@ -0,0 +1,157 @@
+# domain/services/batch_autotuner.py
+
+import json
+import os
+import platform
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import ContextManager, Dict, Optional, Sequence
+
+from domain.services.project_paths import resolve_project_path
+
+
+class BatchAutotuner:
+    """
+    Recherche la taille de lot et le budget de tokens les plus rapides.
+    
+    Des entrées synthétiques de plusieurs longueurs passent par le modèle à
+    plusieurs tailles de lot ; le débit (textes/s) mesuré sur la machine
+    courante désigne les meilleurs réglages, enregistrés dans un fichier JSON
+    par machine et par modèle (data/batch_tuning.json).
+    
+    Chaque essai prend le verrou d'inférence de l'analyseur : une mesure
+    lancée en arrière-plan laisse passer les analyses entre deux essais.
+    """
+    
+    TUNING_FILE = "data/batch_tuning.json"
+    BATCH_SIZES = (4, 8, 16, 32, 64)
+    SEQUENCE_LENGTHS = (64, 128, 256, 512)
+    MAX_TRIAL_TOKENS = 32768  # Lots plus gros ignorés (trop lents à mesurer)
+    MIN_TRIAL_TIME = 0.2  # Durée minimale de mesure d'une configuration (s)
+    
+    _SAMPLE = "Shares rose after the company reported quarterly earnings above expectations. "
+    
+    def __init__(
+        self,
+        analyzer,
+        batch_sizes: Sequence[int] = BATCH_SIZES,
+        sequence_lengths: Sequence[int] = SEQUENCE_LENGTHS,
+        tuning_path: Optional[str] = None,
+        lock: Optional[ContextManager] = None,
+    ):
+        """
+        Args:
+            analyzer: FinBERTSentimentAnalyzer (utilise _pad / _predict)
+            batch_sizes: Tailles de lot essayées
+            sequence_lengths: Longueurs de séquence essayées (plafonnées à max_length)
+            tuning_path: Fichier JSON des réglages (défaut : TUNING_FILE)
+            lock: Verrou tenu pendant chaque essai (ex : verrou d'inférence de
+                l'analyseur ; défaut : aucun)
+        """
+        self.analyzer = analyzer
+        self.batch_sizes = sorted(batch_sizes)
+        self.sequence_lengths = sorted({min(length, analyzer.max_length) for length in sequence_lengths})
+        self.tuning_path = resolve_project_path(tuning_path or self.TUNING_FILE)
+        self.lock = lock if lock is not None else nullcontext()
+    
+    @staticmethod
+    def machine_key(model_id: str, backend: str) -> str:
+        """Clé des réglages : machine, processeur, cœurs, modèle et backend."""
+        cpu = platform.processor() or platform.machine()
+        return f"{platform.node()}|{cpu}|{os.cpu_count()} cpu|{model_id}|{backend}"
+    
+    @classmethod
+    def lookup(cls, model_id: str, backend: str, tuning_path: Optional[str] = None) -> Optional[Dict]:
+        """Réglages enregistrés pour cette machine et ce modèle (None si absents)."""
+        path = resolve_project_path(tuning_path or cls.TUNING_FILE)
+        return cls._read(path).get(cls.machine_key(model_id, backend))
+    
+    @staticmethod
+    def _read(path: Path) -> Dict:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+    
+    def tune(self) -> Dict:
+        """
+        Mesure le débit de chaque configuration puis enregistre les meilleurs réglages.
+        
+        - batch_size : meilleure taille de lot sur les séquences les plus courtes
+          (là où le budget de tokens ne limite pas le lot)
+        - max_tokens_per_batch : meilleur lot × longueur sur les plus longues
+          mesurées (une longueur dont tous les lots dépassent MAX_TRIAL_TOKENS
+          est ignorée ; aucune mesure possible → réglages actuels conservés)
+        
+        Returns:
+            {"batch_size", "max_tokens_per_batch", "measures", "tuned_at"}
+        """
+        print(f"[Autotune] Mesure sur {self.sequence_lengths} tokens × lots {self.batch_sizes}...")
+        
+        measures = {}
+        best = {}
+        for length in self.sequence_lengths:
+            with self.lock:
+                ids = self._synthetic_ids(length)
+            for batch_size in self.batch_sizes:
+                if batch_size * length > self.MAX_TRIAL_TOKENS:
+                    break
+                with self.lock:
+                    throughput = self._measure([ids] * batch_size)
+                measures[f"{length}x{batch_size}"] = round(throughput, 2)
+                if throughput > best.get(length, (0, 0))[1]:
+                    best[length] = (batch_size, throughput)
+        
+        measured = [length for length in self.sequence_lengths if length in best]
+        if measured:
+            shortest, longest = measured[0], measured[-1]
+            batch_size = best[shortest][0]
+            max_tokens_per_batch = max(self.analyzer.max_length, best[longest][0] * longest)
+        else:
+            print("[Autotune] Aucune configuration mesurable : réglages actuels conservés")
+            batch_size = self.analyzer.batch_size
+            max_tokens_per_batch = self.analyzer.max_tokens_per_batch
+        tuning = {
+            "batch_size": batch_size,
+            "max_tokens_per_batch": max_tokens_per_batch,
+            "measures": measures,
+            "tuned_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        }
+        self._save(tuning)
+        print(
+            f"[Autotune] batch_size={tuning['batch_size']}, "
+            f"max_tokens_per_batch={tuning['max_tokens_per_batch']}"
+        )
+        return tuning
+    
+    def _synthetic_ids(self, length: int):
+        """Séquence de tokens réaliste d'exactement `length` tokens."""
+        text = self._SAMPLE * (length // 8 + 1)
+        return self.analyzer.tokenizer(text, truncation=True, max_length=length)["input_ids"]
+    
+    def _measure(self, batch_ids) -> float:
+        """Débit (textes/s) d'un lot, après une passe de chauffe."""
+        inputs = self.analyzer._pad(batch_ids)
+        self.analyzer._predict(inputs)
+        
+        runs = 0
+        start = time.perf_counter()
+        while True:
+            self.analyzer._predict(inputs)
+            runs += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= self.MIN_TRIAL_TIME:
+                return runs * len(batch_ids) / elapsed
+    
+    def _save(self, tuning: Dict):
+        """Enregistre les réglages de la machine courante (écriture atomique)."""
+        data = self._read(self.tuning_path)
+        data[self.machine_key(self.analyzer.model_id, self.analyzer.backend)] = tuning
+        
+        self.tuning_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.tuning_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.tuning_path)
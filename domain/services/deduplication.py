@@ -0,0 +1,104 @@
+# domain/services/deduplication.py
+
+import hashlib
+import re
+from collections import defaultdict
+from typing import Dict, List
+
+import numpy as np
+
+from domain.entities.article import Article
+
+
+class SimHashDeduplicator:
+    """
+    Regroupe les articles quasi identiques (dépêches Reuters/AP reprises
+    sous plusieurs tickers) par empreinte SimHash 64 bits.
+    
+    Deux textes sont du même groupe si leurs empreintes diffèrent d'au plus
+    `max_distance` bits. Les empreintes sont découpées en `max_distance + 1`
+    bandes : deux empreintes assez proches partagent forcément une bande
+    identique, seules ces paires candidates sont comparées.
+    """
+    
+    BITS = 64
+    _WORD_RE = re.compile(r"\w+")
+    
+    def __init__(self, max_distance: int = 3, shingle_size: int = 3):
+        """
+        Args:
+            max_distance: Distance de Hamming maximale entre deux quasi-doublons
+            shingle_size: Nombre de mots par fragment (shingle) haché
+        """
+        if not 0 <= max_distance < 16:
+            raise ValueError(f"max_distance doit être compris entre 0 et 15 (reçu : {max_distance})")
+        self.max_distance = max_distance
+        self.shingle_size = shingle_size
+        self._band_bits = self.BITS // (max_distance + 1)
+    
+    def fingerprint(self, text: str) -> int:
+        """Empreinte SimHash 64 bits du texte (fragments de `shingle_size` mots)."""
+        words = self._WORD_RE.findall(text.lower())
+        if not words:
+            return 0
+        size = min(self.shingle_size, len(words))
+        shingles = {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+        
+        hashes = np.array(
+            [hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest() for s in shingles]
+        )
+        # Une ligne de 64 bits par fragment : un bit de l'empreinte vaut 1
+        # si la majorité des fragments a ce bit à 1
+        bits = np.unpackbits(np.frombuffer(hashes.tobytes(), dtype=np.uint8).reshape(-1, 8), axis=1)
+        majority = (2 * bits.sum(axis=0) > len(shingles)).astype(np.uint8)
+        return int.from_bytes(np.packbits(majority).tobytes(), "big")
+    
+    def cluster(self, texts: List[str]) -> List[str]:
+        """
+        Identifiant de groupe de chaque texte.
+        
+        L'identifiant est l'empreinte (hexadécimale) du premier texte du groupe :
+        il est stable d'un cycle à l'autre pour une même dépêche.
+        """
+        fingerprints = [self.fingerprint(text) for text in texts]
+        parent = list(range(len(texts)))
+        
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        mask = (1 << self._band_bits) - 1
+        buckets = defaultdict(list)
+        for i, fp in enumerate(fingerprints):
+            for band in range(self.max_distance + 1):
+                buckets[(band, (fp >> (band * self._band_bits)) & mask)].append(i)
+        
+        for members in buckets.values():
+            for position, j in enumerate(members):
+                for i in members[:position]:
+                    if find(i) == find(j):
+                        continue
+                    if bin(fingerprints[i] ^ fingerprints[j]).count("1") <= self.max_distance:
+                        # Le plus ancien texte reste représentant du groupe
+                        root_i, root_j = find(i), find(j)
+                        parent[max(root_i, root_j)] = min(root_i, root_j)
+        
+        return [f"{fingerprints[find(i)]:016x}" for i in range(len(texts))]
+    
+    def cluster_articles(self, articles: List[Article]) -> Dict[str, List[Article]]:
+        """
+        Groupe les articles et renseigne leur cluster_id (mutation).
+        
+        Returns:
+            {cluster_id: articles du groupe}, dans l'ordre de première apparition ;
+            le premier article de chaque groupe en est le représentant
+        """
+        cluster_ids = self.cluster([article.get_text_for_analysis() for article in articles])
+        
+        clusters = {}
+        for article, cluster_id in zip(articles, cluster_ids):
+            article.cluster_id = cluster_id
+            clusters.setdefault(cluster_id, []).append(article)
+        return clusters
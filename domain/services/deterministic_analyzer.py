@@ -0,0 +1,35 @@
+# domain/services/deterministic_analyzer.py
+
+import hashlib
+from typing import List
+
+from domain.entities.probabilities import LABELS
+from domain.entities.sentiment import SentimentResult
+from domain.services.analyzer_protocol import TextBatchAnalyzer
+
+
+class DeterministicSentimentAnalyzer(TextBatchAnalyzer):
+    """
+    Analyseur factice, rapide et déterministe (sans torch ni modèle).
+    
+    Les probabilités sont dérivées d'un hash du texte : un même texte donne
+    toujours le même SentimentResult. Sert aux tests, aux essais à blanc et
+    aux mesures du pipeline (scraping, base, GUI) sans coût d'inférence.
+    """
+    
+    def warmup(self):
+        pass  # Rien à charger
+    
+    def analyze_texts(self, texts: List[str], verbose: bool = False) -> List[SentimentResult]:
+        return [self._score(text) for text in texts]
+    
+    def _score(self, text: str) -> SentimentResult:
+        digest = hashlib.sha256(text.encode("utf-8")).digest()
+        
+        # Trois poids pseudo-aléatoires (1..256) normalisés en probabilités
+        weights = [digest[i] + 1 for i in range(len(LABELS))]
+        total = sum(weights)
+        probabilities = {label: w / total for label, w in zip(LABELS, weights)}
+        
+        label = max(probabilities, key=probabilities.get)
+        return SentimentResult(label=label, score=probabilities[label], probabilities=probabilities)
@@ -0,0 +1,115 @@
+# domain/services/inference_config.py
+
+import json
+import os
+from dataclasses import asdict, dataclass, fields
+from typing import Mapping, Optional
+
+from domain.services.project_paths import resolve_project_path
+
+
+# Fichier de configuration (JSON) ; son chemin peut être changé par variable
+CONFIG_FILE_ENV = "MARKET_SENTIMENT_CONFIG"
+DEFAULT_CONFIG_FILE = "data/inference_config.json"
+
+# Une variable d'environnement par réglage : MARKET_SENTIMENT_<NOM EN MAJUSCULES>
+# (ex : MARKET_SENTIMENT_INTRA_OP_THREADS=4)
+ENV_PREFIX = "MARKET_SENTIMENT_"
+
+_TRUE = {"1", "true", "yes", "on", "oui"}
+_FALSE = {"0", "false", "no", "off", "non"}
+
+
+@dataclass
+class InferenceConfig:
+    """
+    Réglages d'exécution de FinBERT.
+    
+    Priorité : arguments du constructeur de l'analyseur > variables
+    d'environnement > fichier JSON > valeurs par défaut ci-dessous.
+    """
+    intra_op_threads: Optional[int] = None  # torch.set_num_threads (None = choix de torch)
+    inter_op_threads: Optional[int] = None  # torch.set_num_interop_threads
+    inference_mode: bool = True  # torch.inference_mode plutôt que torch.no_grad
+    compile: bool = False  # torch.compile du modèle (compilation au premier lot)
+    batch_size: Optional[int] = None  # None : mesure de l'autotuner, sinon 16
+    max_length: int = 512
+    autotune: bool = False  # Mesure des meilleurs réglages de lot au warmup (si absents)
+    embeddings: bool = False  # Embeddings (dernière couche, moyenne) joints aux résultats
+    warmup: bool = True  # Préchargement du modèle en arrière-plan au lancement de la GUI
+    
+    def __post_init__(self):
+        for name in ("intra_op_threads", "inter_op_threads"):
+            value = getattr(self, name)
+            if value is not None and value < 1:
+                raise ValueError(f"{name} doit être >= 1 (reçu : {value})")
+    
+    @classmethod
+    def from_dict(cls, data: Mapping) -> 'InferenceConfig':
+        """Crée une configuration depuis un dictionnaire (clés = noms des champs)."""
+        known = {field.name for field in fields(cls)}
+        unknown = set(data) - known
+        if unknown:
+            raise ValueError(f"Réglages inconnus : {', '.join(sorted(unknown))}")
+        return cls(**{name: cls._parse(name, value) for name, value in data.items()})
+    
+    @classmethod
+    def load(cls, path: Optional[str] = None, environ: Optional[Mapping] = None) -> 'InferenceConfig':
+        """
+        Lit la configuration : fichier JSON (s'il existe) puis environnement.
+        
+        Args:
+            path: Fichier JSON (défaut : $MARKET_SENTIMENT_CONFIG ou data/inference_config.json)
+            environ: Variables d'environnement (défaut : os.environ)
+        """
+        environ = os.environ if environ is None else environ
+        
+        values = {}
+        config_file = resolve_project_path(path or environ.get(CONFIG_FILE_ENV) or DEFAULT_CONFIG_FILE)
+        if config_file.exists():
+            with open(config_file, "r", encoding="utf-8") as f:
+                values.update(json.load(f))
+        
+        for field in fields(cls):
+            raw = environ.get(ENV_PREFIX + field.name.upper())
+            if raw not in (None, ""):
+                values[field.name] = raw
+        
+        return cls.from_dict(values)
+    
+    @classmethod
+    def _parse(cls, name: str, value):
+        """Convertit une valeur (texte d'environnement ou JSON) dans le type du champ."""
+        if value is None:
+            return None
+        if name in ("inference_mode", "compile", "autotune", "embeddings", "warmup"):
+            if isinstance(value, bool):
+                return value
+            text = str(value).strip().lower()
+            if text in _TRUE:
+                return True
+            if text in _FALSE:
+                return False
+            raise ValueError(f"{name} : booléen attendu (reçu : {value})")
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{name} : entier attendu (reçu : {value})") from None
+    
+    def replace(self, **overrides) -> 'InferenceConfig':
+        """Copie de la configuration, les valeurs non None de `overrides` remplaçant les siennes."""
+        values = asdict(self)
+        values.update({name: value for name, value in overrides.items() if value is not None})
+        return InferenceConfig(**values)
+    
+    def describe(self) -> str:
+        """Résumé d'une ligne pour les logs."""
+        auto = lambda value: value if value is not None else "auto"
+        return (
+            f"threads intra={auto(self.intra_op_threads)} inter={auto(self.inter_op_threads)}, "
+            f"{'inference_mode' if self.inference_mode else 'no_grad'}, "
+            f"compile={'oui' if self.compile else 'non'}, "
+            f"autotune={'oui' if self.autotune else 'non'}, "
+            f"embeddings={'oui' if self.embeddings else 'non'}, "
+            f"batch_size={auto(self.batch_size)}, max_length={self.max_length}"
+        )
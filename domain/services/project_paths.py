@@ -0,0 +1,26 @@
+# domain/services/project_paths.py
+
+from pathlib import Path
+from typing import Union
+
+
+# Racine du projet (domain/services/project_paths.py → racine)
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+DATA_DIR = PROJECT_ROOT / "data"
+
+
+def resolve_project_path(path: Union[str, Path]) -> Path:
+    """Résout un chemin relatif depuis la racine du projet (chemin absolu : inchangé)."""
+    path = Path(path)
+    if path.is_absolute():
+        return path
+    return PROJECT_ROOT / path
+
+
+def data_file(name: Union[str, Path]) -> str:
+    """
+    Chemin d'un fichier de données : relatif à <racine>/data (dossier créé au
+    besoin), ou chemin absolu inchangé.
+    """
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    return str(DATA_DIR / name)
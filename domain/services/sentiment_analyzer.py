@@ -1,19 +1,56 @@
 # domain/services/sentiment_analyzer.py
 
-import torch
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
-from typing import List
+import queue
+import re
+import threading
+import numpy as np
+from pathlib import Path
+from transformers import AutoConfig, AutoTokenizer, AutoModelForSequenceClassification
+
+try:
+    import torch
+except ImportError:  # Backend ONNX avec un modèle déjà exporté : torch n'est pas requis
+    torch = None
+from typing import Iterator, List, Optional, Tuple
 from domain.entities.article import Article
+from domain.entities.probabilities import LABELS, probability_matrix, probability_views
 from domain.entities.sentiment import SentimentResult
+from domain.services.analyzer_protocol import TextBatchAnalyzer
+from domain.services.batch_autotuner import BatchAutotuner
+from domain.services.inference_config import InferenceConfig
+from domain.services.project_paths import resolve_project_path
 
 
-class FinBERTSentimentAnalyzer:
+class FinBERTSentimentAnalyzer(TextBatchAnalyzer):
     """
     Service métier : Analyse de sentiment financier avec FinBERT.
     
     Responsabilité unique : Analyser du texte et retourner un sentiment.
     """
     
+    MODEL_NAME = "ProsusAI/finbert"
+    MAX_LENGTH = 512  # Limite FinBERT (tokens par texte)
+    
+    # Stratégies de troncature des textes plus longs que max_length :
+    # - "head"      : début du texte (titre puis premiers paragraphes)
+    # - "head_tail" : un quart de début + trois quarts de fin (conclusion)
+    # - "title"     : titre seul pour les articles (mode rapide)
+    TRUNCATION_STRATEGIES = ("head", "head_tail", "title")
+    
+    # Poids quantifiés int8 mis en cache (relatif à la racine du projet)
+    QUANTIZED_WEIGHTS_PATH = "data/models/finbert-int8.pt"
+    
+    # Backends d'inférence disponibles et modèle ONNX exporté
+    BACKENDS = ("torch", "onnx")
+    ONNX_MODEL_PATH = "data/models/finbert.onnx"
+    
+    # Réglages de lot sans argument, configuration ni mesure de l'autotuner
+    DEFAULT_BATCH_SIZE = 16
+    DEFAULT_MAX_TOKENS_PER_BATCH = 8192
+    
+    # Nombre de textes tokenisés et triés ensemble par le thread de préparation
+    SORT_POOL_SIZE = 256
+    
     # Mapping anglais → français (constant de classe)
     LABEL_TRANSLATION = {
         "negative": "négatif",
@@ -21,13 +58,279 @@ class FinBERTSentimentAnalyzer:
         "positive": "positif"
     }
     
-    def __init__(self):
-        """Initialise le modèle FinBERT."""
+    def __init__(
+        self,
+        batch_size: Optional[int] = None,
+        max_tokens_per_batch: Optional[int] = None,
+        cache=None,
+        quantize: bool = False,
+        quantized_weights_path: Optional[str] = None,
+        backend: str = "torch",
+        onnx_model_path: Optional[str] = None,
+        prefetch_batches: int = 2,
+        long_document: bool = False,
+        window_overlap: int = 128,
+        truncation: str = "head",
+        max_length: Optional[int] = None,
+        return_embeddings: Optional[bool] = None,
+        config: Optional[InferenceConfig] = None,
+    ):
+        """
+        Initialise le modèle FinBERT.
+        
+        Args:
+            batch_size: Nombre maximal de textes envoyés au modèle en une passe
+                (défaut : configuration, sinon mesure de l'autotuner, sinon 16)
+            max_tokens_per_batch: Budget de tokens d'un lot, padding compris
+                (nb_textes × longueur du plus long texte du lot ; défaut :
+                mesure de l'autotuner, sinon 8192)
+            cache: Cache d'inférence optionnel (ex : InferenceCache) exposant
+                make_key / get_many / put_many
+            quantize: Active la quantification dynamique int8 des couches
+                linéaires (inférence CPU plus rapide, légère perte de précision)
+            quantized_weights_path: Fichier des poids int8 (sauvegardés au
+                premier chargement, relus ensuite)
+            backend: "torch" (PyTorch) ou "onnx" (ONNX Runtime, CPU)
+            onnx_model_path: Fichier .onnx (exporté au premier chargement)
+            prefetch_batches: Lots préparés d'avance par le thread de
+                tokenisation pendant l'inférence (0 = tout séquentiel)
+            long_document: Analyse les textes longs par fenêtres glissantes de
+                max_length tokens au lieu de les tronquer
+            window_overlap: Tokens communs à deux fenêtres consécutives
+            truncation: Stratégie de troncature (voir TRUNCATION_STRATEGIES)
+            max_length: Tokens par texte, spéciaux compris (défaut : configuration,
+                MAX_LENGTH ; ex : 128 pour un rafraîchissement rapide sur les titres)
+            return_embeddings: Joint à chaque résultat l'embedding du texte
+                (moyenne de la dernière couche cachée, backend torch ; défaut :
+                configuration). Les résultats du cache n'en ayant pas, le cache
+                n'est pas consulté dans ce mode.
+            config: Réglages d'exécution (threads, inference_mode, torch.compile...) ;
+                défaut : InferenceConfig.load() (fichier JSON + environnement).
+                batch_size, max_length et return_embeddings, s'ils sont passés,
+                la remplacent.
+        """
+        config = (config or InferenceConfig.load()).replace(
+            batch_size=batch_size, max_length=max_length, embeddings=return_embeddings
+        )
+        max_length = config.max_length
+        if not 16 <= max_length <= self.MAX_LENGTH:
+            raise ValueError(
+                f"max_length doit être compris entre 16 et {self.MAX_LENGTH} (reçu : {max_length})"
+            )
+        if truncation not in self.TRUNCATION_STRATEGIES:
+            raise ValueError(
+                f"truncation inconnue : {truncation} "
+                f"(attendu : {', '.join(self.TRUNCATION_STRATEGIES)})"
+            )
+        if long_document and truncation != "head":
+            raise ValueError("Le mode long_document ne tronque pas : truncation doit rester \"head\"")
+        if backend not in self.BACKENDS:
+            raise ValueError(f"backend inconnu : {backend} (attendu : {', '.join(self.BACKENDS)})")
+        if quantize and backend != "torch":
+            raise ValueError("La quantification int8 n'est disponible qu'avec le backend torch")
+        if config.embeddings and backend != "torch":
+            raise ValueError("Les embeddings ne sont disponibles qu'avec le backend torch")
+        if long_document and not 0 <= window_overlap < max_length // 2:
+            raise ValueError(
+                f"window_overlap doit être compris entre 0 et {max_length // 2 - 1} "
+                f"(reçu : {window_overlap})"
+            )
+        self.cache = cache
+        self.prefetch_batches = prefetch_batches
+        self.quantize = quantize
+        self.long_document = long_document
+        self.window_overlap = window_overlap
+        self.truncation = truncation
+        self.max_length = max_length
+        self.return_embeddings = config.embeddings
+        # Les résultats int8, fenêtrés ou tronqués autrement (titre seul compris)
+        # diffèrent : clé de cache distincte
+        self.model_id = self.MODEL_NAME
+        if quantize:
+            self.model_id += "+int8"
+        if truncation != "head" or max_length != self.MAX_LENGTH:
+            self.model_id += f"+{truncation}{max_length}"
+        if long_document:
+            self.model_id += f"+window{window_overlap}"
+        
+        # Réglages de lot : arguments et configuration d'abord, puis mesures
+        # de l'autotuner pour cette machine, puis valeurs par défaut
+        self._explicit_batch_size = config.batch_size is not None
+        self._explicit_token_budget = max_tokens_per_batch is not None
+        tuned = None
+        if not (self._explicit_batch_size and self._explicit_token_budget):
+            tuned = BatchAutotuner.lookup(self.model_id, backend)
+        self._tuned = tuned is not None
+        tuned = tuned or {}
+        if config.batch_size is None:
+            config = config.replace(batch_size=tuned.get("batch_size", self.DEFAULT_BATCH_SIZE))
+        if max_tokens_per_batch is None:
+            max_tokens_per_batch = tuned.get("max_tokens_per_batch", self.DEFAULT_MAX_TOKENS_PER_BATCH)
+        
+        if config.batch_size < 1:
+            raise ValueError(f"batch_size doit être >= 1 (reçu : {config.batch_size})")
+        if max_tokens_per_batch < max_length:
+            raise ValueError(
+                f"max_tokens_per_batch doit être >= {max_length} "
+                f"(reçu : {max_tokens_per_batch})"
+            )
+        self.config = config
+        self.batch_size = config.batch_size
+        self.max_tokens_per_batch = max_tokens_per_batch
+        
+        self.backend = backend
+        self.quantized_weights_path = resolve_project_path(
+            quantized_weights_path or self.QUANTIZED_WEIGHTS_PATH
+        )
+        self.onnx_model_path = resolve_project_path(onnx_model_path or self.ONNX_MODEL_PATH)
+        
+        self._apply_threads()
+        print(f"[FinBERT] Configuration : {config.describe()}, "
+              f"max_tokens_per_batch={max_tokens_per_batch}"
+              f"{' (autotune)' if self._tuned else ''}")
+        
         print("[FinBERT] Chargement du modèle...")
-        self.tokenizer = AutoTokenizer.from_pretrained("ProsusAI/finbert")
-        self.model = AutoModelForSequenceClassification.from_pretrained("ProsusAI/finbert")
-        self.id2label = self.model.config.id2label
-        print("[FinBERT] Modèle chargé avec succès")
+        self.tokenizer = AutoTokenizer.from_pretrained(self.MODEL_NAME)
+        
+        if backend == "onnx":
+            self.model = None
+            self.onnx_session = self._load_onnx_session()
+            self.id2label = AutoConfig.from_pretrained(self.MODEL_NAME).id2label
+            variant = "onnx"
+        else:
+            self.model = self._load_quantized_model() if quantize else self._load_model()
+            self.model.eval()
+            self.id2label = self.model.config.id2label
+            variant = "int8" if quantize else "fp32"
+            if config.compile:
+                # Formes dynamiques : la longueur des lots varie d'un lot à l'autre
+                self.model = torch.compile(self.model, dynamic=True)
+                variant += ", compilé"
+        # Colonne du modèle correspondant à chaque label de LABELS
+        model_labels = [self.LABEL_TRANSLATION[self.id2label[i]] for i in range(len(self.id2label))]
+        self._label_columns = [model_labels.index(label) for label in LABELS]
+        # Une inférence à la fois : le tokenizer HF n'est pas réentrant, et le
+        # préchargement tourne en arrière-plan pendant les analyses de la GUI
+        self._inference_lock = threading.RLock()
+        print(f"[FinBERT] Modèle chargé avec succès ({variant})")
+    
+    def _apply_threads(self):
+        """Fixe les threads torch demandés par la configuration."""
+        if torch is None:
+            return
+        if self.config.intra_op_threads:
+            torch.set_num_threads(self.config.intra_op_threads)
+        if self.config.inter_op_threads:
+            try:
+                torch.set_num_interop_threads(self.config.inter_op_threads)
+            except RuntimeError:
+                # Fixable une seule fois, avant tout travail parallèle de torch
+                print("[FinBERT] Threads inter-op déjà fixés, réglage ignoré")
+    
+    def _load_model(self):
+        """Charge le modèle FinBERT en fp32."""
+        if torch is None:
+            raise ImportError("torch est requis pour charger le modèle FinBERT")
+        return AutoModelForSequenceClassification.from_pretrained(self.MODEL_NAME)
+    
+    @staticmethod
+    def _quantize(model):
+        """Quantification dynamique int8 des couches linéaires."""
+        return torch.ao.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    
+    def _load_quantized_model(self):
+        """
+        Charge le modèle quantifié int8.
+        
+        Premier chargement : quantification des poids fp32 puis sauvegarde.
+        Chargements suivants : squelette vide (sans poids fp32) quantifié,
+        puis lecture directe des poids int8 sauvegardés.
+        """
+        path = self.quantized_weights_path
+        
+        if path.exists():
+            print(f"[FinBERT] Lecture des poids int8 : {path}")
+            config = AutoConfig.from_pretrained(self.MODEL_NAME)
+            model = self._quantize(AutoModelForSequenceClassification.from_config(config))
+            model.load_state_dict(torch.load(path))
+            return model
+        
+        print("[FinBERT] Quantification int8 du modèle...")
+        model = self._quantize(self._load_model())
+        path.parent.mkdir(parents=True, exist_ok=True)
+        torch.save(model.state_dict(), path)
+        print(f"[FinBERT] Poids int8 sauvegardés : {path}")
+        return model
+    
+    def _load_onnx_session(self):
+        """
+        Ouvre une session ONNX Runtime (CPU).
+        
+        Le modèle est exporté une seule fois depuis PyTorch puis relu depuis
+        le fichier .onnx : les chargements suivants n'utilisent plus torch.
+        """
+        import onnxruntime
+        
+        path = self.onnx_model_path
+        if not path.exists():
+            self._export_onnx(path)
+        
+        print(f"[FinBERT] Session ONNX Runtime : {path}")
+        return onnxruntime.InferenceSession(str(path), providers=["CPUExecutionProvider"])
+    
+    def _export_onnx(self, path: Path):
+        """Exporte FinBERT au format ONNX (axes batch et séquence dynamiques)."""
+        print("[FinBERT] Export ONNX du modèle...")
+        model = self._load_model()
+        model.eval()
+        
+        sample = self.tokenizer(["export onnx", "finbert"], return_tensors="pt", padding=True)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        torch.onnx.export(
+            model,
+            (sample["input_ids"], sample["attention_mask"]),
+            str(path),
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "logits": {0: "batch"},
+            },
+            opset_version=17,
+        )
+        print(f"[FinBERT] Modèle ONNX sauvegardé : {path}")
+    
+    def warmup(self):
+        """
+        Lance une inférence factice (hors cache) pour initialiser le modèle.
+        
+        Avec `autotune` activé dans la configuration et sans mesure enregistrée
+        pour cette machine, lance aussi l'autotuner (voir autotune()).
+        """
+        with self._inference_lock:
+            self._run_model(["Warmup: markets opened flat today."])
+        if self.config.autotune and not self._tuned:
+            self.autotune()
+    
+    def autotune(self) -> dict:
+        """
+        Mesure les meilleurs réglages de lot sur cette machine, les enregistre
+        (data/batch_tuning.json) et les applique, sauf valeurs imposées.
+        
+        Les essais se partagent le verrou d'inférence avec les analyses en
+        cours ; les nouveaux réglages ne sont appliqués qu'entre deux appels.
+        """
+        tuning = BatchAutotuner(self, lock=self._inference_lock).tune()
+        with self._inference_lock:
+            if not self._explicit_batch_size:
+                self.batch_size = tuning["batch_size"]
+            if not self._explicit_token_budget:
+                self.max_tokens_per_batch = tuning["max_tokens_per_batch"]
+            self._tuned = True
+        return tuning
     
     def analyze_text(self, text: str) -> SentimentResult:
         """
@@ -39,89 +342,443 @@ class FinBERTSentimentAnalyzer:
         Returns:
             SentimentResult avec label, score et probabilités
         """
-        # Tokenisation et inférence
-        inputs = self.tokenizer(
-            text, 
-            return_tensors="pt", 
-            truncation=True, 
-            padding=True,
-            max_length=512  # Limite FinBERT
-        )
+        return self.analyze_texts([text])[0]
+    
+    def analyze_texts(self, texts: List[str], verbose: bool = False) -> List[SentimentResult]:
+        """
+        Analyse une liste de textes par lots.
         
-        with torch.no_grad():  # Optimisation : pas de gradient
-            outputs = self.model(**inputs)
+        Les textes sont triés par longueur en tokens puis regroupés sous un
+        budget de tokens (`max_tokens_per_batch`), pour que les textes courts
+        (résumés Yahoo) ne soient pas complétés à la longueur des longs
+        articles CNBC.
         
-        # Calcul des probabilités
-        probs = torch.nn.functional.softmax(outputs.logits, dim=1)[0]
+        Args:
+            texts: Textes à analyser
+            verbose: Affiche la part servie par le cache et la progression des lots
+        
+        Returns:
+            Un SentimentResult par texte, dans l'ordre d'entrée
+        """
+        return self._infer(texts, verbose)
+    
+    def predict_proba(self, texts: List[str]) -> np.ndarray:
+        """
+        Probabilités des textes sous forme de matrice.
+        
+        Returns:
+            Matrice (n, 3) float32, colonnes dans l'ordre de LABELS
+            (négatif, neutre, positif), lignes dans l'ordre d'entrée
+        """
+        return self._infer_matrix(texts)
+    
+    def _infer(self, texts: List[str], verbose: bool = False) -> List[SentimentResult]:
+        """Résultats des textes : vues sur une seule matrice de probabilités."""
+        if self.return_embeddings:
+            # Le cache ne conserve pas les embeddings : tout passe par le modèle
+            with self._inference_lock:
+                return self._build_results(*self._run_model(texts, verbose))
+        return self._build_results(self._infer_matrix(texts, verbose))
+    
+    def _infer_matrix(self, texts: List[str], verbose: bool = False) -> np.ndarray:
+        """Consulte le cache puis lance le modèle sur les seuls textes manquants."""
+        if self.cache is None:
+            with self._inference_lock:
+                return self._run_model(texts, verbose)[0]
         
-        # Prédiction = argmax
-        predicted_idx = torch.argmax(probs).item()
+        keys = [self.cache.make_key(text, self.model_id) for text in texts]
+        cached = self.cache.get_many(keys)
         
-        # Traduction du label
-        label_en = self.id2label[predicted_idx]
-        label_fr = self.LABEL_TRANSLATION[label_en]
+        probs = np.zeros((len(texts), len(LABELS)), dtype=np.float32)
+        hits = [i for i, key in enumerate(keys) if key in cached]
+        misses = [i for i, key in enumerate(keys) if key not in cached]
+        if verbose:
+            print(f"  → Cache : {len(hits)}/{len(texts)} textes déjà analysés")
         
-        # Score de confiance
-        confidence = probs[predicted_idx].item()
+        if hits:
+            probs[hits] = probability_matrix(cached[keys[i]]["probabilities"] for i in hits)
+        if misses:
+            with self._inference_lock:
+                probs[misses] = self._run_model([texts[i] for i in misses], verbose)[0]
+            computed = self._build_results(probs[misses])
+            self.cache.put_many({keys[i]: result.to_dict() for i, result in zip(misses, computed)})
+        return probs
+    
+    def _run_model(self, texts: List[str], verbose: bool = False) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Lance l'inférence lot par lot (ordre d'entrée conservé).
         
-        # Dictionnaire des probabilités (en français)
-        probabilities = {
-            self.LABEL_TRANSLATION[self.id2label[i]]: probs[i].item()
-            for i in range(len(probs))
-        }
+        Returns:
+            (matrice (n, 3) float32, colonnes dans l'ordre de LABELS,
+             embeddings (n, dim) float32 ou None sans return_embeddings)
+        """
+        if not texts:
+            return np.zeros((0, len(LABELS)), dtype=np.float32), None
+        
+        # Somme des probabilités (et embeddings) de chaque texte, pondérée par la
+        # longueur de ses fenêtres (une seule fenêtre de poids 1 sans mode long)
+        sums = np.zeros((len(texts), len(self.id2label)))
+        embedding_sums = None
+        weights = np.zeros(len(texts))
+        done = 0
+        for indices, lengths, inputs in self._prepared_batches(texts):
+            probs, embeddings = self._forward(inputs)
+            np.add.at(sums, indices, probs * lengths[:, None])
+            np.add.at(weights, indices, lengths)
+            if embeddings is not None:
+                if embedding_sums is None:
+                    embedding_sums = np.zeros((len(texts), embeddings.shape[1]))
+                np.add.at(embedding_sums, indices, embeddings * lengths[:, None])
+            
+            done += len(indices)
+            if verbose:  # Affichage de progression
+                if self.long_document:
+                    print(f"  → {done} fenêtres analysées")
+                else:
+                    print(f"  → {done}/{len(texts)} articles analysés")
         
-        return SentimentResult(
-            label=label_fr,
-            score=confidence,
-            probabilities=probabilities
+        # Colonnes du modèle → ordre de LABELS
+        probs = (sums / weights[:, None])[:, self._label_columns].astype(np.float32)
+        if embedding_sums is None:
+            return probs, None
+        return probs, (embedding_sums / weights[:, None]).astype(np.float32)
+    
+    def _prepare_batches(self, texts: List[str]) -> Iterator[Tuple[List[int], np.ndarray, dict]]:
+        """
+        Tokenise, planifie et complète les lots, par groupes de SORT_POOL_SIZE textes.
+        
+        En mode long, les fenêtres de tous les textes du groupe sont planifiées
+        ensemble : un texte peut donc être réparti sur plusieurs lots.
+        
+        Yields:
+            (indice du texte de chaque séquence dans `texts`,
+             poids de chaque séquence, entrées du modèle prêtes)
+        """
+        for offset in range(0, len(texts), self.SORT_POOL_SIZE):
+            encoded, owners = self._segment(texts[offset:offset + self.SORT_POOL_SIZE])
+            batches = self._plan_batches(
+                [len(ids) for ids in encoded],
+                self.max_tokens_per_batch,
+                self.batch_size
+            )
+            for indices in batches:
+                inputs = self._pad([encoded[i] for i in indices])
+                if self.long_document:
+                    lengths = np.array([len(encoded[i]) for i in indices], dtype=float)
+                else:
+                    lengths = np.ones(len(indices))
+                yield [offset + owners[i] for i in indices], lengths, inputs
+    
+    def _prepared_batches(self, texts: List[str]) -> Iterator[Tuple[List[int], np.ndarray, dict]]:
+        """
+        Lots prêts pour l'inférence, préparés sur un thread d'arrière-plan.
+        
+        La tokenisation du lot N+1 se fait pendant la passe du modèle sur le
+        lot N, via une file bornée à `prefetch_batches` lots.
+        """
+        if self.prefetch_batches < 1:
+            yield from self._prepare_batches(texts)
+            return
+        
+        prepared = queue.Queue(maxsize=self.prefetch_batches)
+        stop = threading.Event()
+        end = object()
+        
+        def put(item) -> bool:
+            # Attente interrompue si le consommateur s'est arrêté
+            while not stop.is_set():
+                try:
+                    prepared.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+        
+        def producer():
+            try:
+                for item in self._prepare_batches(texts):
+                    if not put(item):
+                        return
+                put(end)
+            except Exception as e:
+                put(e)
+        
+        thread = threading.Thread(target=producer, name="finbert-tokenizer", daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = prepared.get()
+                if item is end:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+            thread.join()
+    
+    def _segment(self, texts: List[str]) -> Tuple[List[List[int]], List[int]]:
+        """
+        Découpe les textes en séquences pour le modèle.
+        
+        Returns:
+            (séquences de tokens, indice du texte d'origine de chaque séquence)
+        """
+        if not self.long_document:
+            return self._encode(texts), list(range(len(texts)))
+        
+        encoded = self._encode_windows(texts)
+        return encoded["input_ids"], list(encoded["overflow_to_sample_mapping"])
+    
+    def _encode_windows(self, texts: List[str]) -> dict:
+        """
+        Tokenise les textes en fenêtres glissantes de max_length tokens.
+        
+        Le découpage est fait par le tokenizer en une seule passe pour tous
+        les textes ; `overflow_to_sample_mapping` relie chaque fenêtre à son texte.
+        """
+        return self.tokenizer(
+            texts,
+            truncation=True,
+            max_length=self.max_length,
+            stride=self.window_overlap,
+            return_overflowing_tokens=True
+        )
+    
+    def _encode(self, texts: List[str]) -> List[List[int]]:
+        """Tokenise les textes sans padding (tronqués à max_length selon la stratégie)."""
+        if self.truncation != "head_tail":
+            return self.tokenizer(
+                texts,
+                truncation=True,
+                max_length=self.max_length
+            )["input_ids"]
+        
+        # Début + fin : [CLS] premier quart … trois derniers quarts [SEP]
+        encoded = self.tokenizer(texts, verbose=False)["input_ids"]
+        head = self.max_length // 4
+        tail = self.max_length - head
+        return [
+            ids if len(ids) <= self.max_length else ids[:head] + ids[-tail:]
+            for ids in encoded
+        ]
+    
+    def _pad(self, batch_ids: List[List[int]]) -> dict:
+        """Complète un lot à sa propre longueur maximale (tenseurs du backend)."""
+        return self.tokenizer.pad(
+            {"input_ids": batch_ids},
+            return_tensors="np" if self.backend == "onnx" else "pt"
         )
     
-    def analyze_article(self, article: Article) -> Article:
+    def _predict(self, inputs: dict) -> np.ndarray:
+        """Lance une passe du modèle sur un lot complété (probabilités, colonnes du modèle)."""
+        return self._forward(inputs)[0]
+    
+    def _forward(self, inputs: dict) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+        """
+        Passe du modèle : probabilités (colonnes du modèle) et, avec
+        return_embeddings, moyenne de la dernière couche cachée sur les
+        tokens réels du lot (padding exclu).
         """
-        Analyse un article et met à jour ses champs de sentiment.
+        if self.backend == "onnx":
+            return self._predict_onnx(inputs), None
         
-        Args:
-            article: Article à analyser
+        # Optimisation : pas de gradient (inference_mode évite aussi le suivi des versions)
+        grad_context = torch.inference_mode if self.config.inference_mode else torch.no_grad
+        with grad_context():
+            outputs = self.model(**inputs, output_hidden_states=self.return_embeddings)
+            
+            embeddings = None
+            if self.return_embeddings:
+                mask = inputs["attention_mask"].unsqueeze(-1).to(outputs.hidden_states[-1].dtype)
+                pooled = (outputs.hidden_states[-1] * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+                embeddings = pooled.float().numpy()
+        
+        # Une ligne de probabilités par texte
+        return torch.nn.functional.softmax(outputs.logits, dim=1).float().numpy(), embeddings
+    
+    def _predict_onnx(self, inputs: dict) -> np.ndarray:
+        """Passe du modèle via ONNX Runtime (softmax en NumPy)."""
+        logits = self.onnx_session.run(["logits"], {
+            "input_ids": inputs["input_ids"].astype(np.int64),
+            "attention_mask": inputs["attention_mask"].astype(np.int64),
+        })[0]
+        
+        # Softmax numériquement stable
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return exp / exp.sum(axis=1, keepdims=True)
+    
+    @staticmethod
+    def _plan_batches(lengths: List[int], max_tokens: int, max_batch_size: int) -> List[List[int]]:
+        """
+        Regroupe des textes en lots sous un budget de tokens.
+        
+        Les indices sont triés par longueur : chaque lot contient des textes
+        de tailles voisines et son coût (nb_textes × plus grande longueur)
+        reste sous `max_tokens`. Un texte seul forme toujours un lot valide.
         
         Returns:
-            Article enrichi avec les données de sentiment
+            Liste de lots (listes d'indices dans `lengths`)
         """
-        text = article.get_text_for_analysis()
+        order = sorted(range(len(lengths)), key=lengths.__getitem__)
+        
+        batches = []
+        current = []
+        for i in order:
+            # Trié par longueur croissante : le texte courant est le plus long du lot
+            cost = (len(current) + 1) * lengths[i]
+            if current and (cost > max_tokens or len(current) >= max_batch_size):
+                batches.append(current)
+                current = []
+            current.append(i)
+        
+        if current:
+            batches.append(current)
         
-        if not text:
-            # Texte vide → sentiment neutre par défaut
-            sentiment = SentimentResult(
-                label="neutre",
-                score=1.0,
-                probabilities={"négatif": 0.0, "neutre": 1.0, "positif": 0.0}
+        return batches
+    
+    def _build_results(self, probs: np.ndarray, embeddings: Optional[np.ndarray] = None) -> List[SentimentResult]:
+        """
+        Construit les SentimentResult d'une matrice (n, 3) de probabilités.
+        
+        Argmax et score sont calculés en une opération pour tout le lot ;
+        les probabilités restent des vues sur la matrice (pas de dict par texte).
+        Les embeddings éventuels sont des lignes de leur matrice (n, dim).
+        """
+        predicted = probs.argmax(axis=1)
+        scores = probs[np.arange(len(probs)), predicted].tolist()
+        if embeddings is None:
+            embeddings = [None] * len(probs)
+        
+        return [
+            SentimentResult(label=LABELS[index], score=score, probabilities=view, embedding=embedding)
+            for index, score, view, embedding in zip(
+                predicted.tolist(), scores, probability_views(probs), embeddings
             )
+        ]
+    
+    def _article_text(self, article: Article) -> str:
+        """Texte analysé pour un article : titre seul en mode "title"."""
+        if self.truncation == "title":
+            return article.title.strip()
+        return article.get_text_for_analysis()
+
+
+class LexiconSentimentClassifier:
+    """
+    Classifieur rapide par lexique financier (sans modèle).
+    
+    Compte les mots positifs / négatifs (négations gérées) et en déduit un
+    sentiment avec une confiance :
+    - aucun mot de sentiment → neutre, confiance NEUTRAL_CONFIDENCE (faible :
+      aucun indice, le verdict doit revenir à FinBERT dans la cascade)
+    - mots d'une seule polarité → confiance croissante avec leur nombre,
+      plafonnée à MAX_CONFIDENCE (un lexique n'est jamais certain)
+    - polarités mélangées → confiance faible (cas ambigus, sarcasme...)
+    """
+    
+    POSITIVE_WORDS = {
+        # Anglais
+        "beat", "beats", "boost", "boosts", "bullish", "exceed", "exceeded", "exceeds",
+        "gain", "gains", "growth", "improve", "improved", "jump", "jumps", "outperform",
+        "profit", "profits", "rally", "rallies", "record", "rise", "rises", "soar", "soars",
+        "skyrocketing", "stellar", "strong", "surge", "surges", "upgrade", "upgraded",
+        # Français
+        "bénéfice", "bénéfices", "croissance", "dépasse", "dépassent", "excédent",
+        "hausse", "progresse", "progression", "rebond", "rebondit", "relève",
+        "solide", "solides",
+    }
+    NEGATIVE_WORDS = {
+        # Anglais
+        "bankruptcy", "bearish", "collapse", "cut", "cuts", "decline", "declines", "delay",
+        "delays", "disaster", "downgrade", "downgraded", "drop", "drops", "fall", "falls",
+        "fraud", "lawsuit", "layoffs", "loss", "losses", "miss", "misses", "plunge",
+        "plunges", "recall", "slump", "tumble", "tumbles", "weak",
+        # Français
+        "avertissement", "baisse", "chute", "déficit", "dégradation", "effondrement",
+        "faillite", "fraude", "licenciements", "perte", "pertes", "ralentissement",
+        "recul", "recule",
+    }
+    NEGATIONS = {"not", "no", "never", "without", "ne", "pas", "jamais", "sans"}
+    
+    # Sous la confiance minimale d'un texte avec indices (0.5) et sous tout seuil
+    # de cascade raisonnable : l'absence d'indice n'est pas un neutre sûr
+    NEUTRAL_CONFIDENCE = 0.4
+    # Confiance maximale (indices unanimes) : jamais de probabilités 0/1 en base
+    MAX_CONFIDENCE = 0.9
+    
+    _WORD_RE = re.compile(r"[a-zà-ÿ']+")
+    
+    def analyze_text(self, text: str) -> SentimentResult:
+        """Classe un texte et retourne un SentimentResult (tier "lexique")."""
+        words = self._WORD_RE.findall(text.lower())
+        
+        positive = negative = 0
+        for i, word in enumerate(words):
+            polarity = (word in self.POSITIVE_WORDS) - (word in self.NEGATIVE_WORDS)
+            if not polarity:
+                continue
+            # Négation dans les 3 mots précédents → polarité inversée
+            if any(w in self.NEGATIONS for w in words[max(0, i - 3):i]):
+                polarity = -polarity
+            if polarity > 0:
+                positive += 1
+            else:
+                negative += 1
+        
+        hits = positive + negative
+        if hits == 0:
+            label, confidence = "neutre", self.NEUTRAL_CONFIDENCE
         else:
-            sentiment = self.analyze_text(text)
+            polarity = (positive - negative) / hits
+            # Unanimité et nombre d'indices (plafonné à 3) augmentent la confiance
+            confidence = 0.5 + (self.MAX_CONFIDENCE - 0.5) * abs(polarity) * min(1.0, hits / 3)
+            label = "positif" if polarity > 0 else "négatif" if polarity < 0 else "neutre"
         
-        # Mise à jour de l'article (mutation)
-        article.sentiment_label = sentiment.label
-        article.sentiment_score = sentiment.score
-        article.sentiment_probas = sentiment.probabilities
+        # Le reste de la probabilité est réparti sur les deux autres labels
+        rest = (1.0 - confidence) / 2
+        probabilities = {name: rest for name in ("négatif", "neutre", "positif")}
+        probabilities[label] = confidence
         
-        return article
+        return SentimentResult(label=label, score=confidence, probabilities=probabilities, tier="lexique")
+    
+    def analyze_texts(self, texts: List[str]) -> List[SentimentResult]:
+        return [self.analyze_text(text) for text in texts]
+
+
+class CascadeSentimentAnalyzer(TextBatchAnalyzer):
+    """
+    Analyse en cascade : lexique rapide d'abord, FinBERT pour les cas difficiles.
     
-    def analyze_batch(self, articles: List[Article]) -> List[Article]:
+    Tous les textes passent par le classifieur rapide ; seuls ceux dont la
+    confiance est sous `threshold` sont envoyés (en un seul lot) à FinBERT.
+    L'étage retenu est enregistré dans SentimentResult.tier / Article.sentiment_tier.
+    """
+    
+    def __init__(self, accurate_analyzer, fast_classifier=None, threshold: float = 0.8):
         """
-        Analyse un lot d'articles.
-        
         Args:
-            articles: Liste d'articles à analyser
-        
-        Returns:
-            Articles enrichis avec sentiments
+            accurate_analyzer: Analyseur précis (FinBERTSentimentAnalyzer ou client distant)
+            fast_classifier: Classifieur rapide (défaut : LexiconSentimentClassifier)
+            threshold: Confiance minimale pour accepter le verdict du classifieur rapide
         """
-        print(f"[Analyse] Traitement de {len(articles)} articles...")
+        self.accurate_analyzer = accurate_analyzer
+        self.fast_classifier = fast_classifier or LexiconSentimentClassifier()
+        self.threshold = threshold
+    
+    def warmup(self):
+        if hasattr(self.accurate_analyzer, "warmup"):
+            self.accurate_analyzer.warmup()
+    
+    def analyze_texts(self, texts: List[str], verbose: bool = False) -> List[SentimentResult]:
+        """Analyse des textes : lexique, puis FinBERT sur les verdicts peu sûrs."""
+        results = self.fast_classifier.analyze_texts(texts)
         
-        for i, article in enumerate(articles, 1):
-            self.analyze_article(article)
-            
-            if i % 10 == 0:  # Affichage de progression
-                print(f"  → {i}/{len(articles)} articles analysés")
+        uncertain = [i for i, result in enumerate(results) if result.score < self.threshold]
+        accurate = self.accurate_analyzer.analyze_texts([texts[i] for i in uncertain], verbose=verbose)
+        for i, result in zip(uncertain, accurate):
+            result.tier = "finbert"
+            results[i] = result
         
-        print(f"[Analyse] ✓ {len(articles)} articles traités")
-        return articles
\ No newline at end of file
+        print(f"[Cascade] {len(texts) - len(uncertain)} lexique / {len(uncertain)} FinBERT")
+        return results
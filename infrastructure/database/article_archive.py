@@ -0,0 +1,227 @@
+# infrastructure/database/article_archive.py
+
+import gzip
+import json
+import os
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+from domain.services.project_paths import DATA_DIR
+
+
+class SegmentedArchive:
+    """
+    Archive des articles bruts scrapés : segments JSONL compressés (gzip), en ajout seul.
+    
+    Chaque cycle ajoute une ligne {"timestamp", "count", "articles"} au segment
+    courant (nouveau membre gzip : rien n'est relu ni réécrit), d'où un coût
+    proportionnel aux seuls nouveaux articles. Un segment est clos quand il
+    dépasse `max_segment_bytes` ou quand le jour change.
+    
+    index.json liste les segments (fichier, premier / dernier horodatage,
+    nombre de cycles et d'articles) : les lectures par période ne
+    décompressent que les segments concernés.
+    """
+    
+    INDEX_FILE = "index.json"
+    MAX_SEGMENT_BYTES = 8 * 1024 * 1024
+    
+    def __init__(
+        self,
+        archive_dir: Optional[str] = None,
+        max_segment_bytes: int = MAX_SEGMENT_BYTES,
+        legacy_path: Optional[str] = None,
+    ):
+        """
+        Args:
+            archive_dir: Dossier des segments (défaut : data/archive)
+            max_segment_bytes: Taille (compressée) au-delà de laquelle un segment est clos
+            legacy_path: Ancienne archive JSON unique, importée une seule fois
+        """
+        self.archive_dir = Path(archive_dir) if archive_dir else DATA_DIR / "archive"
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        self.max_segment_bytes = max_segment_bytes
+        self.index_path = self.archive_dir / self.INDEX_FILE
+        self._index = self._read_index()
+        
+        if legacy_path:
+            self.import_legacy(legacy_path)
+    
+    @property
+    def segments(self) -> List[Dict]:
+        """Entrées de l'index, de la plus ancienne à la plus récente."""
+        return list(self._index["segments"])
+    
+    @property
+    def imported(self) -> List[str]:
+        """Anciennes archives JSON déjà importées (noms de fichier)."""
+        return list(self._index["imported"])
+    
+    def _read_index(self) -> Dict:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"segments": [], "imported": []}
+    
+    def _write_index(self):
+        """Réécriture atomique de l'index (quelques lignes par segment)."""
+        tmp_path = self.index_path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self._index, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+    
+    def append(self, articles: list, timestamp: str):
+        """
+        Archive les articles d'un cycle.
+        
+        Args:
+            articles: Articles bruts (dictionnaires du spider)
+            timestamp: Horodatage du cycle ("AAAA-MM-JJ HH:MM:SS")
+        """
+        entry = {"timestamp": timestamp, "count": len(articles), "articles": articles}
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        
+        segment = self._current_segment(timestamp)
+        path = self.archive_dir / segment["file"]
+        with gzip.open(path, "at", encoding="utf-8") as f:
+            f.write(line)
+        
+        segment["last_timestamp"] = timestamp
+        segment["entries"] += 1
+        segment["articles"] += len(articles)
+        segment["bytes"] = path.stat().st_size
+        self._write_index()
+    
+    def _current_segment(self, timestamp: str) -> Dict:
+        """Segment où écrire : le dernier, sauf s'il est plein ou d'un autre jour."""
+        day = timestamp[:10]
+        segments = self._index["segments"]
+        if segments:
+            last = segments[-1]
+            if last["last_timestamp"][:10] == day and last["bytes"] < self.max_segment_bytes:
+                return last
+        
+        sequence = sum(1 for segment in segments if segment["first_timestamp"][:10] == day)
+        segment = self._new_segment(f"articles-{day.replace('-', '')}-{sequence:03d}.jsonl.gz", timestamp)
+        segments.append(segment)
+        return segment
+    
+    @staticmethod
+    def _new_segment(file: str, timestamp: str) -> Dict:
+        """Entrée d'index d'un segment vide ouvert à `timestamp`."""
+        return {
+            "file": file,
+            "first_timestamp": timestamp,
+            "last_timestamp": timestamp,
+            "entries": 0,
+            "articles": 0,
+            "bytes": 0,
+        }
+    
+    def iter_entries(self, since: Optional[str] = None, until: Optional[str] = None) -> Iterator[Dict]:
+        """
+        Cycles archivés, dans l'ordre chronologique.
+        
+        Args:
+            since: Horodatage minimal inclus (ex : "2026-01-01")
+            until: Horodatage maximal inclus (ex : "2026-01-31 23:59:59")
+        
+        Yields:
+            {"timestamp", "count", "articles"}
+        """
+        for segment in self._index["segments"]:
+            # Segments hors période : pas décompressés
+            if since and segment["last_timestamp"] < since:
+                continue
+            if until and segment["first_timestamp"] > until:
+                continue
+            
+            with gzip.open(self.archive_dir / segment["file"], "rt", encoding="utf-8") as f:
+                for line in f:
+                    entry = json.loads(line)
+                    if since and entry["timestamp"] < since:
+                        continue
+                    if until and entry["timestamp"] > until:
+                        continue
+                    yield entry
+    
+    def iter_articles(self, since: Optional[str] = None, until: Optional[str] = None) -> Iterator[Dict]:
+        """Articles bruts archivés (voir iter_entries), un par un."""
+        for entry in self.iter_entries(since, until):
+            yield from entry["articles"]
+    
+    def import_legacy(self, legacy_path: str) -> int:
+        """
+        Importe l'ancienne archive JSON ([{"timestamp", "count", "articles"}]).
+        
+        Le fichier n'est ni modifié ni supprimé ; son nom est noté dans
+        l'index pour ne l'importer qu'une fois.
+        
+        Les cycles sont écrits dans des segments propres à l'import (noms
+        fixes, réécrits à chaque tentative), puis l'index est mis à jour en
+        une seule écriture avec le nom du fichier importé : un import
+        interrompu est recommencé sans doublon.
+        
+        Returns:
+            Nombre de cycles importés
+        """
+        legacy_path = Path(legacy_path)
+        if not legacy_path.exists() or legacy_path.name in self._index["imported"]:
+            return 0
+        
+        try:
+            with open(legacy_path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+        except json.JSONDecodeError as e:
+            print(f"[ARCHIVE] Ancienne archive illisible ({legacy_path.name}) : {e}")
+            return 0
+        
+        segments = self._write_legacy_segments(legacy_path.stem, entries)
+        self._index["segments"] = sorted(
+            self._index["segments"] + segments, key=lambda segment: segment["first_timestamp"]
+        )
+        self._index["imported"].append(legacy_path.name)
+        self._write_index()
+        print(f"[ARCHIVE] {len(entries)} cycles importés depuis {legacy_path.name}")
+        return len(entries)
+    
+    def _write_legacy_segments(self, stem: str, entries: List[Dict]) -> List[Dict]:
+        """
+        Écrit les cycles d'une ancienne archive dans des segments <stem>-AAAAMMJJ-NNN.jsonl.gz
+        (un par jour, clos au-delà de max_segment_bytes), sans toucher à l'index.
+        
+        Returns:
+            Entrées d'index des segments écrits
+        """
+        segments = []
+        f = None
+        try:
+            for entry in sorted(entries, key=lambda entry: entry["timestamp"]):
+                timestamp = entry["timestamp"]
+                day = timestamp[:10]
+                full = f is not None and f.fileobj.tell() >= self.max_segment_bytes
+                if not segments or segments[-1]["first_timestamp"][:10] != day or full:
+                    if f is not None:
+                        f.close()
+                    sequence = sum(1 for segment in segments if segment["first_timestamp"][:10] == day)
+                    segments.append(
+                        self._new_segment(f"{stem}-{day.replace('-', '')}-{sequence:03d}.jsonl.gz", timestamp)
+                    )
+                    f = gzip.open(self.archive_dir / segments[-1]["file"], "wb")
+                
+                articles = entry.get("articles", [])
+                line = {"timestamp": timestamp, "count": len(articles), "articles": articles}
+                f.write((json.dumps(line, ensure_ascii=False) + "\n").encode("utf-8"))
+                
+                segment = segments[-1]
+                segment["last_timestamp"] = timestamp
+                segment["entries"] += 1
+                segment["articles"] += len(articles)
+        finally:
+            if f is not None:
+                f.close()
+        
+        for segment in segments:
+            segment["bytes"] = (self.archive_dir / segment["file"]).stat().st_size
+        return segments
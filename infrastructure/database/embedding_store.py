@@ -0,0 +1,268 @@
+# infrastructure/database/embedding_store.py
+
+import json
+from pathlib import Path
+from typing import Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from domain.services.project_paths import DATA_DIR
+
+
+class IVFIndex:
+    """
+    Index IVF (inverted file) : k-means sphérique sur les embeddings.
+    
+    Chaque vecteur est rangé dans la liste de son centroïde le plus proche ;
+    une recherche ne parcourt que les `n_probe` listes les plus proches de la
+    requête au lieu de toute la matrice.
+    """
+    
+    def __init__(self, centroids: np.ndarray, assignments: np.ndarray):
+        self.centroids = centroids  # (n_lists, dim) float32, normés
+        self.assignments = assignments  # Liste de chaque ligne indexée
+    
+    @property
+    def n_indexed(self) -> int:
+        """Nombre de lignes couvertes (les lignes ajoutées ensuite sont parcourues à part)."""
+        return len(self.assignments)
+    
+    @classmethod
+    def train(cls, vectors: np.ndarray, n_lists: int, n_iter: int = 10, seed: int = 0) -> 'IVFIndex':
+        """k-means sphérique (similarité cosinus) sur des vecteurs normés."""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        n_lists = max(1, min(n_lists, len(vectors)))
+        rng = np.random.default_rng(seed)
+        
+        # Initialisation k-means++ : centroïdes éloignés les uns des autres
+        centroids = np.empty((n_lists, vectors.shape[1]), dtype=np.float32)
+        centroids[0] = vectors[rng.integers(len(vectors))]
+        distances = 1.0 - vectors @ centroids[0]
+        for c in range(1, n_lists):
+            weights = np.clip(distances, 0.0, None) ** 2
+            total = weights.sum()
+            index = rng.choice(len(vectors), p=weights / total) if total > 0 else rng.integers(len(vectors))
+            centroids[c] = vectors[index]
+            distances = np.minimum(distances, 1.0 - vectors @ centroids[c])
+        
+        for _ in range(n_iter):
+            assignments = (vectors @ centroids.T).argmax(axis=1)
+            for c in range(n_lists):
+                members = vectors[assignments == c]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    centroids[c] = centroid / (np.linalg.norm(centroid) or 1.0)
+        
+        return cls(centroids, (vectors @ centroids.T).argmax(axis=1))
+    
+    def reassign(self, rows: np.ndarray, vectors: np.ndarray) -> bool:
+        """
+        Range à nouveau des lignes indexées dont le vecteur a changé.
+        
+        Returns:
+            True si au moins une ligne couverte par l'index a été rangée
+        """
+        covered = rows < self.n_indexed
+        if not covered.any():
+            return False
+        vectors = np.asarray(vectors[covered], dtype=np.float32)
+        self.assignments[rows[covered]] = (vectors @ self.centroids.T).argmax(axis=1)
+        return True
+    
+    def candidates(self, query: np.ndarray, n_probe: int) -> np.ndarray:
+        """Lignes des `n_probe` listes les plus proches de la requête."""
+        n_probe = min(n_probe, len(self.centroids))
+        lists = np.argpartition(-(self.centroids @ query), n_probe - 1)[:n_probe]
+        return np.flatnonzero(np.isin(self.assignments, lists))
+    
+    def save(self, path: Path):
+        np.savez(path, centroids=self.centroids, assignments=self.assignments)
+    
+    @classmethod
+    def load(cls, path: Path) -> 'IVFIndex':
+        with np.load(path) as data:
+            return cls(data["centroids"], data["assignments"])
+
+
+class EmbeddingStore:
+    """
+    Stockage des embeddings d'articles : matrice float16 mappée en mémoire.
+    
+    Fichiers (dans data/) :
+    - <nom>.f16       : vecteurs normés, une ligne de `dim` float16 par article
+    - <nom>_ids.npy   : id de l'article (table articles) de chaque ligne
+    - <nom>_meta.json : dimension des vecteurs
+    - <nom>_ivf.npz   : index IVF optionnel (build_index)
+    
+    Les vecteurs étant normés, la similarité cosinus est un produit scalaire.
+    """
+    
+    SEARCH_CHUNK = 65536  # Lignes converties en float32 à la fois pendant une recherche
+    
+    def __init__(self, name: str = "embeddings", data_dir: Optional[str] = None):
+        base_dir = Path(data_dir) if data_dir else DATA_DIR
+        base_dir.mkdir(parents=True, exist_ok=True)
+        self.vectors_path = base_dir / f"{name}.f16"
+        self.ids_path = base_dir / f"{name}_ids.npy"
+        self.meta_path = base_dir / f"{name}_meta.json"
+        self.index_path = base_dir / f"{name}_ivf.npz"
+        
+        self.dim = None
+        if self.meta_path.exists():
+            with open(self.meta_path, "r", encoding="utf-8") as f:
+                self.dim = json.load(f)["dim"]
+        self._ids = np.load(self.ids_path) if self.ids_path.exists() else np.zeros(0, dtype=np.int64)
+        self._rows = {int(article_id): row for row, article_id in enumerate(self._ids)}
+        self._matrix = None
+        self._index = IVFIndex.load(self.index_path) if self.index_path.exists() else None
+    
+    def __len__(self) -> int:
+        return len(self._ids)
+    
+    def __contains__(self, article_id: int) -> bool:
+        return int(article_id) in self._rows
+    
+    def _vectors(self) -> np.ndarray:
+        """Matrice (n, dim) float16 mappée en lecture seule (rouverte après un ajout)."""
+        if self._matrix is None and len(self._ids):
+            self._matrix = np.memmap(
+                self.vectors_path, dtype=np.float16, mode="r", shape=(len(self._ids), self.dim)
+            )
+        return self._matrix
+    
+    def add(self, article_ids: Iterable[int], vectors: np.ndarray):
+        """
+        Enregistre les embeddings d'articles (remplace ceux déjà présents).
+        
+        Args:
+            article_ids: Ids des articles (table articles)
+            vectors: Matrice (n, dim), normée ici avant conversion en float16
+        """
+        article_ids = [int(article_id) for article_id in article_ids]
+        vectors = np.asarray(vectors, dtype=np.float32).reshape(len(article_ids), -1)
+        if not article_ids:
+            return
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+            with open(self.meta_path, "w", encoding="utf-8") as f:
+                json.dump({"dim": self.dim}, f)
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(f"Dimension {vectors.shape[1]} incompatible avec le stockage ({self.dim})")
+        
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        vectors = (vectors / np.where(norms > 0, norms, 1.0)).astype(np.float16)
+        
+        # Articles déjà présents : mise à jour sur place (seule écriture du fichier
+        # mappé), puis rangement dans leur nouvelle liste IVF
+        new = {}
+        updated_rows, updated = [], []
+        for article_id, vector in zip(article_ids, vectors):
+            row = self._rows.get(article_id)
+            if row is None:
+                new[article_id] = vector
+            else:
+                updated_rows.append(row)
+                updated.append(vector)
+        if updated_rows:
+            rows = np.array(updated_rows, dtype=np.intp)
+            writable = np.memmap(
+                self.vectors_path, dtype=np.float16, mode="r+", shape=(len(self._ids), self.dim)
+            )
+            writable[rows] = np.stack(updated)
+            writable.flush()
+            del writable
+            if self._index is not None and self._index.reassign(rows, np.stack(updated)):
+                self._index.save(self.index_path)
+        
+        # Nouveaux articles : ajout en fin de fichier
+        if new:
+            with open(self.vectors_path, "ab") as f:
+                f.write(np.stack(list(new.values())).tobytes())
+            start = len(self._ids)
+            self._ids = np.concatenate([self._ids, np.fromiter(new, dtype=np.int64)])
+            self._rows.update({article_id: start + i for i, article_id in enumerate(new)})
+            np.save(self.ids_path, self._ids)
+            self._matrix = None
+    
+    def get(self, article_id: int) -> Optional[np.ndarray]:
+        """Embedding normé (float32) d'un article, ou None."""
+        row = self._rows.get(int(article_id))
+        if row is None:
+            return None
+        return self._vectors()[row].astype(np.float32)
+    
+    def build_index(self, n_lists: Optional[int] = None, n_iter: int = 10) -> IVFIndex:
+        """
+        Entraîne et enregistre l'index IVF (défaut : ~√n listes).
+        
+        Les articles ajoutés après l'entraînement restent trouvables : ils sont
+        parcourus en plus des listes sondées, jusqu'au prochain build_index.
+        """
+        vectors = self._vectors()
+        if vectors is None:
+            raise ValueError("Aucun embedding à indexer")
+        n_lists = n_lists or max(1, int(np.sqrt(len(vectors))))
+        self._index = IVFIndex.train(np.asarray(vectors, dtype=np.float32), n_lists, n_iter)
+        self._index.save(self.index_path)
+        print(f"[EMBEDDINGS] Index IVF : {len(self._index.centroids)} listes, {len(vectors)} articles")
+        return self._index
+    
+    def search(
+        self,
+        query: np.ndarray,
+        k: int = 10,
+        exclude_ids: Iterable[int] = (),
+        n_probe: Optional[int] = None,
+    ) -> List[Tuple[int, float]]:
+        """
+        Articles les plus proches d'un vecteur (similarité cosinus).
+        
+        Args:
+            query: Vecteur de requête (dim,)
+            k: Nombre de résultats
+            exclude_ids: Articles à écarter (ex : l'article de la requête)
+            n_probe: Listes IVF sondées ; None = recherche exhaustive
+        
+        Returns:
+            [(article_id, similarité)] par similarité décroissante
+        """
+        vectors = self._vectors()
+        if vectors is None:
+            return []
+        query = np.asarray(query, dtype=np.float32)
+        query = query / (np.linalg.norm(query) or 1.0)
+        
+        if n_probe and self._index is not None:
+            rows = np.concatenate([
+                self._index.candidates(query, n_probe),
+                np.arange(self._index.n_indexed, len(vectors)),
+            ])
+            scores = np.asarray(vectors[rows], dtype=np.float32) @ query
+        else:
+            rows = None
+            scores = np.concatenate([
+                np.asarray(vectors[start:start + self.SEARCH_CHUNK], dtype=np.float32) @ query
+                for start in range(0, len(vectors), self.SEARCH_CHUNK)
+            ])
+        
+        excluded = [self._rows[int(i)] for i in exclude_ids if int(i) in self._rows]
+        if excluded:
+            if rows is None:
+                scores[excluded] = -np.inf
+            else:
+                scores[np.isin(rows, excluded)] = -np.inf
+        
+        k = min(k, int(np.isfinite(scores).sum()))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        positions = top if rows is None else rows[top]
+        return [(int(self._ids[p]), float(scores[t])) for p, t in zip(positions, top)]
+    
+    def similar_to(self, article_id: int, k: int = 10, n_probe: Optional[int] = None) -> List[Tuple[int, float]]:
+        """Articles les plus proches d'un article déjà stocké (sans relancer le modèle)."""
+        vector = self.get(article_id)
+        if vector is None:
+            return []
+        return self.search(vector, k, exclude_ids=[article_id], n_probe=n_probe)
@@ -0,0 +1,138 @@
+# infrastructure/database/inference_cache.py
+
+import sqlite3
+import json
+import hashlib
+from typing import Dict, Iterable
+
+from domain.services.project_paths import data_file
+from infrastructure.database.sqlite_utils import chunks
+
+
+class InferenceCache:
+    """
+    Cache persistant (SQLite) des résultats d'inférence de sentiment.
+    
+    Clé : hash SHA-256 du texte analysé + identifiant du modèle.
+    Éviction LRU dès que le nombre d'entrées dépasse `max_entries`.
+    """
+    
+    def __init__(self, db_name: str = "inference_cache.db", max_entries: int = 50000):
+        self.db_path = data_file(db_name)
+        self.max_entries = max_entries
+        
+        self._create_tables()
+    
+    def _get_connection(self):
+        """Ouvre une connexion fraîche (timeout augmenté pour éviter les verrous)."""
+        return sqlite3.connect(self.db_path, timeout=10)
+    
+    def _create_tables(self):
+        """Crée la table du cache si nécessaire."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS inference_cache (
+                    key TEXT PRIMARY KEY,
+                    label TEXT NOT NULL,
+                    score REAL NOT NULL,
+                    probabilities TEXT NOT NULL,
+                    last_access INTEGER NOT NULL
+                )
+            """)
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_cache_access ON inference_cache(last_access)"
+            )
+            conn.commit()
+    
+    @staticmethod
+    def make_key(text: str, model_id: str) -> str:
+        """Calcule la clé de cache d'un texte pour un modèle donné."""
+        return hashlib.sha256(f"{model_id}\n{text}".encode("utf-8")).hexdigest()
+    
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Récupère les résultats en cache et rafraîchit leur date d'accès.
+        
+        Returns:
+            {clé: {"label", "score", "probabilities"}} pour les clés trouvées
+        """
+        keys = list(dict.fromkeys(keys))
+        found = {}
+        
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for chunk in chunks(keys):
+                placeholders = ",".join("?" * len(chunk))
+                cursor.execute(f"""
+                    SELECT key, label, score, probabilities
+                    FROM inference_cache WHERE key IN ({placeholders})
+                """, chunk)
+                for key, label, score, probas in cursor.fetchall():
+                    found[key] = {
+                        "label": label,
+                        "score": score,
+                        "probabilities": json.loads(probas)
+                    }
+            
+            # Mise à jour LRU
+            now = self._next_tick(cursor)
+            cursor.executemany(
+                "UPDATE inference_cache SET last_access = ? WHERE key = ?",
+                [(now, key) for key in found]
+            )
+            conn.commit()
+        
+        return found
+    
+    def put_many(self, entries: Dict[str, Dict]):
+        """
+        Enregistre des résultats puis applique l'éviction LRU.
+        
+        Args:
+            entries: {clé: {"label", "score", "probabilities"}}
+        """
+        if not entries:
+            return
+        
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            now = self._next_tick(cursor)
+            cursor.executemany("""
+                INSERT OR REPLACE INTO inference_cache (
+                    key, label, score, probabilities, last_access
+                ) VALUES (?, ?, ?, ?, ?)
+            """, [
+                (key, value["label"], value["score"], json.dumps(value["probabilities"]), now)
+                for key, value in entries.items()
+            ])
+            self._evict(cursor)
+            conn.commit()
+    
+    @staticmethod
+    def _next_tick(cursor) -> int:
+        """
+        Horloge logique de l'ordre LRU.
+        
+        Un compteur plutôt que l'heure système : deux accès successifs ne
+        partagent jamais la même valeur, même avec une horloge peu précise.
+        """
+        cursor.execute("SELECT COALESCE(MAX(last_access), 0) + 1 FROM inference_cache")
+        return cursor.fetchone()[0]
+    
+    def _evict(self, cursor):
+        """Supprime les entrées les moins récemment utilisées au-delà de max_entries."""
+        cursor.execute("SELECT COUNT(*) FROM inference_cache")
+        excess = cursor.fetchone()[0] - self.max_entries
+        if excess > 0:
+            cursor.execute("""
+                DELETE FROM inference_cache WHERE key IN (
+                    SELECT key FROM inference_cache
+                    ORDER BY last_access ASC LIMIT ?
+                )
+            """, (excess,))
+    
+    def count(self) -> int:
+        """Nombre d'entrées dans le cache."""
+        with self._get_connection() as conn:
+            return conn.execute("SELECT COUNT(*) FROM inference_cache").fetchone()[0]
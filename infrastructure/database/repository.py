@@ -1,7 +1,7 @@
 import sqlite3
 import json
 import os
-from typing import List, Dict
+from typing import List, Dict, Iterable, Tuple
 
 class DatabaseRepository:
     """
@@ -22,8 +22,15 @@ class DatabaseRepository:
         self._create_tables()
     
     def _get_connection(self):
-        """Ouvre une connexion fraîche (timeout augmenté pour éviter les verrous)."""
-        return sqlite3.connect(self.db_path, timeout=10)
+        """
+        Ouvre une connexion fraîche (timeout augmenté pour éviter les verrous).
+        
+        Lignes en sqlite3.Row : colonnes lues par nom, quel que soit leur ordre
+        (les colonnes ajoutées par migration arrivent en fin de table).
+        """
+        conn = sqlite3.connect(self.db_path, timeout=10)
+        conn.row_factory = sqlite3.Row
+        return conn
 
     def _create_tables(self):
         """Crée la table de manière atomique."""
@@ -45,12 +52,20 @@ class DatabaseRepository:
                         sentiment_score REAL,
                         sentiment_probas TEXT,
                         created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        sentiment_tier TEXT,
+                        cluster_id TEXT,
                         UNIQUE(link, company)
                     )
                 """)
+                # Migration des bases créées avant l'ajout de sentiment_tier / cluster_id
+                columns = {row[1] for row in cursor.execute("PRAGMA table_info(articles)")}
+                for column in ("sentiment_tier", "cluster_id"):
+                    if column not in columns:
+                        cursor.execute(f"ALTER TABLE articles ADD COLUMN {column} TEXT")
                 # Création des index
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_company ON articles(company)")
                 cursor.execute("CREATE INDEX IF NOT EXISTS idx_date ON articles(published_date DESC)")
+                cursor.execute("CREATE INDEX IF NOT EXISTS idx_cluster ON articles(cluster_id)")
                 conn.commit()
                 
         except Exception as e:
@@ -61,7 +76,7 @@ class DatabaseRepository:
         Sauvegarde un article.
         Retourne True si l'article est NOUVEAU, False si c'est un DOUBLON.
         """
-        probas_json = json.dumps(article.get("sentiment_probas", {}))
+        probas_json = json.dumps(dict(article.get("sentiment_probas") or {}))
         
         try:
             with self._get_connection() as conn:
@@ -70,8 +85,9 @@ class DatabaseRepository:
                     INSERT OR IGNORE INTO articles (
                         company, title, source, link, summary,
                         full_text, published_date, sentiment_label,
-                        sentiment_score, sentiment_probas
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                        sentiment_score, sentiment_probas, sentiment_tier,
+                        cluster_id
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                 """, (
                     article.get("company"),
                     article.get("title"),
@@ -82,7 +98,9 @@ class DatabaseRepository:
                     article.get("published_date") or article.get("time"),
                     article.get("sentiment_label"),
                     article.get("sentiment_score"),
-                    probas_json
+                    probas_json,
+                    article.get("sentiment_tier"),
+                    article.get("cluster_id")
                 ))
                 conn.commit()
 
@@ -128,9 +146,46 @@ class DatabaseRepository:
             print(f"Erreur SQL fetch_company : {e}")
             return []
 
+    def fetch_known_articles(self, keys: Iterable[Tuple[str, str]]) -> Dict[Tuple[str, str], Dict]:
+        """
+        Retrouve en une requête les articles déjà en base parmi des clés (link, company).
+        
+        Sert à écarter les doublons AVANT l'analyse de sentiment.
+        
+        Returns:
+            {(link, company): article} pour les clés déjà présentes
+        """
+        wanted = {(link, company) for link, company in keys if link}
+        if not wanted:
+            return {}
+        
+        links = sorted({link for link, _ in wanted})
+        known = {}
+        try:
+            with self._get_connection() as conn:
+                cursor = conn.cursor()
+                # Découpage pour rester sous la limite de paramètres SQLite
+                for start in range(0, len(links), 500):
+                    chunk = links[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    cursor.execute(
+                        f"SELECT * FROM articles WHERE link IN ({placeholders})",
+                        chunk
+                    )
+                    for row in cursor.fetchall():
+                        article = self._row_to_dict(row)
+                        key = (article["link"], article["company"])
+                        if key in wanted:
+                            known[key] = article
+        except Exception as e:
+            print(f"Erreur SQL fetch_known_articles : {e}")
+            return {}
+        
+        return known
+
     def update_sentiment(self, article_id: int, label: str, score: float, probas: Dict) -> bool:
         """Met à jour le sentiment d'un article existant."""
-        probas_json = json.dumps(probas or {})
+        probas_json = json.dumps(dict(probas or {}))
         try:
             with self._get_connection() as conn:
                 cursor = conn.cursor()
@@ -145,20 +200,22 @@ class DatabaseRepository:
             print(f"Erreur SQL update_sentiment : {e}")
             return False
 
-    def _row_to_dict(self, row) -> Dict:
+    def _row_to_dict(self, row: sqlite3.Row) -> Dict:
         return {
-            "id": row[0],
-            "company": row[1],
-            "title": row[2],
-            "source": row[3],          
-            "publisher": row[3],      
-            "link": row[4],
-            "url": row[4],            
-            "summary": row[5],
-            "content": row[6],         
-            "published_date": row[7],
-            "time": row[7],            
-            "sentiment_label": row[8],
-            "sentiment_score": row[9],
-            "sentiment_probas": json.loads(row[10]) if row[10] else {}
+            "id": row["id"],
+            "company": row["company"],
+            "title": row["title"],
+            "source": row["source"],
+            "publisher": row["source"],
+            "link": row["link"],
+            "url": row["link"],
+            "summary": row["summary"],
+            "content": row["full_text"],
+            "published_date": row["published_date"],
+            "time": row["published_date"],
+            "sentiment_label": row["sentiment_label"],
+            "sentiment_score": row["sentiment_score"],
+            "sentiment_probas": json.loads(row["sentiment_probas"]) if row["sentiment_probas"] else {},
+            "sentiment_tier": row["sentiment_tier"],
+            "cluster_id": row["cluster_id"]
         }
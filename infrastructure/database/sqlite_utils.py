@@ -0,0 +1,13 @@
+# infrastructure/database/sqlite_utils.py
+
+from typing import Iterable, List
+
+
+# Limite prudente du nombre de paramètres SQLite par requête
+SQL_CHUNK = 500
+
+
+def chunks(items: List, size: int = SQL_CHUNK) -> Iterable[List]:
+    """Découpe `items` en morceaux d'au plus `size` éléments (requêtes IN (...))."""
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
@@ -0,0 +1,165 @@
+# infrastructure/database/trend_history.py
+
+import sqlite3
+import json
+import os
+from typing import Dict, Iterable, List, Optional
+
+from domain.services.project_paths import data_file
+from infrastructure.database.sqlite_utils import chunks
+
+
+class TrendHistoryRepository:
+    """
+    Historique des tendances (SQLite) : une ligne (timestamp, company, score)
+    par entreprise et par cycle.
+    
+    Chaque cycle insère ses seules lignes ; les lectures par période et par
+    entreprise passent par la clé primaire (timestamp, company) ou l'index
+    (company, timestamp), sans relire tout l'historique.
+    """
+    
+    def __init__(self, db_name: str = "trend_history.db", legacy_json: Optional[str] = "trend_history.json"):
+        """
+        Args:
+            db_name: Fichier SQLite (dans data/, ou chemin absolu)
+            legacy_json: Ancien historique JSON (dans data/, ou chemin absolu),
+                importé une seule fois ; None pour ne rien importer
+        """
+        self.db_path = data_file(db_name)
+        
+        self._create_tables()
+        if legacy_json:
+            self.import_legacy_json(data_file(legacy_json))
+    
+    def _get_connection(self):
+        """Ouvre une connexion fraîche (timeout augmenté pour éviter les verrous)."""
+        return sqlite3.connect(self.db_path, timeout=10)
+    
+    def _create_tables(self):
+        """Crée la table de l'historique si nécessaire."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS trend_history (
+                    timestamp TEXT NOT NULL,
+                    company TEXT NOT NULL,
+                    score REAL NOT NULL,
+                    PRIMARY KEY (timestamp, company)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute(
+                "CREATE INDEX IF NOT EXISTS idx_trend_company ON trend_history(company, timestamp)"
+            )
+            # Fichiers JSON déjà importés (import unique)
+            cursor.execute("CREATE TABLE IF NOT EXISTS trend_imports (name TEXT PRIMARY KEY)")
+            conn.commit()
+    
+    def append(self, timestamp: str, scores: Dict[str, float]):
+        """
+        Enregistre les scores d'un cycle.
+        
+        Args:
+            timestamp: Horodatage du cycle ("AAAA-MM-JJ HH:MM:SS")
+            scores: {entreprise: score moyen}
+        """
+        with self._get_connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO trend_history (timestamp, company, score) VALUES (?, ?, ?)",
+                [(timestamp, company, float(score)) for company, score in scores.items()]
+            )
+            conn.commit()
+    
+    def fetch_history(
+        self,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        companies: Optional[Iterable[str]] = None,
+    ) -> List[Dict]:
+        """
+        Historique sur une période, éventuellement limité à des entreprises.
+        
+        Args:
+            since: Horodatage minimal inclus (ex : "2026-01-01")
+            until: Horodatage maximal inclus (ex : "2026-01-31 23:59:59")
+            companies: Entreprises à garder (None = toutes)
+        
+        Returns:
+            [{"timestamp", "scores": {entreprise: score}}] par ordre chronologique
+            (format de SentimentEvolutionChart) ; cycles sans score retenu omis
+        """
+        conditions = []
+        params = []
+        if since:
+            conditions.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            conditions.append("timestamp <= ?")
+            params.append(until)
+        
+        rows = []
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            if companies is None:
+                rows = self._select(cursor, conditions, params)
+            else:
+                companies = list(dict.fromkeys(companies))
+                for chunk in chunks(companies):
+                    placeholders = ",".join("?" * len(chunk))
+                    rows.extend(self._select(
+                        cursor, conditions + [f"company IN ({placeholders})"], params + chunk
+                    ))
+                rows.sort(key=lambda row: row[0])
+        
+        history = []
+        for timestamp, company, score in rows:
+            if not history or history[-1]["timestamp"] != timestamp:
+                history.append({"timestamp": timestamp, "scores": {}})
+            history[-1]["scores"][company] = score
+        return history
+    
+    @staticmethod
+    def _select(cursor, conditions: List[str], params: list) -> list:
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        cursor.execute(
+            f"SELECT timestamp, company, score FROM trend_history {where} ORDER BY timestamp, company",
+            params
+        )
+        return cursor.fetchall()
+    
+    def import_legacy_json(self, path: str) -> int:
+        """
+        Importe l'ancien historique JSON ([{"timestamp", "scores"}]), une seule fois.
+        
+        Le fichier n'est pas modifié ; son nom est enregistré pour ne plus le relire.
+        
+        Returns:
+            Nombre de cycles importés
+        """
+        name = os.path.basename(path)
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT 1 FROM trend_imports WHERE name = ?", (name,))
+            if cursor.fetchone() or not os.path.exists(path):
+                return 0
+            
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    history = json.load(f)
+            except json.JSONDecodeError as e:
+                print(f"[TREND] Ancien historique illisible ({name}) : {e}")
+                return 0
+            
+            cursor.executemany(
+                "INSERT OR REPLACE INTO trend_history (timestamp, company, score) VALUES (?, ?, ?)",
+                [
+                    (entry["timestamp"], company, float(score))
+                    for entry in history
+                    for company, score in entry.get("scores", {}).items()
+                ]
+            )
+            cursor.execute("INSERT INTO trend_imports (name) VALUES (?)", (name,))
+            conn.commit()
+        
+        print(f"[TREND] {len(history)} cycles importés depuis {name}")
+        return len(history)
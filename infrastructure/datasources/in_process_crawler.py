@@ -0,0 +1,251 @@
+# infrastructure/datasources/in_process_crawler.py
+
+import queue
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional
+
+
+# Marqueur de fin de crawl déposé dans la file après le dernier article
+_CRAWL_DONE = object()
+
+# Intervalle (s) de vérification de l'arrêt quand la file est pleine
+_PUT_POLL = 0.5
+
+
+class QueueItemPipeline:
+    """
+    Pipeline d'items Scrapy : dépose chaque article dans une file bornée.
+    
+    La file (et l'événement d'arrêt) sont attachés au crawler par
+    InProcessCrawler : les réglages Scrapy sont copiés en profondeur et ne
+    peuvent pas porter d'objets vivants. File pleine → le put bloque le
+    reactor : le crawl ralentit au rythme de l'analyse (contre-pression).
+    """
+    
+    def __init__(self, item_queue: queue.Queue, stop_event: Optional[threading.Event] = None):
+        self.item_queue = item_queue
+        self.stop_event = stop_event or threading.Event()
+    
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(crawler.item_queue, getattr(crawler, "item_stop_event", None))
+    
+    def process_item(self, item, spider=None):
+        _put(self.item_queue, dict(item), self.stop_event)
+        return item
+
+
+def _put(item_queue: queue.Queue, item, stop_event: threading.Event) -> bool:
+    """
+    Dépose `item` dans la file, en attendant de la place tant que le
+    consommateur n'a pas abandonné (stop_event) : le reactor n'est jamais
+    bloqué indéfiniment par une file que plus personne ne lit.
+    
+    Returns:
+        True si l'item a été déposé
+    """
+    while not stop_event.is_set():
+        try:
+            item_queue.put(item, timeout=_PUT_POLL)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+def iter_batches(
+    item_queue: queue.Queue,
+    max_size: int,
+    max_wait: float,
+    is_alive: Optional[Callable[[], bool]] = None,
+) -> Iterator[List[dict]]:
+    """
+    Regroupe les articles de la file en paquets jusqu'au marqueur de fin.
+    
+    Un paquet part dès qu'il atteint `max_size` articles ou que `max_wait`
+    secondes se sont écoulées depuis son premier article : l'analyse démarre
+    sans attendre la fin du crawl, et profite quand même du traitement par lot.
+    
+    Args:
+        is_alive: Vérifie, quand la file reste vide, que le producteur peut
+            encore écrire (ex : thread du reactor vivant) ; sinon RuntimeError
+    """
+    while True:
+        try:
+            first = item_queue.get(timeout=max(max_wait, _PUT_POLL))
+        except queue.Empty:
+            if is_alive is None or is_alive():
+                continue
+            raise RuntimeError("Crawl interrompu : le producteur d'articles s'est arrêté")
+        if first is _CRAWL_DONE:
+            return
+        
+        batch = [first]
+        deadline = time.monotonic() + max_wait
+        while len(batch) < max_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = item_queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is _CRAWL_DONE:
+                yield batch
+                return
+            batch.append(item)
+        yield batch
+
+
+class InProcessCrawler:
+    """
+    Lance un spider Scrapy dans le processus courant (CrawlerRunner).
+    
+    Le reactor Twisted ne pouvant démarrer qu'une fois par processus, il
+    tourne dans un thread dédié, partagé par toutes les instances ; chaque
+    crawl y est programmé par callFromThread. Les articles arrivent dans une
+    file bornée, consommée par paquets pendant que le crawl continue.
+    """
+    
+    _reactor_thread = None
+    _reactor_lock = threading.Lock()
+    
+    def __init__(self, scrapy_project_path: Path, spider_name: str, queue_size: int = 256):
+        """
+        Args:
+            scrapy_project_path: Dossier contenant scrapy.cfg
+            spider_name: Nom du spider à lancer
+            queue_size: Articles en attente d'analyse au maximum
+        """
+        self.scrapy_project_path = Path(scrapy_project_path)
+        self.spider_name = spider_name
+        self.queue_size = queue_size
+        self.last_error: Optional[str] = None
+    
+    def _settings(self):
+        """Réglages du projet Scrapy + pipeline de file (au lieu de l'export -O)."""
+        from scrapy.settings import Settings
+        
+        # Le module de réglages du projet (ex : cnbc_scraper.settings) doit être importable
+        project_path = str(self.scrapy_project_path)
+        if project_path not in sys.path:
+            sys.path.insert(0, project_path)
+        
+        settings = Settings()
+        settings.setmodule(f"{self._project_module()}.settings", priority="project")
+        pipelines = dict(settings.getdict("ITEM_PIPELINES"))
+        pipelines[f"{__name__}.QueueItemPipeline"] = 1000  # Après les pipelines du projet
+        settings.set("ITEM_PIPELINES", pipelines)
+        return settings
+    
+    def _project_module(self) -> str:
+        """Module du projet Scrapy, lu dans scrapy.cfg ([settings] default = <module>.settings)."""
+        from configparser import ConfigParser
+        
+        config = ConfigParser()
+        config.read(self.scrapy_project_path / "scrapy.cfg")
+        return config.get("settings", "default").rsplit(".", 1)[0]
+    
+    @classmethod
+    def _ensure_reactor(cls, reactor_path: Optional[str]):
+        """Démarre (une seule fois) le reactor Twisted dans un thread démon."""
+        with cls._reactor_lock:
+            if cls._reactor_thread is not None:
+                return
+            
+            ready = threading.Event()
+            
+            def run():
+                # Le reactor (et sa boucle asyncio) est installé dans le thread qui l'exécute
+                if reactor_path:
+                    from scrapy.utils.reactor import install_reactor
+                    install_reactor(reactor_path)
+                from twisted.internet import reactor
+                reactor.callWhenRunning(ready.set)
+                reactor.run(installSignalHandlers=False)
+            
+            cls._reactor_thread = threading.Thread(target=run, name="scrapy-reactor", daemon=True)
+            cls._reactor_thread.start()
+            ready.wait()
+    
+    def crawl_batches(
+        self,
+        max_size: int = 32,
+        max_wait: float = 2.0,
+        time_budget: Optional[float] = None,
+    ) -> Iterator[List[dict]]:
+        """
+        Lance le crawl et produit les articles par paquets, au fil du crawl.
+        
+        Args:
+            max_size: Articles par paquet au maximum
+            max_wait: Attente maximale (s) avant d'envoyer un paquet incomplet
+            time_budget: Durée maximale du crawl (s) ; au-delà, arrêt propre du
+                spider (les articles déjà récupérés sont quand même produits)
+        
+        Yields:
+            Listes de dictionnaires (articles bruts, format du spider)
+        """
+        item_queue = queue.Queue(maxsize=self.queue_size)
+        stop_event = threading.Event()
+        settings = self._settings()
+        self._ensure_reactor(settings.get("TWISTED_REACTOR"))
+        self.last_error = None
+        runners = []
+        
+        from twisted.internet import reactor
+        
+        def start():
+            try:
+                from scrapy.crawler import CrawlerRunner
+                
+                runner = CrawlerRunner(settings)
+                runners.append(runner)
+                crawler = runner.create_crawler(self.spider_name)
+                crawler.item_queue = item_queue
+                crawler.item_stop_event = stop_event
+                deferred = runner.crawl(crawler)
+            except Exception as e:
+                # Échec avant le crawl (ex : spider inconnu) : libère le consommateur
+                self.last_error = f"{type(e).__name__}: {e}"
+                _put(item_queue, _CRAWL_DONE, stop_event)
+                return
+            deferred.addErrback(self._on_error)
+            
+            if time_budget is not None:
+                timer = reactor.callLater(time_budget, self._stop_crawl, runner)
+                deferred.addBoth(lambda result: timer.cancel() if timer.active() else None)
+            # Fin du crawl (succès ou échec) : libère le consommateur
+            deferred.addBoth(lambda _: _put(item_queue, _CRAWL_DONE, stop_event))
+        
+        print(f"   Crawl en processus : spider {self.spider_name}")
+        reactor.callFromThread(start)
+        finished = False
+        try:
+            yield from iter_batches(item_queue, max_size, max_wait, self._reactor_thread.is_alive)
+            finished = True
+        finally:
+            if not finished:
+                # Consommateur abandonné (exception, close()) : débloque le
+                # pipeline, arrête le crawl et vide la file
+                stop_event.set()
+                reactor.callFromThread(lambda: [runner.stop() for runner in runners])
+                while True:
+                    try:
+                        item_queue.get_nowait()
+                    except queue.Empty:
+                        break
+        
+        if self.last_error:
+            print(f"   ✗ Erreur Scrapy : {self.last_error}")
+    
+    @staticmethod
+    def _stop_crawl(runner):
+        print("   Budget de temps atteint : arrêt du crawl")
+        runner.stop()
+    
+    def _on_error(self, failure):
+        self.last_error = failure.getErrorMessage()
@@ -4,8 +4,6 @@ from PyQt6.QtWidgets import QMessageBox
 from mvc.models.ui_state import UIState
 from mvc.controllers.auth_controller import AuthController
 from mvc.views.login_dialog import LoginDialog
-import json
-from pathlib import Path
 
 class MainController:
     """
@@ -16,6 +14,7 @@ class MainController:
         self.view = view
         self.repository = db_repository
         self.ui_state = UIState()
+        self._pipeline_runner = None  # Créé au premier 'Rafraîchir', puis réutilisé
         
         # Contrôleur d'authentification
         self.auth_controller = AuthController()
@@ -31,6 +30,7 @@ class MainController:
         self.view.article_selected.connect(self._on_article_selected)
         self.view.open_article_clicked.connect(self._on_open_article)
         self.view.show_charts_clicked.connect(self._on_show_charts)
+        self.view.similar_articles_clicked.connect(self._on_show_similar)
         self.view.refresh_clicked.connect(self._on_refresh)
         
         # NOUVEAUX SIGNAUX
@@ -196,9 +196,7 @@ class MainController:
         
         # Lancement du scraping
         try:
-            from app.pipeline_runner import ContinuousPipelineRunner
-            runner = ContinuousPipelineRunner()
-            result = runner.run_once()
+            result = self._get_pipeline_runner().run_once()
         except Exception as exc:
             self.view.hide_loading()
             QMessageBox.critical(
@@ -217,6 +215,13 @@ class MainController:
                 f"Scraping terminé : {found} articles trouvés, {added} ajoutés."
             )
     
+    def _get_pipeline_runner(self):
+        """Retourne le runner du pipeline (modèle FinBERT partagé, chargé une fois)."""
+        if self._pipeline_runner is None:
+            from app.pipeline_runner import ContinuousPipelineRunner
+            self._pipeline_runner = ContinuousPipelineRunner()
+        return self._pipeline_runner
+    
     def _apply_filters(self):
         """Applique les filtres et met à jour l'affichage."""
         filtered = self.ui_state.all_articles.copy()
@@ -278,36 +283,43 @@ class MainController:
         if self.ui_state.selected_article:
             self.view.show_full_article(self.ui_state.selected_article)
     
-    def _on_show_charts(self):
-        """Affiche les graphiques."""
-        # Charge l'historique des tendances
-        history_path = Path("data/trend_history.json")
-        trend_history = []
+    def _on_show_similar(self, k: int = 10):
+        """Affiche les articles proches de l'article sélectionné (embeddings stockés, sans modèle)."""
+        article = self.ui_state.selected_article
+        if not article:
+            return
         
-        if history_path.exists():
-            with open(history_path, 'r', encoding='utf-8') as f:
-                trend_history = json.load(f)
+        # Rouvert à chaque recherche : voit les embeddings ajoutés par un rafraîchissement
+        from infrastructure.database.embedding_store import EmbeddingStore
+        matches = EmbeddingStore().similar_to(article.get("id"), k)
+        if not matches:
+            QMessageBox.information(
+                self.view,
+                "Articles similaires",
+                "Aucun embedding pour cet article (analyse lancée sans l'option embeddings)."
+            )
+            return
         
+        articles_by_id = {a.get("id"): a for a in self.ui_state.all_articles}
+        similar = [
+            (articles_by_id[article_id], similarity)
+            for article_id, similarity in matches
+            if article_id in articles_by_id
+        ]
+        self.view.show_similar_articles_dialog(article, similar)
+    
+    def _on_show_charts(self):
+        """Affiche les graphiques."""
         user_favorites = []
         if self.auth_controller.is_authenticated():
             user_favorites = self.auth_controller.get_favorites()
         show_only_favorites = self.ui_state.show_favorites_only and user_favorites
 
-        if show_only_favorites:
-            filtered_history = []
-            for entry in trend_history:
-                scores = entry.get("scores", {})
-                filtered_scores = {
-                    company: score
-                    for company, score in scores.items()
-                    if company in user_favorites
-                }
-                if filtered_scores:
-                    filtered_history.append({
-                        "timestamp": entry.get("timestamp"),
-                        "scores": filtered_scores
-                    })
-            trend_history = filtered_history
+        # Historique des tendances : filtrage par entreprise fait par la base
+        from infrastructure.database.trend_history import TrendHistoryRepository
+        trend_history = TrendHistoryRepository().fetch_history(
+            companies=user_favorites if show_only_favorites else None
+        )
 
         self.view.show_charts_dialog(
             self.ui_state.filtered_articles,
@@ -4,6 +4,11 @@ from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg
 from matplotlib.figure import Figure
 from typing import List, Dict
 
+import numpy as np
+
+from domain.entities.probabilities import SENTIMENT_VALUES, probability_matrix
+from domain.services.aggregator import SentimentAggregator
+
 class SentimentBarChart(FigureCanvasQTAgg):
     """
     Composant : Graphique en barres du sentiment par entreprise.
@@ -28,29 +33,20 @@ class SentimentBarChart(FigureCanvasQTAgg):
             self._show_empty_state()
             return
         
-        # Calcul des scores moyens par entreprise
-        scores = {}
-        for article in articles:
-            company = article["company"]
-            probas = article["sentiment_probas"]
-            
-            # Score pondéré : -1 (négatif) à +1 (positif)
-            sentiment_value = (
-                -1 * probas.get("négatif", 0) +
-                 0 * probas.get("neutre", 0) +
-                 1 * probas.get("positif", 0)
-            )
-            
-            scores.setdefault(company, []).append(sentiment_value)
+        # Probabilités de tous les articles en une matrice (n, 3)
+        probs = probability_matrix(article["sentiment_probas"] for article in articles)
+        
+        # Score pondéré : -1 (négatif) à +1 (positif), pour tous les articles d'un coup
+        sentiment_values = probs @ SENTIMENT_VALUES
         
-        # Moyenne par entreprise
-        avg_scores = {company: sum(values) / len(values) 
-                      for company, values in scores.items()}
+        # Moyenne par entreprise (codes dans l'ordre de première apparition)
+        names, codes = SentimentAggregator.company_codes(article["company"] for article in articles)
+        avg_scores = np.bincount(codes, weights=sentiment_values) / np.bincount(codes)
         
-        # Tri par score décroissant
-        sorted_companies = sorted(avg_scores.items(), key=lambda x: x[1], reverse=True)
-        companies = [c[0] for c in sorted_companies]
-        values = [c[1] for c in sorted_companies]
+        # Tri par score décroissant (à égalité, ordre de première apparition)
+        order = np.argsort(-avg_scores, kind="stable")
+        companies = [names[i] for i in order]
+        values = avg_scores[order].tolist()
         
         # Couleurs selon le sentiment
         colors = [
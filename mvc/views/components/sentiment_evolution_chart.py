@@ -24,7 +24,7 @@ class SentimentEvolutionChart(FigureCanvasQTAgg):
         Met à jour le graphique avec l'historique.
         
         Args:
-            history_data: Liste de {timestamp, scores} depuis trend_history.json
+            history_data: Liste de {timestamp, scores} (TrendHistoryRepository.fetch_history)
         """
         if not history_data:
             self._show_empty_state()
@@ -15,6 +15,7 @@ class MainWindow(QtWidgets.QWidget):
     article_selected = QtCore.pyqtSignal(int)
     open_article_clicked = QtCore.pyqtSignal()
     show_charts_clicked = QtCore.pyqtSignal()
+    similar_articles_clicked = QtCore.pyqtSignal()
     refresh_clicked = QtCore.pyqtSignal()  
     
     logout_clicked = QtCore.pyqtSignal()
@@ -117,6 +118,10 @@ class MainWindow(QtWidgets.QWidget):
         
         self.chart_button = QtWidgets.QPushButton("Afficher les graphiques")
         button_layout.addWidget(self.chart_button)
+        
+        self.similar_button = QtWidgets.QPushButton("Articles similaires")
+        self.similar_button.setEnabled(False)
+        button_layout.addWidget(self.similar_button)
 
         
         
@@ -138,6 +143,7 @@ class MainWindow(QtWidgets.QWidget):
         self.table.itemSelectionChanged.connect(self._on_selection_changed)
         self.open_button.clicked.connect(self.open_article_clicked.emit)
         self.chart_button.clicked.connect(self.show_charts_clicked.emit)
+        self.similar_button.clicked.connect(self.similar_articles_clicked.emit)
         self.refresh_button.clicked.connect(self.refresh_clicked.emit)
         
         self.logout_button.clicked.connect(self.logout_clicked.emit)
@@ -231,6 +237,7 @@ class MainWindow(QtWidgets.QWidget):
         
         self.summary.setText(text)
         self.open_button.setEnabled(True)
+        self.similar_button.setEnabled(True)
 
     def show_full_article(self, article: dict):
         """Affiche l'article complet dans une popup."""
@@ -261,6 +268,42 @@ class MainWindow(QtWidgets.QWidget):
         
         dialog.exec()
     
+    def show_similar_articles_dialog(self, article: dict, similar: list):
+        """
+        Affiche les articles les plus proches d'un article.
+        
+        Args:
+            article: Article de référence
+            similar: [(article, similarité)] par similarité décroissante
+        """
+        dialog = QtWidgets.QDialog(self)
+        dialog.setWindowTitle("Articles similaires")
+        dialog.resize(800, 400)
+        
+        layout = QtWidgets.QVBoxLayout(dialog)
+        header = QtWidgets.QLabel(f"<b>{article.get('title', 'Article')}</b>")
+        header.setWordWrap(True)
+        layout.addWidget(header)
+        
+        article_list = QtWidgets.QListWidget()
+        for other, similarity in similar:
+            item = QtWidgets.QListWidgetItem(
+                f"{similarity:.0%}  [{other.get('company', '')}] {other.get('title', '')}"
+            )
+            item.setData(QtCore.Qt.ItemDataRole.UserRole, other)
+            article_list.addItem(item)
+        # Double-clic : article complet
+        article_list.itemDoubleClicked.connect(
+            lambda item: self.show_full_article(item.data(QtCore.Qt.ItemDataRole.UserRole))
+        )
+        layout.addWidget(article_list)
+        
+        close_button = QtWidgets.QPushButton("Fermer")
+        close_button.clicked.connect(dialog.close)
+        layout.addWidget(close_button)
+        
+        dialog.exec()
+    
     def show_charts_dialog(self, filtered_articles: list, trend_history: list):
         """Affiche la fenêtre des graphiques."""
         dialog = QtWidgets.QDialog(self)
@@ -39,6 +39,8 @@ if os.name == 'nt':
 from mvc.views.main_window import MainWindow
 from mvc.controllers.main_controller import MainController
 from infrastructure.database.repository import DatabaseRepository
+from app.analyzer_registry import warmup_in_background
+from domain.services.inference_config import InferenceConfig
 
 def start_gui():
     """
@@ -83,6 +85,11 @@ def main():
     
     print("Mode MANUEL activé : Cliquez sur Rafraîchir pour scraper.")
     
+    # Préchargement de FinBERT pendant que l'utilisateur se connecte
+    # (désactivable : MARKET_SENTIMENT_WARMUP=0 ou "warmup": false)
+    if InferenceConfig.load().warmup:
+        warmup_in_background()
+    
     # Démarrage de l'interface graphique uniquement
     start_gui()
 
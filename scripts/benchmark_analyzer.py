@@ -0,0 +1,292 @@
+# scripts/benchmark_analyzer.py - Débit de FinBERT par configuration
+
+"""
+Rejoue de vrais articles (archive du scraping) dans FinBERTSentimentAnalyzer
+pour chaque combinaison backend × taille de lot × longueur maximale, et mesure :
+- le temps de chargement du modèle
+- le débit (articles/s)
+- la latence par lot (p50 / p95)
+- la mémoire résidente maximale (pic RSS) du processus
+
+Chaque configuration tourne dans un processus neuf (chargement et pic RSS
+non faussés par la configuration précédente), sans cache d'inférence.
+Les résultats sont écrits en JSON ; deux runs se comparent avec --compare.
+
+Usage :
+    python scripts/benchmark_analyzer.py --limit 200 --output data/bench_avant.json
+    python scripts/benchmark_analyzer.py --batch-sizes 8 16 32 --max-lengths 128 512 --backends torch onnx
+    python scripts/benchmark_analyzer.py --baseline data/bench_avant.json
+    python scripts/benchmark_analyzer.py --compare data/bench_avant.json data/bench_apres.json
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import resource
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+# Ajoute la racine du projet pour les imports
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from domain.entities.article import Article
+from infrastructure.database.article_archive import SegmentedArchive
+
+
+ARCHIVE_DIR = PROJECT_ROOT / "data" / "archive"
+LEGACY_ARCHIVE_PATH = PROJECT_ROOT / "data" / "scraped_articles_archive.json"
+
+# Backends mesurés : nom → arguments du constructeur de l'analyseur
+BACKENDS = {
+    "torch": {"backend": "torch"},
+    "torch-int8": {"backend": "torch", "quantize": True},
+    "onnx": {"backend": "onnx"},
+}
+
+# Mesures comparées entre deux runs : (clé, sens de l'amélioration)
+# +1 : plus c'est haut, mieux c'est ; -1 : plus c'est bas, mieux c'est
+COMPARED_METRICS = [
+    ("articles_per_s", +1),
+    ("batch_p50_ms", -1),
+    ("batch_p95_ms", -1),
+    ("peak_rss_mb", -1),
+    ("load_time_s", -1),
+]
+
+
+def load_texts(input_path, limit):
+    """
+    Textes des articles : archive du scraping (défaut) ou fichier JSON d'articles.
+
+    Un fichier d'articles est une simple liste. Les doublons de lien sont écartés.
+    """
+    if input_path:
+        with open(input_path, "r", encoding="utf-8") as f:
+            rows = json.load(f)
+    else:
+        rows = iter_archived_articles()
+
+    texts = []
+    seen = set()
+    for row in rows:
+        article = Article.from_dict(row)
+        text = article.get_text_for_analysis()
+        if not text or (article.url and article.url in seen):
+            continue
+        seen.add(article.url)
+        texts.append(text)
+    return texts[:limit] if limit else texts
+
+
+def iter_archived_articles():
+    """
+    Articles de l'archive du scraping, en lecture seule : segments existants,
+    puis ancienne archive JSON si elle n'y a pas encore été importée (lue
+    directement ; le benchmark ne modifie pas les données de l'application).
+    """
+    imported = []
+    if (ARCHIVE_DIR / SegmentedArchive.INDEX_FILE).exists():
+        archive = SegmentedArchive(str(ARCHIVE_DIR))
+        imported = archive.imported
+        yield from archive.iter_articles()
+
+    if LEGACY_ARCHIVE_PATH.exists() and LEGACY_ARCHIVE_PATH.name not in imported:
+        with open(LEGACY_ARCHIVE_PATH, "r", encoding="utf-8") as f:
+            for entry in json.load(f):
+                yield from entry.get("articles", [])
+
+
+def peak_rss_mb() -> float:
+    """Pic de mémoire résidente du processus courant (Mo)."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux : Ko ; macOS : octets
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_configuration(texts, backend, batch_size, max_length, repeat):
+    """
+    Mesure une configuration (exécuté dans un processus dédié).
+
+    Les textes sont envoyés par lots de `batch_size` : chaque appel correspond
+    à une passe du modèle (budget de tokens assez grand pour ne pas découper le lot).
+    """
+    from domain.services.sentiment_analyzer import FinBERTSentimentAnalyzer
+
+    start = time.perf_counter()
+    analyzer = FinBERTSentimentAnalyzer(
+        batch_size=batch_size,
+        max_tokens_per_batch=batch_size * max_length,
+        max_length=max_length,
+        **BACKENDS[backend],
+    )
+    load_time = time.perf_counter() - start
+    analyzer.warmup()
+
+    tokens = sum(len(ids) for ids in analyzer._encode(texts))
+
+    latencies = []
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for i in range(0, len(texts), batch_size):
+            batch_start = time.perf_counter()
+            analyzer.predict_proba(texts[i:i + batch_size])
+            latencies.append(time.perf_counter() - batch_start)
+    duration = time.perf_counter() - start
+
+    latencies_ms = 1000 * np.array(latencies)
+    return {
+        "load_time_s": round(load_time, 3),
+        "articles_per_s": round(repeat * len(texts) / duration, 2),
+        "batch_p50_ms": round(float(np.percentile(latencies_ms, 50)), 2),
+        "batch_p95_ms": round(float(np.percentile(latencies_ms, 95)), 2),
+        "peak_rss_mb": round(peak_rss_mb(), 1),
+        "tokens_per_article": round(tokens / len(texts), 1),
+        "batches": len(latencies),
+    }
+
+
+def config_name(result) -> str:
+    return f"{result['backend']}/bs{result['batch_size']}/len{result['max_length']}"
+
+
+def environment() -> dict:
+    """Contexte du run (pour ne comparer que des runs comparables)."""
+    import torch
+    import transformers
+
+    return {
+        "machine": platform.node(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "torch": torch.__version__,
+        "transformers": transformers.__version__,
+        "date": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def run_benchmark(args) -> dict:
+    texts = load_texts(args.input, args.limit)
+    if not texts:
+        raise SystemExit("[BENCH] Aucun article à analyser")
+    print(f"[BENCH] {len(texts)} articles, {args.repeat} passage(s) par configuration")
+
+    results = []
+    # Processus neuf par configuration (spawn : rien n'est hérité du parent)
+    context = multiprocessing.get_context("spawn")
+    for backend in args.backends:
+        for max_length in args.max_lengths:
+            for batch_size in args.batch_sizes:
+                result = {"backend": backend, "batch_size": batch_size, "max_length": max_length}
+                print(f"[BENCH] {config_name(result)}...")
+                with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                    try:
+                        result.update(executor.submit(
+                            run_configuration, texts, backend, batch_size, max_length, args.repeat
+                        ).result())
+                    except Exception as e:
+                        # Backend indisponible (ex : onnxruntime absent) : noté, on continue
+                        print(f"[BENCH] Échec de {config_name(result)} : {e}")
+                        result["error"] = str(e)
+                results.append(result)
+
+    return {"environment": environment(), "articles": len(texts), "repeat": args.repeat, "results": results}
+
+
+def print_report(report: dict):
+    print()
+    print(f"{'Configuration':<24} {'chargement':>10} {'art./s':>8} {'p50 (ms)':>9} {'p95 (ms)':>9} {'RSS (Mo)':>9}")
+    for row in report["results"]:
+        if "error" in row:
+            print(f"{config_name(row):<24} erreur : {row['error']}")
+            continue
+        print(
+            f"{config_name(row):<24} {row['load_time_s']:>9.2f}s {row['articles_per_s']:>8.1f} "
+            f"{row['batch_p50_ms']:>9.1f} {row['batch_p95_ms']:>9.1f} {row['peak_rss_mb']:>9.0f}"
+        )
+
+
+def compare(baseline: dict, current: dict, tolerance: float) -> list:
+    """
+    Compare deux runs configuration par configuration.
+
+    Returns:
+        Régressions : [(configuration, mesure, avant, après, écart relatif)]
+        dépassant `tolerance` (ex : 0.10 = 10 %) dans le mauvais sens
+    """
+    before = {config_name(row): row for row in baseline["results"] if "error" not in row}
+
+    print()
+    print(f"{'Configuration':<24} {'mesure':<16} {'avant':>10} {'après':>10} {'écart':>8}")
+    regressions = []
+    for row in current["results"]:
+        name = config_name(row)
+        if "error" in row or name not in before:
+            continue
+        for metric, direction in COMPARED_METRICS:
+            old, new = before[name][metric], row[metric]
+            change = (new - old) / old if old else 0.0
+            regressed = direction * change < -tolerance
+            if regressed:
+                regressions.append((name, metric, old, new, change))
+            print(
+                f"{name:<24} {metric:<16} {old:>10.2f} {new:>10.2f} {change:>+7.1%}"
+                f"{'  ← régression' if regressed else ''}"
+            )
+
+    if baseline.get("environment", {}).get("machine") != current.get("environment", {}).get("machine"):
+        print("\n[BENCH] Attention : runs issus de machines différentes")
+    return regressions
+
+
+def load_report(path) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de débit de l'analyseur FinBERT")
+    parser.add_argument("--input", help="Fichier JSON d'articles (défaut : archive du scraping)")
+    parser.add_argument("--limit", type=int, default=200, help="Nombre maximal d'articles (0 = tous)")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[8, 16, 32])
+    parser.add_argument("--max-lengths", type=int, nargs="+", default=[128, 512])
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=["torch"])
+    parser.add_argument("--repeat", type=int, default=1, help="Passages sur les articles par configuration")
+    parser.add_argument("--output", help="Fichier JSON où écrire les résultats")
+    parser.add_argument("--baseline", help="Run de référence (JSON) auquel comparer ce run")
+    parser.add_argument("--compare", nargs=2, metavar=("AVANT", "APRES"),
+                        help="Compare deux runs enregistrés, sans rien mesurer")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Écart relatif toléré avant de signaler une régression (défaut : 0.10)")
+    args = parser.parse_args()
+
+    if args.compare:
+        baseline, report = (load_report(path) for path in args.compare)
+    else:
+        report = run_benchmark(args)
+        print_report(report)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2, ensure_ascii=False)
+            print(f"\n[BENCH] Résultats écrits dans {args.output}")
+        if not args.baseline:
+            return
+        baseline = load_report(args.baseline)
+
+    regressions = compare(baseline, report, args.tolerance)
+    if regressions:
+        print(f"\n[BENCH] {len(regressions)} régression(s) au-delà de {args.tolerance:.0%}")
+        sys.exit(1)
+    print("\n[BENCH] Aucune régression")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+# scripts/benchmark_truncation.py - Comparaison des stratégies de troncature
+
+"""
+Mesure, pour chaque stratégie de troncature de FinBERT :
+- le nombre moyen de tokens envoyés au modèle par article
+- la latence (totale et par article)
+- l'accord des labels avec la référence (début du texte, 512 tokens)
+
+Usage :
+    python scripts/benchmark_truncation.py
+    python scripts/benchmark_truncation.py --input tests/data/test_articles.json --limit 200
+    python scripts/benchmark_truncation.py --output data/benchmark_truncation.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Ajoute la racine du projet pour les imports
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from domain.entities.article import Article
+from domain.services.sentiment_analyzer import FinBERTSentimentAnalyzer
+from infrastructure.database.repository import DatabaseRepository
+
+
+# (nom, stratégie, max_length) ; la première configuration sert de référence
+CONFIGURATIONS = [
+    ("head-512 (référence)", "head", 512),
+    ("head-256", "head", 256),
+    ("head-128 (titre d'abord)", "head", 128),
+    ("head_tail-512", "head_tail", 512),
+    ("head_tail-256", "head_tail", 256),
+    ("title-128", "title", 128),
+]
+
+
+def load_articles(input_path, limit):
+    """Charge les articles depuis un JSON (liste d'articles) ou, à défaut, la base."""
+    if input_path:
+        with open(input_path, "r", encoding="utf-8") as f:
+            rows = json.load(f)
+    else:
+        rows = DatabaseRepository().fetch_all_articles()
+
+    articles = [Article.from_dict(row) for row in rows]
+    articles = [article for article in articles if article.get_text_for_analysis()]
+    return articles[:limit] if limit else articles
+
+
+def run_configuration(articles, truncation, max_length, batch_size):
+    """Analyse les articles avec une configuration (sans cache) et mesure le coût."""
+    analyzer = FinBERTSentimentAnalyzer(
+        batch_size=batch_size, truncation=truncation, max_length=max_length
+    )
+    texts = [analyzer._article_text(article) for article in articles]
+
+    tokens = sum(len(ids) for ids in analyzer._encode(texts))
+
+    analyzer.warmup()
+    start = time.perf_counter()
+    results = analyzer.analyze_texts(texts)
+    duration = time.perf_counter() - start
+
+    return {
+        "tokens_per_article": tokens / len(texts),
+        "latency_s": duration,
+        "latency_per_article_ms": 1000 * duration / len(texts),
+        "labels": [result.label for result in results],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des stratégies de troncature FinBERT")
+    parser.add_argument("--input", help="Fichier JSON d'articles (défaut : base SQLite)")
+    parser.add_argument("--limit", type=int, default=0, help="Nombre maximal d'articles (0 = tous)")
+    parser.add_argument("--batch-size", type=int, default=16)
+    parser.add_argument("--output", help="Fichier JSON où écrire les résultats")
+    args = parser.parse_args()
+
+    articles = load_articles(args.input, args.limit)
+    if not articles:
+        print("[BENCH] Aucun article à analyser")
+        return
+    print(f"[BENCH] {len(articles)} articles")
+
+    report = []
+    reference = None
+    for name, truncation, max_length in CONFIGURATIONS:
+        print(f"[BENCH] {name}...")
+        measures = run_configuration(articles, truncation, max_length, args.batch_size)
+        labels = measures.pop("labels")
+        if reference is None:
+            reference = labels
+        agreement = sum(a == b for a, b in zip(labels, reference)) / len(labels)
+        report.append({"name": name, "truncation": truncation, "max_length": max_length,
+                       **measures, "agreement": agreement})
+
+    print()
+    print(f"{'Configuration':<26} {'tokens/art.':>11} {'ms/art.':>9} {'total (s)':>10} {'accord':>8}")
+    for row in report:
+        print(
+            f"{row['name']:<26} {row['tokens_per_article']:>11.1f} "
+            f"{row['latency_per_article_ms']:>9.1f} {row['latency_s']:>10.2f} "
+            f"{row['agreement']:>7.1%}"
+        )
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"articles": len(articles), "configurations": report}, f, indent=2, ensure_ascii=False)
+        print(f"\n[BENCH] Résultats écrits dans {args.output}")
+
+
+if __name__ == "__main__":
+    main()
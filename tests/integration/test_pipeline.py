@@ -4,14 +4,16 @@ import unittest
 from pathlib import Path
 
 from app.orchestrator import MarketSentimentOrchestrator
+from app.analyzer_registry import create_analyzer
+from tests.unit.test_sentiment_analyzer import make_analyzer
 
 class TestPipelineIntegration(unittest.TestCase):
     """Tests d'intégration du pipeline complet."""
     
     @classmethod
     def setUpClass(cls):
-        """Initialise l'orchestrateur."""
-        cls.orchestrator = MarketSentimentOrchestrator()
+        """Initialise l'orchestrateur (FinBERT sans cache ni réglages de data/)."""
+        cls.orchestrator = MarketSentimentOrchestrator(sentiment_analyzer=make_analyzer())
         cls.test_data_path = Path("tests/data/test_articles.json")
     
     def test_pipeline_complet(self):
@@ -38,6 +40,39 @@ class TestPipelineIntegration(unittest.TestCase):
             self.assertGreaterEqual(score, -1.0)
             self.assertLessEqual(score, 1.0)
             print(f"✓ {company}: {score:+.3f}")
+    
+    def test_pipeline_multi_processus(self):
+        """Le mode pool de workers doit donner les mêmes scores que le mode simple."""
+        expected = self.orchestrator.run_analysis_pipeline(str(self.test_data_path))
+        
+        multi = MarketSentimentOrchestrator(
+            n_workers=2, threads_per_worker=1, analyzer_factory=make_analyzer
+        )
+        result = multi.run_analysis_pipeline(str(self.test_data_path))
+        
+        self.assertEqual(set(result), set(expected))
+        for company, score in expected.items():
+            self.assertAlmostEqual(result[company], score, places=3)
+
+
+class TestPipelineDeterministe(unittest.TestCase):
+    """Pipeline complet avec le backend déterministe (sans chargement de modèle)."""
+    
+    def setUp(self):
+        self.orchestrator = MarketSentimentOrchestrator(
+            sentiment_analyzer=create_analyzer("deterministic")
+        )
+        self.test_data_path = Path("tests/data/test_articles.json")
+    
+    def test_pipeline_complet(self):
+        first = self.orchestrator.run_analysis_pipeline(str(self.test_data_path))
+        second = self.orchestrator.run_analysis_pipeline(str(self.test_data_path))
+        
+        self.assertGreater(len(first), 0, "Aucune entreprise analysée")
+        self.assertEqual(first, second, "Le backend déterministe doit être reproductible")
+        for score in first.values():
+            self.assertGreaterEqual(score, -1.0)
+            self.assertLessEqual(score, 1.0)
 
 
 if __name__ == '__main__':
@@ -1,6 +1,9 @@
 # tests/unit/test_aggregator.py
 
 import unittest
+
+import numpy as np
+
 from domain.services.aggregator import SentimentAggregator
 from domain.entities.article import Article
 
@@ -134,6 +137,44 @@ class TestSentimentAggregator(unittest.TestCase):
         # Score moyen devrait être positif
         self.assertGreater(amazon_stats["avg_sentiment"], 0)
     
+    def test_aggregate_stream(self):
+        """Test : L'agrégation en flux donne le même résultat que la version liste."""
+        articles = [
+            Article("A1", "C", "Tesla", "CNBC", sentiment_label="positif", sentiment_score=0.9),
+            Article("A2", "C", "Apple", "CNBC", sentiment_label="négatif", sentiment_score=0.6),
+            Article("A3", "C", "Tesla", "CNBC", sentiment_label="neutre", sentiment_score=0.8),
+            Article("A4", "C", "Google", "CNBC"),  # Non analysé
+        ]
+        
+        expected = self.aggregator.aggregate_by_company(articles)
+        # Paquets de 3 : Tesla dans les deux paquets, Google seulement dans le second
+        result = self.aggregator.aggregate_stream(iter(articles), chunk_size=3)
+        
+        self.assertEqual(list(result), list(expected))
+        for company, score in expected.items():
+            self.assertAlmostEqual(result[company], score)
+    
+    def test_aggregate_probabilities(self):
+        """Test : L'agrégation sur matrice donne le même résultat que sur les articles."""
+        probs = np.array([
+            [0.05, 0.05, 0.90],  # positif 0.9
+            [0.60, 0.30, 0.10],  # négatif 0.6
+            [0.10, 0.80, 0.10],  # neutre 0.8
+        ], dtype=np.float32)
+        companies = ["Tesla", "Apple", "Tesla"]
+        articles = [
+            Article("A1", "C", "Tesla", "CNBC", sentiment_label="positif", sentiment_score=0.9),
+            Article("A2", "C", "Apple", "CNBC", sentiment_label="négatif", sentiment_score=0.6),
+            Article("A3", "C", "Tesla", "CNBC", sentiment_label="neutre", sentiment_score=0.8),
+        ]
+        
+        result = self.aggregator.aggregate_probabilities(companies, probs)
+        expected = self.aggregator.aggregate_by_company(articles)
+        
+        self.assertEqual(list(result), ["Tesla", "Apple"])
+        for company, score in expected.items():
+            self.assertAlmostEqual(result[company], score, places=6)
+    
     def test_empty_articles(self):
         """Test : Liste vide."""
         result = self.aggregator.aggregate_by_company([])
@@ -0,0 +1,108 @@
+# tests/unit/test_analyzer_registry.py
+
+import os
+import threading
+import unittest
+from unittest import mock
+
+from app import analyzer_registry
+from domain.entities.article import Article
+from domain.services.analyzer_protocol import SentimentAnalyzer, TextBatchAnalyzer
+from domain.services.deterministic_analyzer import DeterministicSentimentAnalyzer
+
+
+class TestAnalyzerRegistry(unittest.TestCase):
+    """Tests du registre d'analyseur partagé (sans charger FinBERT)."""
+    
+    def setUp(self):
+        analyzer_registry.reset_shared_analyzer()
+        patcher = mock.patch.object(analyzer_registry, "create_analyzer")
+        self.factory = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(analyzer_registry.reset_shared_analyzer)
+    
+    def test_instance_unique(self):
+        """Test : Le modèle n'est chargé qu'une fois par processus."""
+        first = analyzer_registry.get_shared_analyzer()
+        second = analyzer_registry.get_shared_analyzer()
+        
+        self.assertIs(first, second)
+        self.assertEqual(self.factory.call_count, 1)
+    
+    def test_appels_concurrents(self):
+        """Test : Des appels simultanés ne chargent pas deux copies."""
+        threads = [threading.Thread(target=analyzer_registry.get_shared_analyzer) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertEqual(self.factory.call_count, 1)
+    
+    def test_prechargement(self):
+        """Test : Le préchargement crée l'analyseur et lance une inférence factice."""
+        analyzer_registry.warmup_in_background().join(timeout=5)
+        
+        self.assertEqual(self.factory.call_count, 1)
+        analyzer_registry.get_shared_analyzer().warmup.assert_called_once()
+
+
+class TestBackendSelection(unittest.TestCase):
+    """Tests du choix de backend par variable d'environnement."""
+    
+    def test_backend_par_environnement(self):
+        env = {analyzer_registry.BACKEND_ENV: "deterministic"}
+        with mock.patch.dict(os.environ, env):
+            analyzer = analyzer_registry.create_analyzer()
+        
+        self.assertIsInstance(analyzer, DeterministicSentimentAnalyzer)
+        self.assertIsInstance(analyzer, SentimentAnalyzer)
+    
+    def test_url_serveur_selectionne_remote(self):
+        env = {analyzer_registry.SERVER_URL_ENV: "http://127.0.0.1:9999"}
+        with mock.patch.dict(os.environ, env):
+            os.environ.pop(analyzer_registry.BACKEND_ENV, None)
+            self.assertEqual(analyzer_registry.selected_backend(), "remote")
+    
+    def test_backend_inconnu(self):
+        with self.assertRaises(ValueError):
+            analyzer_registry.create_analyzer("inexistant")
+
+
+class TestDeterministicAnalyzer(unittest.TestCase):
+    """Tests du backend déterministe."""
+    
+    def setUp(self):
+        self.analyzer = DeterministicSentimentAnalyzer()
+    
+    def test_meme_texte_meme_resultat(self):
+        first = self.analyzer.analyze_text("Tesla reports record profits")
+        second = self.analyzer.analyze_text("Tesla reports record profits")
+        
+        self.assertEqual(first, second)
+        self.assertAlmostEqual(sum(first.probabilities.values()), 1.0)
+        self.assertEqual(first.score, max(first.probabilities.values()))
+    
+    def test_analyze_batch(self):
+        articles = [
+            Article("Titre", "Contenu", "Tesla", "CNBC"),
+            Article("Autre titre", "Autre contenu", "Apple", "CNBC"),
+        ]
+        
+        self.analyzer.analyze_batch(articles)
+        
+        for article in articles:
+            self.assertIn(article.sentiment_label, ["positif", "neutre", "négatif"])
+            self.assertIsNotNone(article.sentiment_probas)
+    
+    def test_base_abstraite(self):
+        """Test : Une sous-classe sans analyze_texts n'est pas instanciable."""
+        class Incomplet(TextBatchAnalyzer):
+            pass
+        
+        with self.assertRaises(TypeError):
+            Incomplet()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+# tests/unit/test_article_archive.py
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from infrastructure.database.article_archive import SegmentedArchive
+
+
+def _articles(n, prefix="a"):
+    return [{"title": f"{prefix}{i}", "link": f"https://example.com/{prefix}{i}"} for i in range(n)]
+
+
+class TestSegmentedArchive(unittest.TestCase):
+    """Tests de l'archive segmentée (gzip JSONL en ajout seul)."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.archive_dir = os.path.join(self.tmp_dir.name, "archive")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_ajout_et_relecture(self):
+        archive = SegmentedArchive(self.archive_dir)
+        archive.append(_articles(3, "a"), "2026-01-10 08:00:00")
+        archive.append(_articles(2, "b"), "2026-01-10 09:00:00")
+
+        reopened = SegmentedArchive(self.archive_dir)
+        entries = list(reopened.iter_entries())
+        self.assertEqual([entry["count"] for entry in entries], [3, 2])
+        self.assertEqual(len(reopened.segments), 1)
+        self.assertEqual(reopened.segments[0]["articles"], 5)
+        self.assertEqual([a["title"] for a in reopened.iter_articles()], ["a0", "a1", "a2", "b0", "b1"])
+
+    def test_nouveau_segment_chaque_jour(self):
+        archive = SegmentedArchive(self.archive_dir)
+        archive.append(_articles(1), "2026-01-10 23:00:00")
+        archive.append(_articles(1), "2026-01-11 01:00:00")
+
+        self.assertEqual(
+            [segment["file"] for segment in archive.segments],
+            ["articles-20260110-000.jsonl.gz", "articles-20260111-000.jsonl.gz"],
+        )
+
+    def test_nouveau_segment_quand_plein(self):
+        archive = SegmentedArchive(self.archive_dir, max_segment_bytes=1)
+        archive.append(_articles(1), "2026-01-10 08:00:00")
+        archive.append(_articles(1), "2026-01-10 09:00:00")
+
+        self.assertEqual(
+            [segment["file"] for segment in archive.segments],
+            ["articles-20260110-000.jsonl.gz", "articles-20260110-001.jsonl.gz"],
+        )
+
+    def test_lecture_par_periode(self):
+        archive = SegmentedArchive(self.archive_dir)
+        for day in ("2026-01-10", "2026-01-11", "2026-01-12"):
+            archive.append(_articles(1, day), f"{day} 12:00:00")
+
+        # Le segment du 10 n'est pas décompressé : un fichier corrompu ne gêne pas
+        with open(os.path.join(self.archive_dir, archive.segments[0]["file"]), "wb") as f:
+            f.write(b"corrompu")
+
+        timestamps = [entry["timestamp"] for entry in archive.iter_entries(since="2026-01-11")]
+        self.assertEqual(timestamps, ["2026-01-11 12:00:00", "2026-01-12 12:00:00"])
+
+        timestamps = [entry["timestamp"] for entry in archive.iter_entries("2026-01-11", "2026-01-11 23:59:59")]
+        self.assertEqual(timestamps, ["2026-01-11 12:00:00"])
+
+    def test_import_ancienne_archive_une_seule_fois(self):
+        legacy_path = os.path.join(self.tmp_dir.name, "scraped_articles_archive.json")
+        with open(legacy_path, "w", encoding="utf-8") as f:
+            json.dump([
+                {"timestamp": "2026-01-01 10:00:00", "count": 2, "articles": _articles(2)},
+                {"timestamp": "2026-01-02 10:00:00", "count": 1, "articles": _articles(1)},
+            ], f)
+
+        SegmentedArchive(self.archive_dir, legacy_path=legacy_path)
+        archive = SegmentedArchive(self.archive_dir, legacy_path=legacy_path)
+
+        self.assertEqual(len(list(archive.iter_entries())), 2)
+        self.assertEqual(len(list(archive.iter_articles())), 3)
+        self.assertTrue(os.path.exists(legacy_path))
+
+    def test_import_interrompu_sans_doublon(self):
+        legacy_path = os.path.join(self.tmp_dir.name, "scraped_articles_archive.json")
+        with open(legacy_path, "w", encoding="utf-8") as f:
+            json.dump([
+                {"timestamp": "2026-01-01 10:00:00", "count": 2, "articles": _articles(2)},
+                {"timestamp": "2026-01-01 11:00:00", "count": 1, "articles": _articles(1)},
+                {"timestamp": "2026-01-02 10:00:00", "count": 1, "articles": _articles(1)},
+            ], f)
+        archive = SegmentedArchive(self.archive_dir)
+        archive.append(_articles(1, "n"), "2026-01-01 09:00:00")
+
+        # Arrêt brutal au moment d'enregistrer l'index : segments écrits, import non noté
+        with mock.patch.object(SegmentedArchive, "_write_index", side_effect=OSError("disque plein")):
+            with self.assertRaises(OSError):
+                SegmentedArchive(self.archive_dir, legacy_path=legacy_path)
+
+        archive = SegmentedArchive(self.archive_dir, legacy_path=legacy_path)
+
+        timestamps = [entry["timestamp"] for entry in archive.iter_entries()]
+        self.assertEqual(timestamps, [
+            "2026-01-01 09:00:00", "2026-01-01 10:00:00", "2026-01-01 11:00:00", "2026-01-02 10:00:00"
+        ])
+        self.assertEqual(archive.imported, ["scraped_articles_archive.json"])
+
+
+if __name__ == '__main__':
+    unittest.main()
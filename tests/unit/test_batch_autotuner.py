@@ -0,0 +1,131 @@
+# tests/unit/test_batch_autotuner.py
+
+import os
+import tempfile
+import time
+import unittest
+
+from domain.services.batch_autotuner import BatchAutotuner
+
+
+class _FakeTokenizer:
+    def __call__(self, text, truncation=True, max_length=512):
+        return {"input_ids": list(range(min(len(text.split()), max_length)))}
+
+
+class _FakeAnalyzer:
+    """Analyseur factice : coût fixe par passe + surcoût par texte au-delà de 16."""
+    
+    model_id = "fake-model"
+    backend = "torch"
+    max_length = 128
+    batch_size = 8
+    max_tokens_per_batch = 4096
+    
+    def __init__(self):
+        self.tokenizer = _FakeTokenizer()
+    
+    def _pad(self, batch_ids):
+        return batch_ids
+    
+    def _predict(self, inputs):
+        # Les gros lots amortissent le coût fixe jusqu'à 16 textes, puis saturent
+        time.sleep(0.002 + 0.0005 * max(0, len(inputs) - 16))
+        return [[0.2, 0.3, 0.5]] * len(inputs)
+
+
+class _FastTuner(BatchAutotuner):
+    MIN_TRIAL_TIME = 0.01
+
+
+class _RecordingLock:
+    """Verrou factice : compte les prises et vérifie qu'elles ne s'imbriquent pas."""
+    
+    def __init__(self):
+        self.held = False
+        self.acquired = 0
+    
+    def __enter__(self):
+        assert not self.held
+        self.held = True
+        self.acquired += 1
+    
+    def __exit__(self, *exc):
+        self.held = False
+
+
+class TestBatchAutotuner(unittest.TestCase):
+    """Tests de l'autotuner de lots (sans modèle)."""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.tuning_path = os.path.join(self.tmp_dir.name, "batch_tuning.json")
+        self.analyzer = _FakeAnalyzer()
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def _tune(self):
+        tuner = _FastTuner(
+            self.analyzer,
+            batch_sizes=(4, 16),
+            sequence_lengths=(32, 128, 512),
+            tuning_path=self.tuning_path,
+        )
+        return tuner, tuner.tune()
+    
+    def test_meilleure_taille_de_lot(self):
+        tuner, tuning = self._tune()
+        
+        self.assertEqual(tuning["batch_size"], 16)
+        self.assertEqual(tuning["max_tokens_per_batch"], 16 * 128)
+        # Longueurs plafonnées à max_length de l'analyseur
+        self.assertEqual(tuner.sequence_lengths, [32, 128])
+    
+    def test_reglages_enregistres_par_machine_et_modele(self):
+        _, tuning = self._tune()
+        
+        saved = BatchAutotuner.lookup("fake-model", "torch", self.tuning_path)
+        self.assertEqual(saved["batch_size"], tuning["batch_size"])
+        self.assertIsNone(BatchAutotuner.lookup("fake-model", "onnx", self.tuning_path))
+        self.assertIsNone(BatchAutotuner.lookup("autre-modele", "torch", self.tuning_path))
+    
+    def test_longueur_sans_essai_ignoree(self):
+        # 128 tokens × 4 dépasse le plafond : seule la longueur 32 est mesurée
+        tuner = _FastTuner(self.analyzer, batch_sizes=(4, 16), sequence_lengths=(32, 128),
+                           tuning_path=self.tuning_path)
+        tuner.MAX_TRIAL_TOKENS = 16 * 32
+        
+        tuning = tuner.tune()
+        
+        self.assertEqual(tuning["batch_size"], 16)
+        self.assertEqual(tuning["max_tokens_per_batch"], 16 * 32)
+    
+    def test_aucun_essai_possible(self):
+        tuner = _FastTuner(self.analyzer, batch_sizes=(4, 16), sequence_lengths=(32, 128),
+                           tuning_path=self.tuning_path)
+        tuner.MAX_TRIAL_TOKENS = 16
+        
+        tuning = tuner.tune()
+        
+        self.assertEqual(tuning["batch_size"], 8)
+        self.assertEqual(tuning["max_tokens_per_batch"], 4096)
+    
+    def test_verrou_pris_a_chaque_essai(self):
+        """Le verrou est relâché entre les essais (analyses possibles pendant la mesure)."""
+        lock = _RecordingLock()
+        tuner = _FastTuner(self.analyzer, batch_sizes=(4, 16), sequence_lengths=(32, 128),
+                           tuning_path=self.tuning_path, lock=lock)
+        
+        tuning = tuner.tune()
+        
+        # Une prise par essai, plus une par longueur pour la tokenisation
+        self.assertEqual(lock.acquired, len(tuning["measures"]) + 2)
+        self.assertFalse(lock.held)
+    
+    def test_fichier_absent(self):
+        self.assertIsNone(BatchAutotuner.lookup("fake-model", "torch", self.tuning_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+# tests/unit/test_cascade.py
+
+import unittest
+
+from domain.services.sentiment_analyzer import LexiconSentimentClassifier, CascadeSentimentAnalyzer
+from domain.entities.article import Article
+from domain.entities.sentiment import SentimentResult
+
+
+class FakeFinBERT:
+    """Remplace FinBERT : toujours négatif, et mémorise les textes reçus."""
+    
+    def __init__(self):
+        self.received = []
+    
+    def analyze_texts(self, texts, verbose=False):
+        self.received.extend(texts)
+        return [
+            SentimentResult("négatif", 0.95, {"négatif": 0.95, "neutre": 0.03, "positif": 0.02})
+            for _ in texts
+        ]
+
+
+class TestLexiconClassifier(unittest.TestCase):
+    """Tests du classifieur rapide par lexique."""
+    
+    def setUp(self):
+        self.classifier = LexiconSentimentClassifier()
+    
+    def test_positif_evident(self):
+        result = self.classifier.analyze_text("Tesla reports record profits, revenue surges")
+        self.assertEqual(result.label, "positif")
+        self.assertGreaterEqual(result.score, 0.8)
+        self.assertEqual(result.tier, "lexique")
+    
+    def test_confiance_plafonnee(self):
+        """Même unanime, le lexique ne donne jamais de probabilité 0 ou 1."""
+        result = self.classifier.analyze_text("Record profits, strong growth, revenue surges and gains")
+        self.assertAlmostEqual(result.score, LexiconSentimentClassifier.MAX_CONFIDENCE)
+        self.assertTrue(all(0.0 < p < 1.0 for p in result.probabilities.values()))
+    
+    def test_neutre_sans_indice(self):
+        result = self.classifier.analyze_text("Apple creates smartphones in California")
+        self.assertEqual(result.label, "neutre")
+        self.assertLess(result.score, 0.5)
+        self.assertAlmostEqual(sum(result.probabilities.values()), 1.0)
+    
+    def test_negation(self):
+        result = self.classifier.analyze_text("The company did not report any growth, no profit, no gains")
+        self.assertEqual(result.label, "négatif")
+    
+    def test_polarites_melangees_peu_sures(self):
+        """Des indices contradictoires (ou du sarcasme) doivent rester sous le seuil."""
+        result = self.classifier.analyze_text("Le bénéfice progresse, mais les pertes se creusent et le titre chute.")
+        self.assertLess(result.score, 0.8)
+
+
+class TestCascadeAnalyzer(unittest.TestCase):
+    """Tests du routage lexique → FinBERT."""
+    
+    def setUp(self):
+        self.finbert = FakeFinBERT()
+        self.cascade = CascadeSentimentAnalyzer(self.finbert, threshold=0.8)
+    
+    def test_seuls_les_cas_difficiles_vont_a_finbert(self):
+        articles = [
+            Article("Tesla record profits", "Revenue surges, strong growth.", "Tesla", "CNBC"),
+            Article("Bravo", "Bravo à la direction pour cette magnifique perte record.", "X", "Test"),
+        ]
+        
+        self.cascade.analyze_batch(articles)
+        
+        self.assertEqual(articles[0].sentiment_tier, "lexique")
+        self.assertEqual(articles[0].sentiment_label, "positif")
+        self.assertEqual(articles[1].sentiment_tier, "finbert")
+        self.assertEqual(articles[1].sentiment_label, "négatif")
+        self.assertEqual(len(self.finbert.received), 1)
+    
+    def test_sans_indice_va_a_finbert(self):
+        """Aucun mot du lexique : pas de neutre « sûr », FinBERT décide."""
+        article = Article("Apple", "Apple creates smartphones in California", "Apple", "CNBC")
+        
+        self.cascade.analyze_article(article)
+        
+        self.assertEqual(article.sentiment_tier, "finbert")
+        self.assertEqual(len(self.finbert.received), 1)
+    
+    def test_tier_dans_to_dict(self):
+        article = Article("Tesla record profits", "Revenue surges.", "Tesla", "CNBC")
+        self.cascade.analyze_article(article)
+        self.assertEqual(article.to_dict()["sentiment_tier"], "lexique")
+
+
+if __name__ == '__main__':
+    unittest.main()
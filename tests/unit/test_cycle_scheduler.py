@@ -0,0 +1,116 @@
+# tests/unit/test_cycle_scheduler.py
+
+import threading
+import unittest
+
+from app.cycle_scheduler import CycleScheduler
+
+
+class _FakeClock:
+    """Horloge simulée : les cycles et les attentes avancent le temps."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+class _InstantEvent(threading.Event):
+    """Event dont wait() avance l'horloge simulée au lieu de dormir."""
+    
+    def __init__(self, clock):
+        super().__init__()
+        self.clock = clock
+    
+    def wait(self, timeout=None):
+        self.clock.now += timeout or 0.0
+        return self.is_set()
+
+
+class TestCycleScheduler(unittest.TestCase):
+    """Planification des cycles du pipeline continu (temps simulé)."""
+    
+    def setUp(self):
+        self.clock = _FakeClock()
+        self.starts = []
+        self.budgets = []
+    
+    def _scheduler(self, durations, failures=(), **kwargs):
+        """Cycles dont la durée (s) et l'échec éventuel sont fixés d'avance."""
+        def cycle(number, budget):
+            self.starts.append(self.clock.now)
+            self.budgets.append(budget)
+            self.clock.now += durations[number - 1]
+            if number in failures:
+                raise RuntimeError("scraping impossible")
+        
+        scheduler = CycleScheduler(cycle, clock=self.clock, **kwargs)
+        scheduler._stop_event = _InstantEvent(self.clock)
+        return scheduler
+    
+    def test_grille_reguliere(self):
+        scheduler = self._scheduler([10, 10, 10], interval=60)
+        scheduler.run(max_cycles=3)
+        
+        self.assertEqual(self.starts, [0, 60, 120])
+    
+    def test_jitter_borne(self):
+        scheduler = self._scheduler([1] * 20, interval=60, jitter=5)
+        scheduler.run(max_cycles=20)
+        
+        # Le jitter ne s'accumule pas : le départ k reste dans [k·interval, k·interval + jitter]
+        for k, start in enumerate(self.starts):
+            self.assertGreaterEqual(start, k * 60)
+            self.assertLessEqual(start, k * 60 + 5)
+    
+    def test_jitter_sans_derive(self):
+        # Jitter maximal à chaque départ : la grille ne dérive pas pour autant
+        scheduler = self._scheduler([1] * 50, interval=60, jitter=5)
+        scheduler.rng.uniform = lambda low, high: high
+        scheduler.run(max_cycles=50)
+        
+        self.assertEqual(self.starts[-1], 49 * 60 + 5)
+        self.assertEqual(scheduler.skipped_slots, 0)
+    
+    def test_cycle_trop_long_saute_les_creneaux(self):
+        # Le 1er cycle dure 150 s : les créneaux 60 et 120 sont sautés, pas d'enchaînement
+        scheduler = self._scheduler([150, 10], interval=60)
+        scheduler.run(max_cycles=2)
+        
+        self.assertEqual(self.starts, [0, 180])
+        self.assertEqual(scheduler.skipped_slots, 2)
+    
+    def test_budget_ecourte_le_cycle_suivant(self):
+        scheduler = self._scheduler([100, 10, 10], interval=300, cycle_budget=50)
+        scheduler.run(max_cycles=3)
+        
+        self.assertEqual(self.budgets, [None, 50, None])
+    
+    def test_backoff_exponentiel(self):
+        scheduler = self._scheduler(
+            [0] * 5, failures={1, 2, 3, 4}, interval=600, backoff_base=10, max_backoff=30
+        )
+        scheduler.run(max_cycles=5)
+        
+        gaps = [current - previous for previous, current in zip(self.starts, self.starts[1:])]
+        self.assertEqual(gaps, [10, 20, 30, 30])
+        self.assertEqual(scheduler.consecutive_failures, 0)
+    
+    def test_arret(self):
+        scheduler = self._scheduler([1] * 10, interval=60)
+        original_cycle = scheduler.cycle
+        
+        def cycle(number, budget):
+            original_cycle(number, budget)
+            if number == 2:
+                scheduler.stop()
+        
+        scheduler.cycle = cycle
+        scheduler.run()
+        
+        self.assertEqual(scheduler.cycle_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+# tests/unit/test_deduplication.py
+
+import unittest
+
+from domain.services.deduplication import SimHashDeduplicator
+from domain.entities.article import Article
+
+
+DEPECHE = (
+    "Federal Reserve officials signaled on Wednesday that interest rates would stay "
+    "higher for longer, as inflation remained above the central bank's two percent "
+    "target and the labor market showed few signs of cooling. Treasury yields rose "
+    "after the announcement while major stock indexes pared earlier gains, with "
+    "technology shares leading the decline in afternoon trading on Wall Street."
+)
+
+
+class TestSimHashDeduplicator(unittest.TestCase):
+    """Tests de la détection de quasi-doublons (sans modèle)."""
+    
+    def setUp(self):
+        self.dedup = SimHashDeduplicator()
+    
+    def test_copies_identiques_meme_empreinte(self):
+        self.assertEqual(self.dedup.fingerprint(DEPECHE), self.dedup.fingerprint(DEPECHE))
+    
+    def test_quasi_doublon_regroupe(self):
+        """Une reprise signée par l'agence rejoint le groupe de l'original."""
+        reprise = DEPECHE + " (Reuters)"
+        autre = "Apple unveiled a new iPhone lineup with longer battery life and a faster chip."
+        
+        ids = self.dedup.cluster([DEPECHE, autre, reprise])
+        
+        self.assertEqual(ids[0], ids[2])
+        self.assertNotEqual(ids[0], ids[1])
+    
+    def test_identifiant_stable(self):
+        """L'identifiant est l'empreinte du représentant (réutilisable d'un cycle à l'autre)."""
+        ids = self.dedup.cluster([DEPECHE, DEPECHE])
+        self.assertEqual(ids[0], f"{self.dedup.fingerprint(DEPECHE):016x}")
+    
+    def test_cluster_articles(self):
+        """Même dépêche sous plusieurs tickers : un groupe, premier article représentant."""
+        articles = [
+            Article(title="Fed holds", content=DEPECHE, company=company, source="Reuters", url="https://example.com/fed")
+            for company in ("Tesla", "Apple", "Microsoft")
+        ]
+        articles.append(Article(title="iPhone", content="Apple unveiled a new iPhone.", company="Apple", source="CNBC"))
+        
+        clusters = self.dedup.cluster_articles(articles)
+        
+        self.assertEqual(len(clusters), 2)
+        first = clusters[articles[0].cluster_id]
+        self.assertEqual([a.company for a in first], ["Tesla", "Apple", "Microsoft"])
+        self.assertIsNotNone(articles[3].cluster_id)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+# tests/unit/test_embedding_store.py
+
+import tempfile
+import unittest
+
+import numpy as np
+
+from infrastructure.database.embedding_store import EmbeddingStore
+
+
+class TestEmbeddingStore(unittest.TestCase):
+    """Tests du stockage d'embeddings et de la recherche top-k."""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.store = EmbeddingStore(data_dir=self.tmp_dir.name)
+        
+        # 4 thèmes de 25 articles : vecteurs proches du centre de leur thème
+        rng = np.random.default_rng(0)
+        self.centers = rng.normal(size=(4, 32))
+        self.vectors = np.repeat(self.centers, 25, axis=0) + 0.1 * rng.normal(size=(100, 32))
+        self.ids = list(range(1, 101))
+        self.store.add(self.ids, self.vectors)
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def test_stockage_float16_normalise(self):
+        self.assertEqual(len(self.store), 100)
+        self.assertEqual(self.store._vectors().dtype, np.float16)
+        self.assertAlmostEqual(float(np.linalg.norm(self.store.get(1))), 1.0, places=2)
+        self.assertIsNone(self.store.get(999))
+    
+    def test_similar_to_meme_theme(self):
+        results = self.store.similar_to(1, k=5)
+        
+        self.assertEqual(len(results), 5)
+        self.assertNotIn(1, [article_id for article_id, _ in results])
+        self.assertTrue(all(2 <= article_id <= 25 for article_id, _ in results))
+        similarities = [similarity for _, similarity in results]
+        self.assertEqual(similarities, sorted(similarities, reverse=True))
+    
+    def test_rechargement_et_mise_a_jour(self):
+        # Remplacement d'un vecteur existant + ajout d'un nouvel article
+        self.store.add([1, 101], [self.centers[3], self.centers[3]])
+        
+        reopened = EmbeddingStore(data_dir=self.tmp_dir.name)
+        self.assertEqual(len(reopened), 101)
+        top_ids = {article_id for article_id, _ in reopened.similar_to(101, k=2)}
+        self.assertIn(1, top_ids)
+    
+    def test_index_ivf(self):
+        self.store.build_index(n_lists=4)
+        query = self.centers[2]
+        
+        exact = {article_id for article_id, _ in self.store.search(query, k=10)}
+        approx = {article_id for article_id, _ in self.store.search(query, k=10, n_probe=1)}
+        self.assertEqual(exact, approx)
+        
+        # Article ajouté après l'entraînement : toujours trouvé
+        self.store.add([500], [query])
+        top_id, similarity = self.store.search(query, k=1, n_probe=1)[0]
+        self.assertEqual(top_id, 500)
+        self.assertAlmostEqual(similarity, 1.0, places=2)
+    
+    def test_lecture_seule(self):
+        with self.assertRaises(ValueError):
+            self.store._vectors()[0] = 0
+    
+    def test_index_ivf_apres_mise_a_jour(self):
+        """Un article indexé dont le vecteur change est rangé dans sa nouvelle liste."""
+        self.store.build_index(n_lists=4)
+        query = self.centers[3]
+        
+        # L'article 1 (thème 0) devient identique au centre du thème 3
+        self.store.add([1], [query])
+        
+        top_id, similarity = self.store.search(query, k=1, n_probe=1)[0]
+        self.assertEqual(top_id, 1)
+        self.assertAlmostEqual(similarity, 1.0, places=2)
+        
+        # L'affectation est enregistrée avec l'index
+        reopened = EmbeddingStore(data_dir=self.tmp_dir.name)
+        self.assertEqual(reopened.search(query, k=1, n_probe=1)[0][0], 1)
+    
+    def test_dimension_incompatible(self):
+        with self.assertRaises(ValueError):
+            self.store.add([200], np.ones((1, 8)))
+
+
+if __name__ == '__main__':
+    unittest.main()
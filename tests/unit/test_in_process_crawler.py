@@ -0,0 +1,188 @@
+# tests/unit/test_in_process_crawler.py
+
+import importlib.util
+import os
+import queue
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+import unittest
+
+from infrastructure.datasources.in_process_crawler import (
+    _CRAWL_DONE,
+    InProcessCrawler,
+    QueueItemPipeline,
+    iter_batches,
+)
+
+
+class _FakeCrawler:
+    def __init__(self, item_queue):
+        self.item_queue = item_queue
+
+
+# Projet Scrapy minimal : spiders sans réseau (items produits par start())
+_STUB_PROJECT = "stub_inprocess_project"
+
+_STUB_SPIDERS = """
+import asyncio
+import scrapy
+
+
+class ThreeItemsSpider(scrapy.Spider):
+    name = "three"
+
+    async def start(self):
+        for i in range(3):
+            yield {"title": f"Article {i}", "link": f"https://example.com/{i}"}
+
+
+class EndlessSpider(scrapy.Spider):
+    name = "endless"
+
+    async def start(self):
+        i = 0
+        while True:
+            i += 1
+            yield {"title": f"Article {i}", "link": f"https://example.com/{i}"}
+            await asyncio.sleep(0)
+"""
+
+
+class TestInProcessCrawler(unittest.TestCase):
+    """File d'articles entre le crawl Scrapy et l'analyse (sans Scrapy)."""
+    
+    def test_pipeline_depose_les_items(self):
+        item_queue = queue.Queue()
+        pipeline = QueueItemPipeline.from_crawler(_FakeCrawler(item_queue))
+        item = {"title": "Tesla", "link": "https://example.com/a"}
+        
+        self.assertIs(pipeline.process_item(item, spider=None), item)
+        self.assertEqual(item_queue.get_nowait(), item)
+    
+    def test_paquets_par_taille(self):
+        item_queue = queue.Queue()
+        for i in range(5):
+            item_queue.put({"id": i})
+        item_queue.put(_CRAWL_DONE)
+        
+        batches = list(iter_batches(item_queue, max_size=2, max_wait=1.0))
+        
+        self.assertEqual([len(batch) for batch in batches], [2, 2, 1])
+        self.assertEqual([item["id"] for batch in batches for item in batch], list(range(5)))
+    
+    def test_paquet_envoye_avant_la_fin_du_crawl(self):
+        item_queue = queue.Queue()
+        item_queue.put({"id": 0})
+        
+        def slow_crawl():
+            time.sleep(0.3)
+            item_queue.put({"id": 1})
+            item_queue.put(_CRAWL_DONE)
+        
+        threading.Thread(target=slow_crawl).start()
+        start = time.monotonic()
+        batches = iter_batches(item_queue, max_size=10, max_wait=0.05)
+        
+        # Premier paquet disponible après max_wait, sans attendre le reste du crawl
+        self.assertEqual(next(batches), [{"id": 0}])
+        self.assertLess(time.monotonic() - start, 0.25)
+        self.assertEqual(list(batches), [[{"id": 1}]])
+    
+    def test_crawl_vide(self):
+        item_queue = queue.Queue()
+        item_queue.put(_CRAWL_DONE)
+        
+        self.assertEqual(list(iter_batches(item_queue, max_size=10, max_wait=0.1)), [])
+    
+    def test_producteur_mort_ne_bloque_pas(self):
+        batches = iter_batches(queue.Queue(), max_size=10, max_wait=0.05, is_alive=lambda: False)
+        
+        with self.assertRaises(RuntimeError):
+            next(batches)
+    
+    def test_pipeline_abandonne_si_arret(self):
+        item_queue = queue.Queue(maxsize=1)
+        item_queue.put({"id": 0})
+        pipeline = QueueItemPipeline(item_queue, threading.Event())
+        pipeline.stop_event.set()
+        
+        # File pleine mais consommateur parti : le put rend la main
+        pipeline.process_item({"id": 1}, spider=None)
+        self.assertEqual(item_queue.qsize(), 1)
+
+
+@unittest.skipUnless(importlib.util.find_spec("scrapy"), "Scrapy non installé")
+class TestInProcessCrawl(unittest.TestCase):
+    """Crawl réel (Scrapy + reactor dans un thread) sur des spiders sans réseau."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.tmp_dir = tempfile.TemporaryDirectory()
+        root = cls.tmp_dir.name
+        spiders_dir = os.path.join(root, _STUB_PROJECT, "spiders")
+        os.makedirs(spiders_dir)
+        files = {
+            "scrapy.cfg": f"[settings]\ndefault = {_STUB_PROJECT}.settings\n",
+            os.path.join(_STUB_PROJECT, "__init__.py"): "",
+            os.path.join(_STUB_PROJECT, "settings.py"): (
+                f'SPIDER_MODULES = ["{_STUB_PROJECT}.spiders"]\nLOG_LEVEL = "ERROR"\n'
+            ),
+            os.path.join(_STUB_PROJECT, "spiders", "__init__.py"): "",
+            os.path.join(_STUB_PROJECT, "spiders", "stub.py"): textwrap.dedent(_STUB_SPIDERS),
+        }
+        for name, content in files.items():
+            with open(os.path.join(root, name), "w", encoding="utf-8") as f:
+                f.write(content)
+    
+    @classmethod
+    def tearDownClass(cls):
+        if cls.tmp_dir.name in sys.path:
+            sys.path.remove(cls.tmp_dir.name)
+        cls.tmp_dir.cleanup()
+    
+    def _collect(self, batches, timeout=30):
+        """Consomme les paquets dans un thread : un blocage fait échouer le test."""
+        result = {}
+        
+        def consume():
+            result["batches"] = list(batches)
+        
+        thread = threading.Thread(target=consume, daemon=True)
+        thread.start()
+        thread.join(timeout)
+        self.assertFalse(thread.is_alive(), "crawl bloqué")
+        return result["batches"]
+    
+    def test_crawl_batches(self):
+        crawler = InProcessCrawler(self.tmp_dir.name, "three")
+        
+        batches = self._collect(crawler.crawl_batches(max_size=2, max_wait=0.5))
+        
+        titles = sorted(item["title"] for batch in batches for item in batch)
+        self.assertEqual(titles, ["Article 0", "Article 1", "Article 2"])
+        self.assertIsNone(crawler.last_error)
+    
+    def test_spider_inconnu(self):
+        crawler = InProcessCrawler(self.tmp_dir.name, "inconnu")
+        
+        self.assertEqual(self._collect(crawler.crawl_batches(max_wait=0.1)), [])
+        self.assertIn("KeyError", crawler.last_error)
+    
+    def test_consommateur_abandonne_puis_nouveau_crawl(self):
+        # File saturée par un spider sans fin, puis abandon du consommateur
+        endless = InProcessCrawler(self.tmp_dir.name, "endless", queue_size=4)
+        batches = endless.crawl_batches(max_size=2, max_wait=0.1)
+        self.assertEqual(len(next(batches)), 2)
+        batches.close()
+        
+        # Le reactor n'est pas resté bloqué : un autre crawl aboutit
+        crawler = InProcessCrawler(self.tmp_dir.name, "three")
+        batches = self._collect(crawler.crawl_batches(max_size=10, max_wait=0.5))
+        self.assertEqual(sum(len(batch) for batch in batches), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+# tests/unit/test_inference_cache.py
+
+import unittest
+import os
+import tempfile
+
+from infrastructure.database.inference_cache import InferenceCache
+
+
+def _result(label: str, score: float) -> dict:
+    return {"label": label, "score": score, "probabilities": {label: score}}
+
+
+class TestInferenceCache(unittest.TestCase):
+    """Tests unitaires du cache d'inférence (SQLite)."""
+    
+    def setUp(self):
+        """Crée une DB temporaire pour chaque test."""
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+        self.cache = InferenceCache(db_name=self.temp_db.name, max_entries=3)
+    
+    def tearDown(self):
+        if os.path.exists(self.temp_db.name):
+            try:
+                os.unlink(self.temp_db.name)
+            except PermissionError:
+                pass
+    
+    def test_cle_depend_du_modele(self):
+        """Test : Le même texte a une clé différente selon le modèle."""
+        key_a = InferenceCache.make_key("Tesla monte", "model-a")
+        key_b = InferenceCache.make_key("Tesla monte", "model-b")
+        
+        self.assertNotEqual(key_a, key_b)
+        self.assertEqual(key_a, InferenceCache.make_key("Tesla monte", "model-a"))
+    
+    def test_aller_retour(self):
+        """Test : Un résultat enregistré est relu à l'identique."""
+        self.cache.put_many({"k1": _result("positif", 0.9)})
+        
+        found = self.cache.get_many(["k1", "absent"])
+        
+        self.assertEqual(list(found), ["k1"])
+        self.assertEqual(found["k1"]["label"], "positif")
+        self.assertAlmostEqual(found["k1"]["score"], 0.9)
+        self.assertEqual(found["k1"]["probabilities"], {"positif": 0.9})
+    
+    def test_eviction_lru(self):
+        """Test : L'entrée la moins récemment utilisée est évincée."""
+        self.cache.put_many({"k1": _result("positif", 0.9)})
+        self.cache.put_many({"k2": _result("neutre", 0.8)})
+        self.cache.put_many({"k3": _result("négatif", 0.7)})
+        
+        # k1 redevient récent, k2 devient le plus ancien
+        self.cache.get_many(["k1"])
+        self.cache.put_many({"k4": _result("neutre", 0.6)})
+        
+        self.assertEqual(self.cache.count(), 3)
+        self.assertEqual(set(self.cache.get_many(["k1", "k2", "k3", "k4"])), {"k1", "k3", "k4"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+# tests/unit/test_inference_config.py
+
+import json
+import os
+import tempfile
+import unittest
+
+from domain.services.inference_config import InferenceConfig
+
+
+class TestInferenceConfig(unittest.TestCase):
+    """Tests de la configuration d'exécution (sans modèle)."""
+    
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.config_path = os.path.join(self.tmp_dir.name, "inference_config.json")
+    
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+    
+    def _write_config(self, values):
+        with open(self.config_path, "w", encoding="utf-8") as f:
+            json.dump(values, f)
+    
+    def test_valeurs_par_defaut(self):
+        config = InferenceConfig.load(path=self.config_path, environ={})
+        
+        self.assertEqual(config, InferenceConfig())
+        self.assertTrue(config.inference_mode)
+        self.assertIsNone(config.intra_op_threads)
+    
+    def test_fichier_json(self):
+        self._write_config({"intra_op_threads": 4, "batch_size": 32, "compile": True})
+        
+        config = InferenceConfig.load(path=self.config_path, environ={})
+        
+        self.assertEqual(config.intra_op_threads, 4)
+        self.assertEqual(config.batch_size, 32)
+        self.assertTrue(config.compile)
+    
+    def test_environnement_prioritaire_sur_fichier(self):
+        self._write_config({"batch_size": 32, "inference_mode": True})
+        environ = {
+            "MARKET_SENTIMENT_BATCH_SIZE": "8",
+            "MARKET_SENTIMENT_INFERENCE_MODE": "false",
+            "MARKET_SENTIMENT_EMBEDDINGS": "oui",
+            "MARKET_SENTIMENT_WARMUP": "0",
+        }
+        
+        config = InferenceConfig.load(path=self.config_path, environ=environ)
+        
+        self.assertEqual(config.batch_size, 8)
+        self.assertFalse(config.inference_mode)
+        self.assertTrue(config.embeddings)
+        self.assertFalse(config.warmup)
+    
+    def test_fichier_designe_par_variable(self):
+        self._write_config({"max_length": 128})
+        
+        config = InferenceConfig.load(environ={"MARKET_SENTIMENT_CONFIG": self.config_path})
+        
+        self.assertEqual(config.max_length, 128)
+    
+    def test_arguments_prioritaires(self):
+        config = InferenceConfig(batch_size=32).replace(batch_size=4, max_length=None)
+        
+        self.assertEqual(config.batch_size, 4)
+        self.assertEqual(config.max_length, 512)
+    
+    def test_valeurs_invalides(self):
+        with self.assertRaises(ValueError):
+            InferenceConfig.from_dict({"threads": 4})
+        with self.assertRaises(ValueError):
+            InferenceConfig.load(path=self.config_path, environ={"MARKET_SENTIMENT_COMPILE": "peut-être"})
+        with self.assertRaises(ValueError):
+            InferenceConfig.load(path=self.config_path, environ={"MARKET_SENTIMENT_INTRA_OP_THREADS": "0"})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# tests/unit/test_inference_pool.py
+
+import unittest
+import os
+import tempfile
+
+from app.inference_pool import InferenceWorkerPool
+from domain.entities.article import Article
+from domain.services.deterministic_analyzer import DeterministicSentimentAnalyzer
+from infrastructure.database.inference_cache import InferenceCache
+
+
+class CacheableAnalyzer(DeterministicSentimentAnalyzer):
+    """Backend déterministe avec un model_id : ses résultats passent par le cache du parent."""
+    model_id = "deterministic-test"
+
+
+class CacheOnlyAnalyzer(CacheableAnalyzer):
+    """Échoue si un texte lui parvient : tout doit venir du cache."""
+    
+    def analyze_texts(self, texts, verbose=False):
+        if texts:
+            raise AssertionError(f"{len(texts)} textes envoyés au worker malgré le cache")
+        return []
+
+
+def _articles():
+    return [
+        Article(
+            title=f"Article {i}",
+            content=f"Contenu {i}" if i % 5 else "",
+            company="Tesla" if i % 2 else "Apple",
+            source="Test",
+            url=f"http://test.com/{i}"
+        )
+        for i in range(12)
+    ]
+
+
+class TestInferenceWorkerPool(unittest.TestCase):
+    """Tests du pool de workers (backend déterministe, cache dans le parent)."""
+    
+    def setUp(self):
+        self.temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
+        self.temp_db.close()
+        self.cache = InferenceCache(db_name=self.temp_db.name)
+    
+    def tearDown(self):
+        if os.path.exists(self.temp_db.name):
+            try:
+                os.unlink(self.temp_db.name)
+            except PermissionError:
+                pass
+    
+    def test_articles_recus_annotes(self):
+        """Test : Les articles passés au pool sont annotés et renvoyés dans l'ordre."""
+        articles = _articles()
+        expected = CacheableAnalyzer().analyze_batch(_articles())
+        
+        with InferenceWorkerPool(2, 1, shard_size=5, analyzer_factory=CacheableAnalyzer) as pool:
+            results = pool.analyze_batch(articles)
+        
+        self.assertEqual(len(results), len(articles))
+        for result, article, reference in zip(results, articles, expected):
+            self.assertIs(result, article)
+            self.assertEqual(article.sentiment_label, reference.sentiment_label)
+            self.assertAlmostEqual(article.sentiment_score, reference.sentiment_score)
+    
+    def test_cache_tenu_par_le_parent(self):
+        """Test : Un second passage est servi par le cache, sans texte envoyé aux workers."""
+        with InferenceWorkerPool(
+            2, 1, shard_size=5, analyzer_factory=CacheableAnalyzer, cache=self.cache
+        ) as pool:
+            first = [article.sentiment_score for article in pool.analyze_batch(_articles())]
+        
+        with InferenceWorkerPool(
+            2, 1, shard_size=5, analyzer_factory=CacheOnlyAnalyzer, cache=self.cache
+        ) as pool:
+            second = [article.sentiment_score for article in pool.analyze_batch(_articles())]
+        
+        self.assertEqual(first, second)
+    
+    def test_cache_ignore_sans_model_id(self):
+        """Test : Un analyseur sans model_id n'utilise pas le cache."""
+        with InferenceWorkerPool(
+            1, 1, analyzer_factory=DeterministicSentimentAnalyzer, cache=self.cache
+        ) as pool:
+            self.assertIsNone(pool.cache)
+            pool.analyze_batch(_articles())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+# tests/unit/test_inference_server.py
+
+import threading
+import time
+import unittest
+
+from app.inference_client import RemoteSentimentAnalyzer
+from app.inference_server import MicroBatcher, SentimentInferenceServer
+from domain.entities.article import Article
+from domain.entities.sentiment import SentimentResult
+
+
+class FakeAnalyzer:
+    """Analyseur factice : 'up' → positif, sinon neutre. Enregistre les appels."""
+    
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self.delay = delay
+    
+    def analyze_texts(self, texts, verbose=False):
+        self.calls.append(list(texts))
+        time.sleep(self.delay)
+        return [
+            SentimentResult("positif", 0.9, {"positif": 0.9, "neutre": 0.1, "négatif": 0.0})
+            if "up" in text else
+            SentimentResult("neutre", 0.8, {"positif": 0.1, "neutre": 0.8, "négatif": 0.1})
+            for text in texts
+        ]
+
+
+class TestMicroBatcher(unittest.TestCase):
+    """Tests du regroupement des requêtes en micro-lots."""
+    
+    def test_requetes_concurrentes_regroupees(self):
+        """Test : Des requêtes simultanées partent dans un seul appel au modèle."""
+        analyzer = FakeAnalyzer()
+        batcher = MicroBatcher(analyzer, max_batch_size=64, max_wait=0.2)
+        self.addCleanup(batcher.stop)
+        
+        results = {}
+        def worker(i):
+            results[i] = batcher.submit([f"text {i} up" if i % 2 else f"text {i}"])
+        
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertLess(len(analyzer.calls), 6)
+        self.assertEqual(sum(len(call) for call in analyzer.calls), 6)
+        for i, result in results.items():
+            self.assertEqual(result[0].label, "positif" if i % 2 else "neutre")
+    
+    def test_taille_max_respectee(self):
+        """Test : Un micro-lot ne dépasse pas max_batch_size textes."""
+        analyzer = FakeAnalyzer(delay=0.05)
+        batcher = MicroBatcher(analyzer, max_batch_size=4, max_wait=0.1)
+        self.addCleanup(batcher.stop)
+        
+        threads = [threading.Thread(target=batcher.submit, args=(["a", "b"],)) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        self.assertTrue(all(len(call) <= 4 for call in analyzer.calls))
+
+
+class TestInferenceServer(unittest.TestCase):
+    """Test aller-retour client HTTP ↔ serveur."""
+    
+    def setUp(self):
+        self.server = SentimentInferenceServer(FakeAnalyzer(), port=0, max_wait=0.01)
+        self.server.start_in_background()
+        self.addCleanup(self.server.shutdown)
+        self.client = RemoteSentimentAnalyzer(self.server.url)
+    
+    def test_analyze_batch(self):
+        """Test : Le client enrichit les articles comme l'analyseur local."""
+        articles = [
+            Article(title="Stock up", content="Profits", company="Tesla", source="CNBC"),
+            Article(title="Report", content="Facts", company="Apple", source="CNBC"),
+        ]
+        
+        self.assertTrue(self.client.is_available())
+        self.client.analyze_batch(articles)
+        
+        self.assertEqual(articles[0].sentiment_label, "positif")
+        self.assertEqual(articles[1].sentiment_label, "neutre")
+        self.assertAlmostEqual(articles[1].sentiment_probas["neutre"], 0.8)
+
+
+if __name__ == '__main__':
+    unittest.main()
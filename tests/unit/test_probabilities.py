@@ -0,0 +1,56 @@
+# tests/unit/test_probabilities.py
+
+import json
+import unittest
+
+import numpy as np
+
+from domain.entities.probabilities import LABELS, ProbabilityView, probability_matrix, probability_views
+from domain.entities.sentiment import SentimentResult
+from domain.entities.article import Article
+
+
+class TestProbabilityView(unittest.TestCase):
+    """Tests des vues de probabilités sur une matrice (n, 3)."""
+    
+    def setUp(self):
+        self.matrix = np.array([[0.1, 0.2, 0.7], [0.6, 0.3, 0.1]], dtype=np.float32)
+        self.views = probability_views(self.matrix)
+    
+    def test_lecture_comme_un_dict(self):
+        view = self.views[0]
+        
+        self.assertEqual(list(view), list(LABELS))
+        self.assertAlmostEqual(view["positif"], 0.7, places=6)
+        self.assertAlmostEqual(view.get("négatif"), 0.1, places=6)
+        self.assertIsNone(view.get("inconnu"))
+        with self.assertRaises(KeyError):
+            view["inconnu"]
+    
+    def test_vue_sans_copie(self):
+        """La vue lit la matrice : pas de dictionnaire construit par article."""
+        self.matrix[1, 0] = 0.5
+        self.assertAlmostEqual(self.views[1]["négatif"], 0.5)
+    
+    def test_serialisation_json(self):
+        result = SentimentResult(label="positif", score=0.7, probabilities=self.views[0])
+        article = Article("Titre", "Contenu", "Tesla", "CNBC").apply_sentiment(result)
+        
+        payload = json.loads(json.dumps(article.to_dict()))
+        self.assertAlmostEqual(payload["sentiment_probas"]["positif"], 0.7, places=6)
+        self.assertEqual(json.loads(json.dumps(result.to_dict()))["probabilities"], dict(self.views[0]))
+    
+    def test_matrice_depuis_vues_et_dicts(self):
+        """Vues et dictionnaires (lus en base) donnent la même matrice."""
+        mixed = [self.views[0], {"négatif": 0.6, "neutre": 0.3, "positif": 0.1}, {"positif": 1.0}, {}]
+        
+        matrix = probability_matrix(mixed)
+        
+        self.assertEqual(matrix.dtype, np.float32)
+        np.testing.assert_allclose(matrix[:2], self.matrix)
+        np.testing.assert_allclose(matrix[2:], [[0.0, 0.0, 1.0], [0.0, 0.0, 0.0]])
+        self.assertEqual(probability_matrix([]).shape, (0, 3))
+
+
+if __name__ == '__main__':
+    unittest.main()
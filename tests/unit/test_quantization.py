@@ -0,0 +1,59 @@
+# tests/unit/test_quantization.py
+
+import time
+import unittest
+
+from tests.unit.test_sentiment_analyzer import CAS_DE_REFERENCE, make_analyzer
+
+
+class TestQuantizationInt8(unittest.TestCase):
+    """
+    Comparaison fp32 / int8 sur les cas de référence.
+    
+    Vérifie que la quantification ne change pas les labels et affiche le
+    gain de latence.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """Charge les deux variantes du modèle une seule fois."""
+        print("\n[INFO] Chargement des modèles fp32 et int8...")
+        cls.fp32 = make_analyzer()
+        cls.int8 = make_analyzer(quantize=True)
+        cls.texts = [text for text, _ in CAS_DE_REFERENCE]
+    
+    @staticmethod
+    def _timed(analyzer, texts, repeats=3):
+        """Analyse les textes et retourne (résultats, meilleur temps)."""
+        best = float("inf")
+        for _ in range(repeats):
+            start = time.perf_counter()
+            results = analyzer.analyze_texts(texts)
+            best = min(best, time.perf_counter() - start)
+        return results, best
+    
+    def test_labels_identiques(self):
+        """Les labels int8 doivent être ceux du modèle fp32 et ceux attendus."""
+        fp32_results, fp32_time = self._timed(self.fp32, self.texts)
+        int8_results, int8_time = self._timed(self.int8, self.texts)
+        
+        print(f"\nLatence fp32 : {fp32_time * 1000:.1f} ms | int8 : {int8_time * 1000:.1f} ms "
+              f"(x{fp32_time / int8_time:.2f})")
+        
+        for (text, expected), ref, quant in zip(CAS_DE_REFERENCE, fp32_results, int8_results):
+            print(f"  {ref.label:>8} ({ref.score:.2f}) | {quant.label:>8} ({quant.score:.2f}) | {text[:50]}")
+            self.assertEqual(quant.label, ref.label, f"Désaccord fp32/int8 : {text}")
+            self.assertEqual(quant.label, expected)
+    
+    def test_probabilites_proches(self):
+        """Les probabilités int8 restent proches des probabilités fp32."""
+        fp32_results = self.fp32.analyze_texts(self.texts)
+        int8_results = self.int8.analyze_texts(self.texts)
+        
+        for ref, quant in zip(fp32_results, int8_results):
+            for label, proba in ref.probabilities.items():
+                self.assertAlmostEqual(quant.probabilities[label], proba, delta=0.15)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@
 import unittest
 import os
 import tempfile
+import sqlite3
 import sys
 
 # Ajout d'une sécurité pour les chemins si besoin
@@ -139,6 +140,101 @@ class TestDatabaseRepository(unittest.TestCase):
         for article in tesla_articles:
             self.assertEqual(article["company"], "Tesla")
 
+    def test_fetch_known_articles(self):
+        """Test : Retrouver les articles déjà en base par (link, company)."""
+        self.repo.save_article({
+            "company": "Tesla",
+            "title": "Article connu",
+            "content": "Contenu",
+            "source": "Test",
+            "link": "https://example.com/connu",
+            "sentiment_label": "positif",
+            "sentiment_score": 0.9,
+            "sentiment_probas": {"positif": 0.9, "neutre": 0.05, "négatif": 0.05}
+        })
+
+        known = self.repo.fetch_known_articles([
+            ("https://example.com/connu", "Tesla"),
+            ("https://example.com/connu", "Apple"),   # Même lien, autre entreprise
+            ("https://example.com/nouveau", "Tesla"),
+            (None, "Tesla")
+        ])
+
+        self.assertEqual(list(known), [("https://example.com/connu", "Tesla")])
+        article = known[("https://example.com/connu", "Tesla")]
+        self.assertEqual(article["sentiment_label"], "positif")
+        self.assertEqual(article["sentiment_probas"]["positif"], 0.9)
+
+    def test_sentiment_tier_persiste(self):
+        """Test : L'étage de la cascade est stocké avec l'article."""
+        self.repo.save_article({
+            "company": "Tesla",
+            "title": "Tesla record profits",
+            "content": "Revenue surges.",
+            "source": "Test",
+            "link": "https://example.com/tier",
+            "sentiment_label": "positif",
+            "sentiment_score": 0.9,
+            "sentiment_tier": "lexique"
+        })
+
+        articles = self.repo.fetch_all_articles()
+        self.assertEqual(articles[0]["sentiment_tier"], "lexique")
+
+    def test_cluster_id_persiste(self):
+        """Test : Le groupe de quasi-doublons est stocké avec l'article."""
+        for company in ("Tesla", "Apple"):
+            self.repo.save_article({
+                "company": company,
+                "title": "Markets rally",
+                "content": "Stocks rose broadly.",
+                "source": "Reuters",
+                "link": "https://example.com/depeche",
+                "cluster_id": "00ff00ff00ff00ff"
+            })
+
+        articles = self.repo.fetch_all_articles()
+        self.assertEqual(len(articles), 2)
+        self.assertEqual({a["cluster_id"] for a in articles}, {"00ff00ff00ff00ff"})
+
+    def test_colonnes_lues_par_nom(self):
+        """Test : Une base migrée (colonnes dans un autre ordre) est relue correctement."""
+        os.unlink(self.temp_db.name)
+        with sqlite3.connect(self.temp_db.name) as conn:
+            conn.execute("""
+                CREATE TABLE articles (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    company TEXT NOT NULL,
+                    title TEXT NOT NULL,
+                    source TEXT,
+                    link TEXT,
+                    summary TEXT,
+                    full_text TEXT,
+                    published_date TEXT,
+                    sentiment_label TEXT,
+                    sentiment_score REAL,
+                    sentiment_probas TEXT,
+                    cluster_id TEXT,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    UNIQUE(link, company)
+                )
+            """)
+        repo = DatabaseRepository(db_name=self.temp_db.name)
+
+        repo.save_article({
+            "company": "Tesla",
+            "title": "Tesla record profits",
+            "link": "https://example.com/migration",
+            "sentiment_label": "positif",
+            "sentiment_tier": "lexique",
+            "cluster_id": "00ff00ff00ff00ff"
+        })
+
+        article = repo.fetch_all_articles()[0]
+        self.assertEqual(article["company"], "Tesla")
+        self.assertEqual(article["sentiment_tier"], "lexique")
+        self.assertEqual(article["cluster_id"], "00ff00ff00ff00ff")
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -7,14 +7,14 @@ if project_root not in sys.path:
     sys.path.append(project_root)
     # Ajoute la racine du projet pour les imports.
 
-from domain.services.sentiment_analyzer import FinBERTSentimentAnalyzer
+from tests.unit.test_sentiment_analyzer import make_analyzer
 from domain.entities.article import Article
 
 def test_sarcasm():
     print("--- TEST DE DÉTECTION DE SARCASME ---")
     
     try:
-        analyzer = FinBERTSentimentAnalyzer()
+        analyzer = make_analyzer()
     except Exception as e:
         print(f"Erreur init : {e}")
         return
@@ -1,9 +1,31 @@
 # tests/unit/test_sentiment_analyzer.py
 
 import unittest
+import importlib.util
 from domain.services.sentiment_analyzer import FinBERTSentimentAnalyzer
+from domain.services.inference_config import InferenceConfig
 from domain.entities.article import Article
 
+# Phrases de référence (texte, label attendu), réutilisées par test_quantization.py
+CAS_DE_REFERENCE = [
+    ("Tesla profits are skyrocketing, amazing earnings report! Best year ever.", "positif"),
+    ("Apple is facing bankruptcy, huge losses. Disaster.", "négatif"),
+    ("Apple creates smartphones. The headquarters are in California.", "neutre"),
+    ("Record profits for Tesla. The company exceeded all expectations with stellar Q4 results.", "positif"),
+]
+
+# Réglages explicites : les tests ne lisent ni data/inference_config.json
+# ni data/batch_tuning.json, et n'écrivent pas dans data/inference_cache.db
+TEST_CONFIG = InferenceConfig(batch_size=16)
+
+
+def make_analyzer(**kwargs) -> FinBERTSentimentAnalyzer:
+    """FinBERT sans cache ni fichier de réglages (réutilisé par les autres tests)."""
+    kwargs.setdefault("config", TEST_CONFIG)
+    kwargs.setdefault("max_tokens_per_batch", FinBERTSentimentAnalyzer.DEFAULT_MAX_TOKENS_PER_BATCH)
+    return FinBERTSentimentAnalyzer(**kwargs)
+
+
 class TestSentimentAnalyzer(unittest.TestCase):
     """Tests unitaires du service d'analyse de sentiment."""
     
@@ -11,7 +33,7 @@ class TestSentimentAnalyzer(unittest.TestCase):
     def setUpClass(cls):
         """Charge le modèle une seule fois pour tous les tests."""
         print("\n[INFO] Chargement du modèle FinBERT...")
-        cls.analyzer = FinBERTSentimentAnalyzer()
+        cls.analyzer = make_analyzer()
     
     def test_phrase_positive(self):
         """Une phrase clairement positive doit être détectée."""
@@ -55,6 +77,137 @@ class TestSentimentAnalyzer(unittest.TestCase):
         self.assertIsNotNone(analyzed.sentiment_label)
         self.assertIsNotNone(analyzed.sentiment_score)
         self.assertIn(analyzed.sentiment_label, ["positif", "neutre", "négatif"])
+    
+    def test_batch_coherent_avec_analyse_unitaire(self):
+        """L'analyse par lots doit donner les mêmes labels que l'analyse texte par texte."""
+        articles = [
+            Article(title="Record profits for Tesla", content="Best year ever.", company="TSLA", source="CNBC"),
+            Article(title="Apple is facing bankruptcy", content="Huge losses.", company="AAPL", source="CNBC"),
+            Article(title="Apple creates smartphones", content="The headquarters are in California.", company="AAPL", source="CNBC"),
+        ]
+        expected = [self.analyzer.analyze_text(a.get_text_for_analysis()) for a in articles]
+        
+        self.analyzer.analyze_batch(articles)
+        
+        for article, result in zip(articles, expected):
+            self.assertEqual(article.sentiment_label, result.label)
+            self.assertAlmostEqual(article.sentiment_score, result.score, places=4)
+
+
+@unittest.skipUnless(importlib.util.find_spec("onnxruntime"), "onnxruntime non installé")
+class TestBackendOnnx(unittest.TestCase):
+    """Le backend ONNX Runtime doit reproduire les résultats du backend torch."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.torch_analyzer = make_analyzer()
+        cls.onnx_analyzer = make_analyzer(backend="onnx")
+    
+    def test_memes_resultats(self):
+        texts = [text for text, _ in CAS_DE_REFERENCE]
+        
+        for ref, onnx in zip(self.torch_analyzer.analyze_texts(texts),
+                             self.onnx_analyzer.analyze_texts(texts)):
+            self.assertEqual(onnx.label, ref.label)
+            for label, proba in ref.probabilities.items():
+                self.assertAlmostEqual(onnx.probabilities[label], proba, places=3)
+
+
+class TestTroncature(unittest.TestCase):
+    """Stratégies de troncature des textes longs."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.long_text = "Start of the story. " + "Filler sentence about markets. " * 300 + "Final verdict."
+    
+    def test_head_tail_garde_debut_et_fin(self):
+        analyzer = make_analyzer(truncation="head_tail", max_length=128)
+        ids = analyzer._encode([self.long_text])[0]
+        full = analyzer.tokenizer(self.long_text, verbose=False)["input_ids"]
+        
+        self.assertEqual(len(ids), 128)
+        self.assertEqual(ids[:32], full[:32])    # [CLS] + début
+        self.assertEqual(ids[32:], full[-96:])   # fin + [SEP]
+    
+    def test_titre_seul(self):
+        analyzer = make_analyzer(truncation="title", max_length=128)
+        article = Article(
+            title="Tesla profits are skyrocketing",
+            content=self.long_text,
+            company="Tesla",
+            source="Test",
+            url="http://test.com"
+        )
+        
+        self.assertEqual(analyzer._article_text(article), "Tesla profits are skyrocketing")
+        self.assertEqual(analyzer.analyze_article(article).sentiment_label, "positif")
+    
+    def test_cle_de_cache_distincte(self):
+        self.assertNotEqual(
+            make_analyzer(max_length=128).model_id,
+            make_analyzer().model_id
+        )
+    
+    def test_parametres_invalides(self):
+        with self.assertRaises(ValueError):
+            make_analyzer(truncation="middle")
+        with self.assertRaises(ValueError):
+            make_analyzer(max_length=1024)
+
+
+class TestEmbeddings(unittest.TestCase):
+    """Embeddings joints aux résultats (option return_embeddings)."""
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.analyzer = make_analyzer(return_embeddings=True)
+    
+    def test_embedding_par_texte(self):
+        results = self.analyzer.analyze_texts([texte for texte, _ in CAS_DE_REFERENCE])
+        
+        for result, (_, label) in zip(results, CAS_DE_REFERENCE):
+            self.assertEqual(result.label, label)
+            self.assertEqual(result.embedding.shape, (768,))
+            self.assertNotIn("embedding", result.to_dict())
+    
+    def test_embedding_independant_du_lot(self):
+        texte = CAS_DE_REFERENCE[0][0]
+        seul = self.analyzer.analyze_text(texte).embedding
+        en_lot = self.analyzer.analyze_texts([texte, CAS_DE_REFERENCE[1][0]])[0].embedding
+        
+        self.assertTrue((abs(seul - en_lot) < 1e-3).all())
+    
+    def test_backend_onnx_refuse(self):
+        with self.assertRaises(ValueError):
+            make_analyzer(backend="onnx", return_embeddings=True)
+
+
+class TestPlanificationLots(unittest.TestCase):
+    """Tests de la planification des lots par budget de tokens (sans modèle)."""
+    
+    def test_budget_respecte(self):
+        """Aucun lot ne dépasse le budget (nb_textes × plus long texte)."""
+        lengths = [512, 12, 40, 512, 30, 300, 8, 25]
+        batches = FinBERTSentimentAnalyzer._plan_batches(lengths, 1024, 16)
+        
+        for batch in batches:
+            self.assertLessEqual(len(batch) * max(lengths[i] for i in batch), 1024)
+        
+        # Chaque texte apparaît exactement une fois
+        self.assertEqual(sorted(i for b in batches for i in b), list(range(len(lengths))))
+    
+    def test_textes_courts_regroupes(self):
+        """Les textes courts sont regroupés entre eux, pas avec les longs."""
+        lengths = [512, 10, 512, 10, 10]
+        batches = FinBERTSentimentAnalyzer._plan_batches(lengths, 1024, 16)
+        
+        self.assertIn([1, 3, 4], batches)
+        self.assertIn([0, 2], batches)
+    
+    def test_taille_max_de_lot(self):
+        """Le nombre de textes par lot reste plafonné par max_batch_size."""
+        batches = FinBERTSentimentAnalyzer._plan_batches([5] * 10, 8192, 4)
+        self.assertEqual([len(b) for b in batches], [4, 4, 2])
 
 
 if __name__ == '__main__':
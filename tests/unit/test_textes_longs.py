@@ -8,14 +8,14 @@ if project_root not in sys.path:
     sys.path.append(project_root)
     # Ajoute la racine du projet pour les imports.
 
-from domain.services.sentiment_analyzer import FinBERTSentimentAnalyzer
+from tests.unit.test_sentiment_analyzer import make_analyzer
 from domain.entities.article import Article
 
 def test_long_text():
     print("--- DÉBUT DU TEST DE PERFORMANCE ---")
     
     try:
-        analyzer = FinBERTSentimentAnalyzer()
+        analyzer = make_analyzer()
         print("Modèle chargé.")
     except Exception as e:
         print(f"Erreur init : {e}")
@@ -54,5 +54,36 @@ def test_long_text():
     except Exception as e:
         print(f"Erreur pendant l'analyse : {e}")
 
+def test_long_text_fenetres_glissantes():
+    print("--- TEST DU MODE FENÊTRES GLISSANTES ---")
+    
+    analyzer = make_analyzer(long_document=True, window_overlap=64)
+    
+    # Un texte long (plusieurs fenêtres) encadré de deux textes courts
+    long_text = "Les résultats trimestriels dépassent les attentes des analystes. " * 200
+    texts = ["Le titre recule.", long_text, "Le bénéfice progresse."]
+    
+    windows = analyzer._encode_windows(texts)
+    owners = list(windows["overflow_to_sample_mapping"])
+    print(f"{len(owners)} fenêtres pour {len(texts)} textes")
+    assert owners.count(1) > 1, "Le texte long doit être découpé en plusieurs fenêtres"
+    assert all(len(ids) <= analyzer.MAX_LENGTH for ids in windows["input_ids"])
+    
+    # Toutes les fenêtres passent par le chemin par lots : un résultat par texte
+    start = time.time()
+    results = analyzer.analyze_texts(texts)
+    print(f"Temps : {time.time() - start:.4f}s")
+    
+    assert len(results) == len(texts)
+    for result in results:
+        assert abs(sum(result.probabilities.values()) - 1.0) < 1e-4
+    
+    # Les textes courts tiennent dans une fenêtre : même résultat qu'en troncature
+    truncated = make_analyzer().analyze_texts([texts[0], texts[2]])
+    assert abs(results[0].score - truncated[0].score) < 1e-4
+    assert abs(results[2].score - truncated[1].score) < 1e-4
+    print("SUCCÈS")
+
 if __name__ == "__main__":
     test_long_text()
+    test_long_text_fenetres_glissantes()
@@ -0,0 +1,70 @@
+# tests/unit/test_trend_history.py
+
+import json
+import os
+import tempfile
+import unittest
+
+from infrastructure.database.trend_history import TrendHistoryRepository
+
+
+class TestTrendHistoryRepository(unittest.TestCase):
+    """Tests de l'historique des tendances (SQLite indexé)."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmp_dir.name, "trend_history.db")
+        self.repository = TrendHistoryRepository(db_name=self.db_path, legacy_json=None)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_ajout_et_relecture(self):
+        self.repository.append("2026-01-10 08:00:00", {"Apple": 0.5, "Tesla": -0.2})
+        self.repository.append("2026-01-10 09:00:00", {"Apple": 0.1})
+
+        history = TrendHistoryRepository(db_name=self.db_path, legacy_json=None).fetch_history()
+        self.assertEqual(history, [
+            {"timestamp": "2026-01-10 08:00:00", "scores": {"Apple": 0.5, "Tesla": -0.2}},
+            {"timestamp": "2026-01-10 09:00:00", "scores": {"Apple": 0.1}},
+        ])
+
+    def test_lecture_par_periode(self):
+        for day in ("2026-01-10", "2026-01-11", "2026-01-12"):
+            self.repository.append(f"{day} 12:00:00", {"Apple": 0.3})
+
+        history = self.repository.fetch_history(since="2026-01-11")
+        self.assertEqual([entry["timestamp"] for entry in history], ["2026-01-11 12:00:00", "2026-01-12 12:00:00"])
+
+        history = self.repository.fetch_history("2026-01-11", "2026-01-11 23:59:59")
+        self.assertEqual([entry["timestamp"] for entry in history], ["2026-01-11 12:00:00"])
+
+    def test_filtre_par_entreprise(self):
+        self.repository.append("2026-01-10 08:00:00", {"Apple": 0.5, "Tesla": -0.2})
+        self.repository.append("2026-01-10 09:00:00", {"Tesla": 0.4})
+
+        history = self.repository.fetch_history(companies=["Apple"])
+        # Les cycles sans score pour les entreprises demandées sont omis
+        self.assertEqual(history, [{"timestamp": "2026-01-10 08:00:00", "scores": {"Apple": 0.5}}])
+        self.assertEqual(self.repository.fetch_history(companies=[]), [])
+
+    def test_import_ancien_json_une_seule_fois(self):
+        legacy_path = os.path.join(self.tmp_dir.name, "trend_history.json")
+        with open(legacy_path, "w", encoding="utf-8") as f:
+            json.dump([
+                {"timestamp": "2026-01-01 10:00:00", "scores": {"Apple": 0.2}},
+                {"timestamp": "2026-01-02 10:00:00", "scores": {"Apple": 0.4, "Tesla": -0.1}},
+            ], f)
+
+        TrendHistoryRepository(db_name=self.db_path, legacy_json=legacy_path)
+        repository = TrendHistoryRepository(db_name=self.db_path, legacy_json=legacy_path)
+
+        self.assertEqual(repository.import_legacy_json(legacy_path), 0)
+        history = repository.fetch_history()
+        self.assertEqual(len(history), 2)
+        self.assertEqual(history[1]["scores"], {"Apple": 0.4, "Tesla": -0.1})
+        self.assertTrue(os.path.exists(legacy_path))
+
+
+if __name__ == '__main__':
+    unittest.main()